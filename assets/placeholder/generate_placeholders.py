@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 """
-Generate placeholder sprite assets for the game
+Generate placeholder sprite assets for the game and pack them into an atlas
 """
 
 import pygame
 import os
+import sys
 
 def create_placeholder_sprites():
     """Generate placeholder sprite images"""
@@ -23,18 +24,24 @@ def create_placeholder_sprites():
     pygame.image.save(slime_surface, "slime.png")
 
     # Projectile sprite (8x8 yellow circle)
-    projectile_surface = pygame.Surface((8, 8))
-    projectile_surface.fill((0, 0, 0))  # Transparent background
-    projectile_surface.set_colorkey((0, 0, 0))
+    projectile_surface = pygame.Surface((8, 8), pygame.SRCALPHA)  # Transparent background
     pygame.draw.circle(projectile_surface, (255, 255, 0), (4, 4), 4)
     pygame.image.save(projectile_surface, "projectile.png")
 
     print("Placeholder sprites created: player.png, slime.png, projectile.png")
 
 if __name__ == "__main__":
-    # Change to the placeholder directory
+    # Sprites go to assets/sprites, the packed atlas to assets/atlas
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(script_dir)
+    project_root = os.path.dirname(os.path.dirname(script_dir))
+    sprite_dir = os.path.join(project_root, "assets", "sprites")
+    os.makedirs(sprite_dir, exist_ok=True)
+    os.chdir(sprite_dir)
 
     create_placeholder_sprites()
-    pygame.quit()
\ No newline at end of file
+
+    sys.path.insert(0, project_root)
+    from engine.assets import pack_atlases
+    pack_atlases(sprite_dir, os.path.join(project_root, "assets", "atlas"))
+    print("Atlas packed: assets/atlas/sprites.json")
+    pygame.quit()
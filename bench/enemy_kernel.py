@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Per-tick enemy update cost: Enemy objects vs the EnemyStore array path
+
+Run from the project root:
+    python -m bench.enemy_kernel [--counts 10 100 1000 5000] [--ticks 120]
+"""
+
+import argparse
+import random
+import time
+import pygame
+from engine.enemy import Enemy
+from engine.enemy_store import EnemyStore
+from engine.player import Player
+
+SCREEN_RECT = pygame.Rect(0, 0, 1024, 768)
+SLIME = {
+    "health": 50,
+    "speed": 80,
+    "damage": 20,
+    "size": 24,
+    "color": [100, 255, 100],
+    "coins": 5,
+    "chase_range": 300,
+    "attack_cooldown": 1.5
+}
+
+def _spawn_positions(count: int, seed: int) -> list:
+    rng = random.Random(seed)
+    return [(rng.uniform(20, SCREEN_RECT.width - 50), rng.uniform(20, SCREEN_RECT.height - 50))
+            for _ in range(count)]
+
+def time_object_path(count: int, ticks: int, dt: float) -> float:
+    """Average seconds per tick calling Enemy.update on every enemy"""
+    random.seed(count)
+    player = Player(SCREEN_RECT.centerx - 16, SCREEN_RECT.centery - 16, {})
+    enemies = [Enemy(x, y, dict(SLIME)) for x, y in _spawn_positions(count, count)]
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        for enemy in enemies:
+            enemy.update(dt, player, SCREEN_RECT)
+    return (time.perf_counter() - start) / ticks
+
+def time_array_path(count: int, ticks: int, dt: float) -> float:
+    """Average seconds per tick for one EnemyStore.step"""
+    random.seed(count)
+    player = Player(SCREEN_RECT.centerx - 16, SCREEN_RECT.centery - 16, {})
+    store = EnemyStore(capacity=count)
+    for x, y in _spawn_positions(count, count):
+        store.spawn(x, y, dict(SLIME), "slime")
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        store.step(dt, player, SCREEN_RECT)
+    return (time.perf_counter() - start) / ticks
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark enemy simulation paths")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10, 100, 1000, 5000, 20000])
+    parser.add_argument("--ticks", type=int, default=120)
+    args = parser.parse_args()
+
+    dt = 1.0 / 60.0
+    print(f"{'enemies':>8} {'object ms/tick':>15} {'array ms/tick':>14} {'speedup':>8}")
+    for count in args.counts:
+        object_time = time_object_path(count, args.ticks, dt)
+        array_time = time_array_path(count, args.ticks, dt)
+        speedup = object_time / array_time if array_time > 0 else float("inf")
+        print(f"{count:>8} {object_time * 1000:>15.3f} {array_time * 1000:>14.3f} {speedup:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
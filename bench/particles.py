@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Particle cost: per-tick update and render time by live particle count
+
+Run from the project root:
+    python -m bench.particles [--counts 1000 5000 20000] [--ticks 120]
+"""
+
+import argparse
+import time
+import numpy as np
+import pygame
+from headless import init_headless_pygame
+from engine.data_registry import default_registry
+from engine.particles import ParticleSystem, DEFAULT_PARTICLES
+from engine.sprite_batch import SpriteBatchRenderer
+
+SCREEN_SIZE = (1024, 768)
+DT = 1.0 / 60.0
+
+def filled_system(count: int, config: dict) -> ParticleSystem:
+    """A system holding count particles from the configured emitters, with budget and caps raised to fit"""
+    emitters = {name: dict(settings, cap=count, life=[1e6, 1e6]) for name, settings in config["emitters"].items()}
+    particles = ParticleSystem(dict(config, budget=count, emitters=emitters), seed=1234)
+    rng = np.random.default_rng(1234)
+    colors = [(100, 255, 100), (255, 120, 80), (120, 160, 255)]
+    names = list(particles.emitters)
+    burst = 0
+    while particles.count < count:
+        x, y = rng.uniform(0, SCREEN_SIZE[0]), rng.uniform(0, SCREEN_SIZE[1])
+        if not particles.emit(names[burst % len(names)], x, y, colors[burst % len(colors)]):
+            break
+        burst += 1
+
+    # Nothing expires during the timing, but the fade levels are spread as in a real mix of
+    # fresh and dying particles
+    n = particles.count
+    particles.lifetime[:n] = particles.life[:n] / rng.uniform(0.05, 1.0, n)
+    return particles
+
+def time_ticks(particles: ParticleSystem, screen: pygame.Surface, renderer: SpriteBatchRenderer,
+               ticks: int) -> tuple:
+    """Average seconds per tick spent in update() and in drawing"""
+    update = 0.0
+    render = 0.0
+    for _ in range(ticks):
+        start = time.perf_counter()
+        particles.update(DT)
+        middle = time.perf_counter()
+        screen.fill((32, 32, 64))
+        renderer.render_particles(screen, particles, 0.5)
+        render += time.perf_counter() - middle
+        update += middle - start
+    return update / ticks, render / ticks
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the particle system")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 5000, 20000],
+                        help="live particle counts to time")
+    parser.add_argument("--ticks", type=int, default=120, help="ticks timed per count")
+    args = parser.parse_args()
+
+    init_headless_pygame()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    config = dict(DEFAULT_PARTICLES, **default_registry().tuning.get("particles", {}))
+    renderer = SpriteBatchRenderer()
+
+    print(f"{'particles':>9} {'update ms':>10} {'render ms':>10} {'ns/particle':>12}")
+    for count in args.counts:
+        particles = filled_system(count, config)
+        update, render = time_ticks(particles, screen, renderer, args.ticks)
+        print(f"{particles.count:>9} {update * 1000:>10.3f} {render * 1000:>10.3f} "
+              f"{(update + render) / max(1, particles.count) * 1e9:>12.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Flow-field cost: rebuild time by grid size, and per-tick steering lookups by enemy count
+
+Run from the project root:
+    python -m bench.pathing [--cell-sizes 32 16 8 4] [--counts 1000 10000 50000] [--rebuilds 50]
+"""
+
+import argparse
+import random
+import time
+import numpy as np
+from engine.data_registry import default_registry
+from engine.flow_field import FlowField
+
+ARENA_SIZE = (1024, 768)
+
+def time_rebuild(field: FlowField, rebuilds: int, rng: random.Random) -> float:
+    """Average seconds per rebuild, retargeting at random open cells"""
+    open_cells = np.argwhere(~field.blocked)
+    total = 0.0
+    for _ in range(rebuilds):
+        row, col = open_cells[rng.randrange(len(open_cells))]
+        start = time.perf_counter()
+        field.update((col + 0.5) * field.cell_size, (row + 0.5) * field.cell_size)
+        total += time.perf_counter() - start
+    return total / rebuilds
+
+def time_lookup(field: FlowField, count: int, ticks: int, rng: random.Random) -> float:
+    """Average seconds per tick to look up a steering direction for every enemy"""
+    x = np.array([rng.uniform(0, ARENA_SIZE[0]) for _ in range(count)])
+    y = np.array([rng.uniform(0, ARENA_SIZE[1]) for _ in range(count)])
+    start = time.perf_counter()
+    for _ in range(ticks):
+        field.directions(x, y)
+    return (time.perf_counter() - start) / ticks
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark flow-field pathing")
+    parser.add_argument("--cell-sizes", type=int, nargs="+", default=[32, 16, 8, 4],
+                        help="grid cell sizes to build the arena at (smaller = bigger grid)")
+    parser.add_argument("--counts", type=int, nargs="+", default=[1000, 10000, 50000],
+                        help="enemy counts for the lookup timing")
+    parser.add_argument("--rebuilds", type=int, default=50, help="rebuilds timed per grid")
+    parser.add_argument("--ticks", type=int, default=120, help="ticks timed per lookup count")
+    args = parser.parse_args()
+
+    arena = default_registry().arena
+    rng = random.Random(1234)
+
+    print(f"{'grid':>9} {'cells':>7} {'rebuild ms':>11}")
+    for cell_size in args.cell_sizes:
+        field = FlowField(*ARENA_SIZE, dict(arena, cell_size=cell_size))
+        rebuild = time_rebuild(field, args.rebuilds, rng)
+        print(f"{field.cols:>4}x{field.rows:<4} {field.cols * field.rows:>7} {rebuild * 1000:>11.3f}")
+
+    field = FlowField(*ARENA_SIZE, arena)
+    field.update(ARENA_SIZE[0] / 2, ARENA_SIZE[1] / 2)
+    print(f"\n{'enemies':>8} {'lookup ms/tick':>15} {'ns/enemy':>9}")
+    for count in args.counts:
+        lookup = time_lookup(field, count, args.ticks, rng)
+        print(f"{count:>8} {lookup * 1000:>15.3f} {lookup / count * 1e9:>9.1f}")
+
+if __name__ == "__main__":
+    main()
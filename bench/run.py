@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: drives ArenaScene through canned scenarios and records per-phase timings
+
+Run from the project root:
+    python -m bench.run [--scenarios wave_1 enemies_2000 ...] [--ticks 300] [--output results.json]
+    python -m bench.run --baseline baseline.json      # flag regressions against a saved run
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+import numpy as np
+import pygame
+from headless import init_headless_pygame
+from engine.input import BotInputProvider
+from engine.profiler import Profiler
+from engine.data_registry import default_registry
+from bench.scenarios import SCENARIOS, Scenario
+
+SCREEN_SIZE = (1024, 768)
+DT = 1.0 / 60.0
+SEED = 1234
+WARMUP_TICKS = 30
+PHASES = ("player_update", "pathing", "wave_update", "enemy_update", "separation", "projectile_update",
+          "collisions", "particles", "world_render", "hud_render", "shop_render", "game_over_render", "flip")
+
+# Differences below this many milliseconds are treated as noise when comparing
+NOISE_FLOOR_MS = 0.05
+
+def _build_scene(scenario: Scenario, screen: pygame.Surface, base_tuning: dict, profiler: Profiler = None):
+    from scenes.arena_scene import ArenaScene
+
+    scene = ArenaScene(screen, BotInputProvider(), verbose=False, seed=SEED,
+                       tuning_data=scenario.apply_tuning(base_tuning), profiler=profiler)
+    scenario.setup(scene)
+    return scene
+
+def _frame(scene, scenario: Scenario, tick: int):
+    profiler = scene.profiler
+    profiler.begin_frame()
+    if scenario.per_tick is not None:
+        scenario.per_tick(scene, tick)
+    scene.update(DT)
+    scene.render()
+    with profiler.scope("flip"):
+        scene.present()
+    profiler.end_frame()
+
+def _summary_ms(samples) -> dict:
+    values = np.asarray(samples) * 1000.0
+    return {
+        "mean": float(values.mean()),
+        "p50": float(np.percentile(values, 50)),
+        "p95": float(np.percentile(values, 95)),
+        "p99": float(np.percentile(values, 99)),
+        "max": float(values.max())
+    }
+
+def run_scenario(scenario: Scenario, ticks: int, base_tuning: dict, measure_memory: bool = True,
+                 trace_path: str = None) -> dict:
+    """Time one scenario and (separately) measure its peak Python allocation"""
+    screen = pygame.display.get_surface()
+    profiler = Profiler(enabled=True, capacity=max(8192, ticks * 32))
+
+    scene = _build_scene(scenario, screen, base_tuning, profiler)
+    for tick in range(WARMUP_TICKS):
+        _frame(scene, scenario, tick)
+
+    frame_times = []
+    ai_updates = []
+    samples = defaultdict(list)
+    for tick in range(WARMUP_TICKS, WARMUP_TICKS + ticks):
+        start = time.perf_counter()
+        _frame(scene, scenario, tick)
+        frame_times.append(time.perf_counter() - start)
+        ai_updates.append(scene.ai.thinks)
+        for name in PHASES:
+            samples[name].append(profiler.last_frame.get(name, 0.0))
+
+    if trace_path:
+        profiler.export_chrome_trace(trace_path)
+
+    result = {
+        "description": scenario.description,
+        "ticks": ticks,
+        "enemies": len(scene.enemies),
+        "projectiles": len(scene.projectiles),
+        "ai_updates_per_tick": float(np.mean(ai_updates)),
+        "frame_ms": _summary_ms(frame_times),
+        "phases_ms": {name: _summary_ms(samples[name]) for name in PHASES}
+    }
+
+    # Allocation tracing slows everything down, so memory gets its own shorter pass
+    if measure_memory:
+        tracemalloc.start()
+        scene = _build_scene(scenario, screen, base_tuning)
+        for tick in range(min(ticks, 120)):
+            _frame(scene, scenario, tick)
+        result["peak_memory_kb"] = tracemalloc.get_traced_memory()[1] / 1024.0
+        tracemalloc.stop()
+
+    return result
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """List (scenario, metric, baseline_ms, current_ms) entries that regressed past threshold"""
+    regressions = []
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+
+        metrics = [(f"frame {key}", previous["frame_ms"][key], current["frame_ms"][key])
+                   for key in ("p50", "p95", "p99")]
+        metrics += [(f"{phase} mean", previous["phases_ms"][phase]["mean"], current["phases_ms"][phase]["mean"])
+                    for phase in PHASES if phase in previous["phases_ms"]]
+
+        for metric, old, new in metrics:
+            if new > old * (1.0 + threshold) and new - old > NOISE_FLOOR_MS:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="RetroRumble benchmark suite")
+    parser.add_argument("--scenarios", nargs="+", choices=sorted(SCENARIOS), default=list(SCENARIOS),
+                        help="scenarios to run (default: all)")
+    parser.add_argument("--ticks", type=int, default=300, help="timed ticks per scenario")
+    parser.add_argument("--output", default="bench_results.json", help="where to write the JSON results")
+    parser.add_argument("--baseline", help="saved results to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="allowed slowdown before flagging (0.10 = 10%%)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the peak-memory pass")
+    parser.add_argument("--trace-dir", help="also write a Chrome trace per scenario into this directory")
+    parser.add_argument("--list", action="store_true", help="list scenarios and exit")
+    args = parser.parse_args()
+
+    if args.list:
+        for scenario in SCENARIOS.values():
+            print(f"{scenario.name:<22} {scenario.description}")
+        return
+
+    init_headless_pygame()
+    pygame.display.set_mode(SCREEN_SIZE)
+
+    base_tuning = default_registry().tuning
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "pygame": pygame.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "ticks": args.ticks,
+            "seed": SEED
+        },
+        "scenarios": {}
+    }
+
+    print(f"{'scenario':<22} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'peak KB':>9} {'AI/tick':>8}")
+    for name in args.scenarios:
+        trace_path = os.path.join(args.trace_dir, f"{name}.trace.json") if args.trace_dir else None
+        result = run_scenario(SCENARIOS[name], args.ticks, base_tuning, not args.no_memory, trace_path)
+        results["scenarios"][name] = result
+        frame = result["frame_ms"]
+        memory = f"{result['peak_memory_kb']:>9.0f}" if "peak_memory_kb" in result else f"{'-':>9}"
+        print(f"{name:<22} {frame['p50']:>8.2f} {frame['p95']:>8.2f} {frame['p99']:>8.2f} {memory} "
+              f"{result['ai_updates_per_tick']:>8.0f}")
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"OK: results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, "r") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.threshold)
+        for name, metric, old, new in regressions:
+            # A phase that took no time in the baseline has no meaningful ratio
+            change = f"+{(new / old - 1) * 100:.0f}%" if old > 0 else f"+{new - old:.3f} ms"
+            print(f"REGRESSION: {name} {metric}: {old:.3f} ms -> {new:.3f} ms ({change})")
+        if regressions:
+            sys.exit(1)
+        print(f"OK: no regressions beyond {args.threshold:.0%} against {args.baseline}")
+
+if __name__ == "__main__":
+    main()
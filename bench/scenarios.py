@@ -0,0 +1,102 @@
+"""
+Canned stress scenarios for the benchmark suite
+"""
+
+import math
+from typing import Callable, Dict, Optional
+
+class Scenario:
+    """One reproducible load on ArenaScene"""
+
+    def __init__(self, name: str, description: str, setup: Callable = None,
+                 per_tick: Optional[Callable] = None, tuning: dict = None):
+        self.name = name
+        self.description = description
+        self.setup = setup or (lambda scene: None)
+        self.per_tick = per_tick  # Called as per_tick(scene, tick) before every update
+        self.tuning = tuning or {}  # Merged into each tuning.json section
+
+    def apply_tuning(self, tuning_data: dict) -> dict:
+        """Copy of tuning_data with this scenario's overrides applied"""
+        merged = {section: dict(values) for section, values in tuning_data.items()}
+        for section, values in self.tuning.items():
+            merged.setdefault(section, {}).update(values)
+        return merged
+
+
+def _invulnerable(scene):
+    scene.player.max_health = 10**9
+    scene.player.health = 10**9
+
+def _horde(count: int) -> Callable:
+    def setup(scene):
+        _invulnerable(scene)
+        scene.spawn_enemies("slime", count)
+    return setup
+
+def _wave_cap(scene):
+    # Procedural waves reach the 45-slime cap at wave 6
+    scene.wave_manager.current_wave = 6
+    scene.wave_manager.load_wave(6)
+    _invulnerable(scene)
+
+def _sustained_fire_setup(scene):
+    _invulnerable(scene)
+    scene.player.projectile_cost = 0
+    scene.spawn_enemies("slime", 45)
+
+def _sustained_fire_tick(scene, tick: int):
+    # A slow 20-way radial volley every tick keeps a few thousand projectiles alive
+    player = scene.player
+    for i in range(20):
+        angle = (i / 20) * 2 * math.pi + tick * 0.05
+        scene.projectiles.spawn(player.center_x - 4, player.center_y - 4,
+                                math.cos(angle) * 150, math.sin(angle) * 150,
+                                player.projectile_damage, friendly=True)
+
+# Friendly projectiles the projectile_field scenario keeps alive
+PROJECTILE_FIELD = 6000
+
+def _projectile_field_tick(scene, tick: int):
+    # Top the friendly batch back up to PROJECTILE_FIELD slow shots scattered over the arena
+    # (low-discrepancy positions and headings, so every run is the same)
+    player = scene.player
+    rect = scene.screen_rect
+    for i in range(len(scene.projectiles.friendly), PROJECTILE_FIELD):
+        k = tick * PROJECTILE_FIELD + i
+        angle = k * 2.399963
+        scene.projectiles.spawn(k * 0.618034 % 1.0 * rect.width, k * 0.754878 % 1.0 * rect.height,
+                                math.cos(angle) * 40, math.sin(angle) * 40,
+                                player.projectile_damage, friendly=True)
+
+def _wave_cap_dirty(scene):
+    _wave_cap(scene)
+    scene.set_dirty_rects(True)
+
+def _shop_open(scene):
+    scene.spawn_enemies("slime", 45)
+    scene.shop.visible = True
+
+def _game_over(scene):
+    scene.spawn_enemies("slime", 45)
+    scene.player.take_damage(scene.player.health)
+
+
+SCENARIOS: Dict[str, Scenario] = {scenario.name: scenario for scenario in [
+    Scenario("wave_1", "Fresh game, first wave, bot input"),
+    Scenario("wave_45_cap", "Procedural wave at the 45-slime cap", _wave_cap),
+    Scenario("wave_45_cap_dirty", "wave_45_cap drawn in dirty-rect mode", _wave_cap_dirty),
+    Scenario("enemies_500", "500 slimes, invulnerable player", _horde(500)),
+    Scenario("enemies_2000", "2000 slimes, invulnerable player", _horde(2000)),
+    Scenario("enemies_10000", "10000 slimes, invulnerable player", _horde(10000)),
+    Scenario("enemies_3000_store", "3000 slimes on the NumPy enemy store", _horde(3000),
+             tuning={"game": {"enemy_store": True}}),
+    Scenario("enemies_10000_store", "10000 slimes on the NumPy enemy store", _horde(10000),
+             tuning={"game": {"enemy_store": True}}),
+    Scenario("sustained_fire", "Free shots plus a 20-way volley every tick (thousands of projectiles)",
+             _sustained_fire_setup, _sustained_fire_tick),
+    Scenario("projectile_field", f"{PROJECTILE_FIELD} live friendly projectiles, topped up every tick",
+             _sustained_fire_setup, _projectile_field_tick),
+    Scenario("shop_open", "Shop modal open over a full wave", _shop_open),
+    Scenario("game_over", "Game-over overlay over a full wave", _game_over),
+]}
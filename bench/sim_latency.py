@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Input-to-visible latency and main-process frame cost, inline vs split (simulation in a worker)
+
+Run from the project root:
+    python -m bench.sim_latency [--enemies 2000 5000] [--seconds 5] [--fps 60]
+"""
+
+import argparse
+import time
+from functools import partial
+import numpy as np
+import pygame
+from headless import init_headless_pygame
+from engine.input import InputProvider, InputState
+from engine.timestep import FixedTimestep
+
+SCREEN_SIZE = (1024, 768)
+SEED = 1234
+
+# The aim point moves every this many polls, giving a steady stream of input changes to time
+CHANGE_EVERY = 6
+
+def _horde(count: int, scene):
+    """Invulnerable player and a fixed horde; module level so the worker can unpickle it"""
+    scene.player.max_health = 10**9
+    scene.player.health = 10**9
+    scene.spawn_enemies("slime", count)
+
+
+class _SweepInput(InputProvider):
+    """Fires at a sweeping aim point and notes when each new state was sampled"""
+
+    def __init__(self):
+        self.polls = 0
+        self.last = None
+        self.changed_at = []
+
+    def poll(self, scene) -> InputState:
+        step = self.polls // CHANGE_EVERY
+        self.polls += 1
+        if step != self.last:
+            self.last = step
+            self.changed_at.append(time.perf_counter())
+        return InputState(mouse_x=(step * 37) % scene.screen_rect.width, mouse_y=200, fire=True)
+
+
+def _run(mode: str, enemies: int, seconds: float, fps: float) -> dict:
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    setup = partial(_horde, enemies)
+    provider = _SweepInput()
+
+    if mode == "split":
+        from scenes.remote_arena import RemoteArenaScene
+        scene = RemoteArenaScene(screen, provider, seed=SEED, setup=setup)
+        # Let the worker build its scene and publish before timing anything
+        while not scene.has_snapshot:
+            scene.update(0.0)
+            time.sleep(0.01)
+    else:
+        from scenes.arena_scene import ArenaScene
+        scene = ArenaScene(screen, provider, verbose=False, seed=SEED)
+        setup(scene)
+    timestep = FixedTimestep()
+
+    frame_budget = 1.0 / fps
+    latencies = []
+    frame_costs = []
+    frames = 0
+    previous = time.perf_counter()
+    end = previous + seconds
+    try:
+        while time.perf_counter() < end:
+            start = time.perf_counter()
+            frame_time = start - previous
+            previous = start
+
+            if mode == "split":
+                scene.update(frame_time)
+                scene.render()
+            else:
+                provider.changed_at.clear()
+                for _ in range(timestep.advance(frame_time)):
+                    scene.update(timestep.dt)
+                scene.render(alpha=timestep.alpha)
+            scene.present()
+
+            now = time.perf_counter()
+            shown = scene.acknowledged if mode == "split" else provider.changed_at
+            latencies.extend(now - sampled for sampled in shown)
+            frame_costs.append(now - start)
+            frames += 1
+
+            delay = frame_budget - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+    finally:
+        if mode == "split":
+            scene.close()
+
+    latencies = np.array(latencies) * 1000.0
+    frame_costs = np.array(frame_costs) * 1000.0
+    return {
+        "fps": frames / seconds,
+        "latency_p50": float(np.percentile(latencies, 50)) if len(latencies) else float("nan"),
+        "latency_p95": float(np.percentile(latencies, 95)) if len(latencies) else float("nan"),
+        "frame_p50": float(np.percentile(frame_costs, 50)),
+        "frame_p95": float(np.percentile(frame_costs, 95))
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare inline and split-process simulation latency")
+    parser.add_argument("--enemies", type=int, nargs="+", default=[2000, 5000], help="horde sizes to run")
+    parser.add_argument("--seconds", type=float, default=5.0, help="wall-clock seconds per run")
+    parser.add_argument("--fps", type=float, default=60.0, help="frame rate the main loop paces itself to")
+    args = parser.parse_args()
+
+    init_headless_pygame()
+    print(f"{'enemies':>8} {'mode':>6} {'fps':>6} {'latency p50':>12} {'p95':>8} {'frame p50':>10} {'p95':>8}")
+    for enemies in args.enemies:
+        for mode in ("inline", "split"):
+            result = _run(mode, enemies, args.seconds, args.fps)
+            print(f"{enemies:>8} {mode:>6} {result['fps']:>6.1f} {result['latency_p50']:>9.1f} ms "
+                  f"{result['latency_p95']:>5.1f} ms {result['frame_p50']:>7.2f} ms {result['frame_p95']:>5.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Floating damage numbers: per-frame draw cost with Font.render per number vs glyph-atlas composition
+
+Run from the project root:
+    python -m bench.text [--counts 100 300 1000] [--frames 120]
+"""
+
+import argparse
+import time
+import numpy as np
+import pygame
+from headless import init_headless_pygame
+from engine.combat_text import CombatText, DEFAULT_COMBAT_TEXT
+from engine.text_cache import TextCache
+
+SCREEN_SIZE = (1024, 768)
+DT = 1.0 / 60.0
+
+def filled(count: int, text: TextCache) -> CombatText:
+    """count numbers that outlive the timing, with values and styles like a busy fight"""
+    combat_text = CombatText(dict(DEFAULT_COMBAT_TEXT, budget=count, life=1e6), text, seed=1234)
+    rng = np.random.default_rng(1234)
+    styles = list(combat_text.style_ids)
+    for i in range(count):
+        combat_text.emit(rng.uniform(0, SCREEN_SIZE[0]), rng.uniform(0, SCREEN_SIZE[1]),
+                         rng.integers(1, 1000), styles[i % len(styles)])
+    return combat_text
+
+def time_font_render(combat_text: CombatText, screen: pygame.Surface, frames: int) -> float:
+    """Average seconds per frame rendering and blitting every number with Font.render"""
+    font = combat_text.text.font(combat_text.font_size)
+    n = combat_text.count
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((32, 32, 64))
+        for x, y, value, style in zip(combat_text.x[:n].tolist(), combat_text.y[:n].tolist(),
+                                      combat_text.value[:n].tolist(), combat_text.style[:n].tolist()):
+            surface = font.render(str(value), True, combat_text.colors[style])
+            screen.blit(surface, surface.get_rect(center=(x, y)))
+    return (time.perf_counter() - start) / frames
+
+def time_atlas(combat_text: CombatText, screen: pygame.Surface, frames: int) -> float:
+    """Average seconds per frame for CombatText.update() plus render()"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        screen.fill((32, 32, 64))
+        combat_text.update(DT)
+        combat_text.render(screen, 0.5)
+    return (time.perf_counter() - start) / frames
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark floating combat text")
+    parser.add_argument("--counts", type=int, nargs="+", default=[100, 300, 1000],
+                        help="numbers on screen at once")
+    parser.add_argument("--frames", type=int, default=120, help="frames timed per count")
+    args = parser.parse_args()
+
+    init_headless_pygame()
+    screen = pygame.display.set_mode(SCREEN_SIZE)
+    text = TextCache()
+
+    print(f"{'numbers':>8} {'Font.render ms':>15} {'atlas ms':>9} {'speedup':>8}")
+    for count in args.counts:
+        combat_text = filled(count, text)
+        combat_text.render(screen)  # Bake the atlases outside the timing
+        per_number = time_font_render(combat_text, screen, args.frames)
+        atlas = time_atlas(combat_text, screen, args.frames)
+        print(f"{count:>8} {per_number * 1000:>15.3f} {atlas * 1000:>9.3f} {per_number / atlas:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Level-of-detail scheduling for enemy AI: far enemies steer less often, and steering is budgeted per tick
+"""
+
+import random
+import numpy as np
+import pygame
+from typing import List
+from engine.flow_field import FlowField
+from engine.flocking import Flocking
+
+# Used for any key missing from the "ai" section of tuning.json
+DEFAULT_AI = {
+    "enabled": True,
+    "budget": 512,  # Most enemies that may re-steer in one tick; 0 = no cap
+    "near_range": 1.25,  # Tier boundaries, as multiples of each enemy's chase_range
+    "mid_range": 2.5,
+    "mid_interval": 4,  # Ticks between steering updates for the mid and far tiers
+    "far_interval": 12
+}
+
+class AIScheduler:
+    """Decides which enemies re-steer (think) each tick; every enemy still moves every tick
+
+    An enemy's tier comes from its distance to the player when it last thought: near
+    enemies think every tick, mid and far ones every mid_interval / far_interval ticks and
+    keep their last velocity in between. When more enemies are due than the budget allows,
+    nearer tiers go first and the rest are served round-robin from a rotating cursor; anyone
+    skipped stays due and is picked up on a later tick.
+
+    Selection only looks at tiers, due ticks and slot order, so the object and EnemyStore
+    paths pick the same enemies and stay in lockstep.
+    """
+
+    def __init__(self, config: dict = None):
+        self.apply_config(config)
+
+        self.tick = 0
+        self.cursor = 0
+
+        # Last tick, and running totals for averages
+        self.thinks = 0
+        self.deferred = 0
+        self.total_thinks = 0
+        self.total_ticks = 0
+
+    def apply_config(self, config: dict = None):
+        """Take settings from the "ai" tuning section (at startup, and again on a data hot reload)
+
+        The schedule carries on: enemies keep their tiers and due ticks.
+        """
+        config = dict(DEFAULT_AI, **(config or {}))
+        self.enabled = config["enabled"]
+        self.budget = int(config["budget"])
+        self.near_range = config["near_range"]
+        self.mid_range = config["mid_range"]
+        self.intervals = np.array([1, max(1, int(config["mid_interval"])), max(1, int(config["far_interval"]))])
+
+    def reset(self):
+        """Forget the schedule (new game)"""
+        self.tick = 0
+        self.cursor = 0
+        self.thinks = 0
+        self.deferred = 0
+        self.total_thinks = 0
+        self.total_ticks = 0
+
+    def stats(self) -> dict:
+        return {
+            "ai_updates": self.thinks,
+            "ai_deferred": self.deferred,
+            "ai_updates_avg": self.total_thinks / self.total_ticks if self.total_ticks else 0.0
+        }
+
+    def update_enemies(self, enemies: List, dt: float, player, screen_rect: pygame.Rect,
+                       rng: random.Random = random, field: FlowField = None, flocking: Flocking = None):
+        """Object path: think for the chosen enemies, then move all of them in list order"""
+        if not enemies or not player.alive:
+            return
+
+        n = len(enemies)
+        if self.enabled:
+            next_think = np.fromiter((enemy.next_think for enemy in enemies), dtype=np.float64, count=n)
+            tier = np.fromiter((enemy.ai_tier for enemy in enemies), dtype=np.float64, count=n)
+            chosen = self._choose(next_think, tier)
+            for i in chosen.tolist():
+                enemy = enemies[i]
+                enemy_tier = self._tier(enemy.think(player, field), enemy.chase_range)
+                enemy.ai_tier = enemy_tier
+                enemy.next_think = self.tick + int(self.intervals[enemy_tier])
+        else:
+            chosen = np.arange(n)
+            self._count(n, 0)
+            for enemy in enemies:
+                enemy.think(player, field)
+
+        if flocking is not None and len(chosen):
+            self._flock_enemies(enemies, chosen, flocking, self.tick)
+        for enemy in enemies:
+            enemy.move(dt, screen_rect, rng, field)
+
+    @staticmethod
+    def _flock_enemies(enemies: List, chosen: np.ndarray, flocking: Flocking, tick: int):
+        columns = np.array([(enemy.x + enemy.width / 2, enemy.y + enemy.height / 2, enemy.velocity_x,
+                             enemy.velocity_y, enemy.move_speed, enemy.separation_radius,
+                             enemy.separation_weight, enemy.alignment_weight) for enemy in enemies],
+                           dtype=np.float64).T
+        delta_x, delta_y = flocking.steer(chosen, *columns, tick=tick)
+        for i, change_x, change_y in zip(chosen.tolist(), delta_x.tolist(), delta_y.tolist()):
+            enemy = enemies[i]
+            enemy.velocity_x += change_x
+            enemy.velocity_y += change_y
+
+    def update_store(self, store, dt: float, player, screen_rect: pygame.Rect, rng: random.Random = random,
+                     field: FlowField = None, flocking: Flocking = None):
+        """EnemyStore path: the same schedule, vectorized"""
+        n = store.count
+        if n == 0 or not player.alive:
+            return
+
+        if self.enabled:
+            chosen = self._choose(store.next_think[:n], store.ai_tier[:n])
+            if len(chosen):
+                distance = store.steer(player, chosen, field)
+                chase_range = store.template_chase_range[store.template_id[chosen]]
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    ratio = np.where(chase_range > 0, distance / chase_range, np.inf)
+                tier = (ratio > self.near_range).astype(np.int64) + (ratio > self.mid_range)
+                store.ai_tier[chosen] = tier
+                store.next_think[chosen] = self.tick + self.intervals[tier]
+        else:
+            chosen = np.arange(n)
+            self._count(n, 0)
+            store.steer(player, field=field)
+
+        if flocking is not None and len(chosen):
+            store.flock(chosen, flocking, self.tick)
+        store.integrate(dt, screen_rect, rng, field)
+
+    def _choose(self, next_think: np.ndarray, tier: np.ndarray) -> np.ndarray:
+        """Slot indices that think this tick, ascending"""
+        self.tick += 1
+        n = len(next_think)
+        due = np.flatnonzero(next_think <= self.tick)
+        if self.budget <= 0 or len(due) <= self.budget:
+            self._count(len(due), 0)
+            return due
+
+        # Nearest tier first, then slot order starting at the cursor
+        order = np.lexsort(((due - self.cursor) % n, tier[due]))[:self.budget]
+        self.cursor = int(due[order[-1]] + 1) % n
+        self._count(self.budget, len(due) - self.budget)
+        return np.sort(due[order])
+
+    def _tier(self, distance: float, chase_range: float) -> int:
+        if chase_range <= 0:
+            return 2
+        ratio = distance / chase_range
+        if ratio <= self.near_range:
+            return 0
+        return 1 if ratio <= self.mid_range else 2
+
+    def _count(self, thinks: int, deferred: int):
+        self.thinks = thinks
+        self.deferred = deferred
+        self.total_thinks += thinks
+        self.total_ticks += 1
@@ -0,0 +1,198 @@
+"""
+Sprite atlases: packed from loose PNGs at build time, loaded lazily and converted at runtime
+
+Build:
+    python -m engine.assets assets/sprites assets/atlas
+"""
+
+import argparse
+import json
+import os
+import pygame
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_INDEX = "assets/atlas/sprites.json"
+DEFAULT_PAGE_SIZE = 1024
+DEFAULT_BUDGET = 32 * 1024 * 1024  # Bytes of converted atlas pixels kept loaded
+
+def _shelf_pack(sizes: List[Tuple[str, int, int]], page_size: int,
+                padding: int) -> List[List[Tuple[str, int, int, int, int]]]:
+    """Place (name, w, h) boxes tallest-first on shelves; returns pages of (name, x, y, w, h)"""
+    pages = []
+    page = []
+    x = y = shelf_height = 0
+    for name, width, height in sorted(sizes, key=lambda item: (-item[2], -item[1], item[0])):
+        if width > page_size or height > page_size:
+            raise ValueError(f"Sprite {name!r} ({width}x{height}) does not fit a {page_size}px atlas page")
+        if x + width > page_size:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        if y + height > page_size:
+            pages.append(page)
+            page = []
+            x = y = shelf_height = 0
+        page.append((name, x, y, width, height))
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+    if page:
+        pages.append(page)
+    return pages
+
+def pack_atlases(sprite_dir: str, out_dir: str, name: str = "sprites",
+                 page_size: int = DEFAULT_PAGE_SIZE, padding: int = 1) -> dict:
+    """Pack every PNG under sprite_dir into atlas pages plus a JSON index in out_dir
+
+    Sprites are named by their path relative to sprite_dir, without the extension
+    ("enemies/slime").
+    """
+    images: Dict[str, pygame.Surface] = {}
+    for root, _, files in os.walk(sprite_dir):
+        for filename in sorted(files):
+            if filename.lower().endswith(".png"):
+                path = os.path.join(root, filename)
+                sprite_name = os.path.splitext(os.path.relpath(path, sprite_dir))[0].replace(os.sep, "/")
+                images[sprite_name] = pygame.image.load(path)
+
+    pages = _shelf_pack([(sprite_name, *image.get_size()) for sprite_name, image in images.items()],
+                        page_size, padding)
+
+    os.makedirs(out_dir, exist_ok=True)
+    index = {"atlases": [], "sprites": {}}
+    for number, page in enumerate(pages):
+        width = max(x + w for _, x, _, w, _ in page)
+        height = max(y + h for _, _, y, _, h in page)
+        atlas = pygame.Surface((width, height), pygame.SRCALPHA)
+        alpha = False
+        for sprite_name, x, y, w, h in page:
+            image = images[sprite_name]
+            alpha = alpha or bool(image.get_flags() & pygame.SRCALPHA)
+            atlas.blit(image, (x, y))
+            index["sprites"][sprite_name] = {"atlas": number, "rect": [x, y, w, h]}
+
+        image_name = f"{name}_{number}.png"
+        pygame.image.save(atlas, os.path.join(out_dir, image_name))
+        index["atlases"].append({"image": image_name, "size": [width, height], "alpha": alpha})
+
+    with open(os.path.join(out_dir, f"{name}.json"), "w") as f:
+        json.dump(index, f, indent=2, sort_keys=True)
+    return index
+
+
+class AssetManager:
+    """Hands out sprites by name as subsurfaces of lazily loaded, display-converted atlases
+
+    Atlas pages are kept in least-recently-used order and evicted past the byte budget.
+    When the display's pixel format changes (e.g. a fullscreen toggle) everything is
+    dropped and reloaded on demand; generation counts those resets so callers caching
+    surfaces can tell theirs went stale.
+    """
+
+    def __init__(self, index_path: str = DEFAULT_INDEX, budget_bytes: int = DEFAULT_BUDGET):
+        self.index_path = index_path
+        self.root = os.path.dirname(index_path)
+        self.budget_bytes = budget_bytes
+        self.index: Optional[dict] = None
+
+        self.atlases: "OrderedDict[int, pygame.Surface]" = OrderedDict()  # Least recently used first
+        self.sprites: Dict[str, Tuple[int, pygame.Surface]] = {}  # name -> (atlas number, subsurface)
+        self.loaded_bytes = 0
+        self.display_format = None
+        self.generation = 0
+
+        # Stats
+        self.loads = 0
+        self.evictions = 0
+
+    def has(self, name: str) -> bool:
+        """Whether the index knows this sprite (False when no atlas has been built)"""
+        if self.index is None and not os.path.exists(self.index_path):
+            return False
+        return name in self._load_index()["sprites"]
+
+    def get(self, name: str) -> pygame.Surface:
+        """The named sprite, loading its atlas page if needed"""
+        self._check_display()
+
+        cached = self.sprites.get(name)
+        if cached is not None:
+            self.atlases.move_to_end(cached[0])
+            return cached[1]
+
+        entry = self._load_index()["sprites"].get(name)
+        if entry is None:
+            raise KeyError(f"Unknown sprite {name!r} in {self.index_path}")
+        number = entry["atlas"]
+        surface = self._atlas(number).subsurface(pygame.Rect(entry["rect"]))
+        self.sprites[name] = (number, surface)
+        return surface
+
+    def refresh(self):
+        """Drop every loaded atlas; sprites are reloaded (and re-converted) on next use"""
+        self.atlases.clear()
+        self.sprites.clear()
+        self.loaded_bytes = 0
+        self.generation += 1
+
+    def stats(self) -> dict:
+        return {
+            "atlases_loaded": len(self.atlases),
+            "loaded_bytes": self.loaded_bytes,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "generation": self.generation
+        }
+
+    def _load_index(self) -> dict:
+        if self.index is None:
+            with open(self.index_path, "r") as f:
+                self.index = json.load(f)
+        return self.index
+
+    def _check_display(self):
+        """Reset when converted surfaces no longer match the display's pixel format"""
+        display = pygame.display.get_surface()
+        display_format = None if display is None else (display.get_bitsize(), display.get_masks())
+        if display_format != self.display_format:
+            if self.atlases:
+                self.refresh()
+            self.display_format = display_format
+
+    def _atlas(self, number: int) -> pygame.Surface:
+        atlas = self.atlases.get(number)
+        if atlas is not None:
+            self.atlases.move_to_end(number)
+            return atlas
+
+        info = self._load_index()["atlases"][number]
+        atlas = pygame.image.load(os.path.join(self.root, info["image"]))
+        if self.display_format is not None:
+            atlas = atlas.convert_alpha() if info.get("alpha", True) else atlas.convert()
+        self.atlases[number] = atlas
+        self.loaded_bytes += atlas.get_width() * atlas.get_height() * atlas.get_bytesize()
+        self.loads += 1
+
+        # Evict least recently used pages, never the one just loaded
+        while self.loaded_bytes > self.budget_bytes and len(self.atlases) > 1:
+            evicted, surface = self.atlases.popitem(last=False)
+            self.loaded_bytes -= surface.get_width() * surface.get_height() * surface.get_bytesize()
+            self.sprites = {name: cached for name, cached in self.sprites.items() if cached[0] != evicted}
+            self.evictions += 1
+        return atlas
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pack sprite PNGs into atlas pages with a JSON index")
+    parser.add_argument("sprite_dir", nargs="?", default="assets/sprites", help="directory of source PNGs")
+    parser.add_argument("out_dir", nargs="?", default="assets/atlas", help="where to write the atlases and index")
+    parser.add_argument("--name", default="sprites", help="base name for the index and page images")
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE, help="maximum atlas page edge in pixels")
+    args = parser.parse_args()
+
+    index = pack_atlases(args.sprite_dir, args.out_dir, args.name, args.page_size)
+    print(f"OK: packed {len(index['sprites'])} sprites into {len(index['atlases'])} atlas page(s) "
+          f"in {args.out_dir}")
+
+if __name__ == "__main__":
+    main()
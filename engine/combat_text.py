@@ -0,0 +1,221 @@
+"""
+Pooled floating combat text: damage numbers composed from glyph atlases
+"""
+
+import math
+import numpy as np
+import pygame
+from typing import Dict, List
+from engine.text_cache import TextCache, default_text_cache
+
+# Numbers fade out over this many alpha steps of their atlas
+FADE_LEVELS = 4
+
+# Values are whole numbers from 0 up to 10 ** MAX_DIGITS - 1 (emit() clamps to that range)
+MAX_DIGITS = 9
+DIGITS = "0123456789"
+
+# Used for any key missing from the "combat_text" section of tuning.json
+DEFAULT_COMBAT_TEXT = {
+    "enabled": True,
+    "budget": 512,  # Most numbers on screen at once; the arrays are allocated once at this size
+    "font_size": 22,
+    "life": 0.8,  # Seconds each number stays up
+    "rise_speed": 70,  # Starting upward speed, in pixels per second
+    "drift": 25,  # Largest sideways speed, so numbers from one spot fan out
+    "drag": 2.5,  # Speed lost per second, as an exponential rate
+    "styles": {
+        "damage": [255, 240, 120],  # Damage dealt to enemies
+        "hurt": [255, 90, 90]  # Damage taken by the player
+    }
+}
+
+class CombatText:
+    """Floating numbers in preallocated parallel arrays, drawn with one blits() call
+
+    Live numbers occupy slots [0, count) and are compacted in place as they expire, as in
+    ParticleSystem. Each style is one color with its own glyph atlas, so showing a number
+    never calls Font.render: its digits are blitted from the atlas, and fading swaps in a
+    lower-alpha copy of the atlas. Values are non-negative whole numbers, and a number
+    emitted with the budget full is dropped. Like particles, combat text is visual only
+    and has its own random stream.
+    """
+
+    FIELDS = ("x", "y", "prev_x", "prev_y", "velocity_x", "velocity_y", "life")
+
+    def __init__(self, config: dict = None, text: TextCache = None, seed: int = None):
+        self.text = text if text is not None else default_text_cache()
+        self.rng = np.random.default_rng(seed)
+
+        self.style_ids: Dict[str, int] = {}
+        self.colors: List[tuple] = []
+
+        self.capacity = 0
+        self.count = 0
+        for field in self.FIELDS:
+            setattr(self, field, np.zeros(0, dtype=np.float64))
+        self.value = np.zeros(0, dtype=np.int64)
+        self.style = np.zeros(0, dtype=np.int16)
+
+        # Running totals: numbers shown, and ones the budget turned away
+        self.emitted = 0
+        self.dropped = 0
+
+        self.apply_config(config)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def apply_config(self, config: dict = None):
+        """Take settings from the "combat_text" tuning section (at startup, and again on a data hot reload)
+
+        Live numbers carry on under their style's name. Those of a style that is gone, or
+        past a smaller budget, are dropped.
+        """
+        config = dict(DEFAULT_COMBAT_TEXT, **(config or {}))
+        self.enabled = config["enabled"]
+        self.font_size = int(config["font_size"])
+        self.lifetime = max(1e-3, float(config["life"]))
+        self.rise_speed = config["rise_speed"]
+        self.drift = config["drift"]
+        self.drag = config["drag"]
+        style_ids = {name: index for index, name in enumerate(config["styles"])}
+        capacity = max(0, int(config["budget"]))
+
+        remap = np.array([style_ids.get(name, -1) for name in self.style_ids], dtype=np.int64)
+        survivors = np.flatnonzero(remap[self.style[:self.count]] >= 0)[:capacity]
+        count = len(survivors)
+        for field in self.FIELDS + ("value", "style"):
+            old = getattr(self, field)
+            array = np.zeros(capacity, dtype=old.dtype)
+            array[:count] = old[survivors]
+            setattr(self, field, array)
+        self.style[:count] = remap[self.style[:count]]
+
+        self.style_ids = style_ids
+        self.colors = [tuple(color) for color in config["styles"].values()]
+        self.capacity = capacity
+        self.count = count
+
+    def clear(self):
+        """Drop every live number (new game)"""
+        self.count = 0
+
+    def emit(self, x: float, y: float, value: float, style: str = "damage") -> bool:
+        """Float value up from (x, y), rounded to a whole number; False if it was dropped"""
+        style_id = self.style_ids.get(style)
+        if not self.enabled or style_id is None:
+            return False
+        if self.count == self.capacity:
+            self.dropped += 1
+            return False
+
+        index = self.count
+        self.count += 1
+        self.x[index] = x
+        self.y[index] = y
+        self.prev_x[index] = x
+        self.prev_y[index] = y
+        self.velocity_x[index] = self.rng.uniform(-self.drift, self.drift)
+        self.velocity_y[index] = -self.rise_speed
+        self.life[index] = self.lifetime
+        self.value[index] = min(max(int(round(value)), 0), 10 ** MAX_DIGITS - 1)
+        self.style[index] = style_id
+        self.emitted += 1
+        return True
+
+    def update(self, dt: float):
+        """Advance, slow, age and cull every number in one pass"""
+        n = self.count
+        if n == 0:
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        velocity_x = self.velocity_x[:n]
+        velocity_y = self.velocity_y[:n]
+        x += velocity_x * dt
+        y += velocity_y * dt
+        if self.drag:
+            slowdown = math.exp(-self.drag * dt)
+            velocity_x *= slowdown
+            velocity_y *= slowdown
+        life = self.life[:n]
+        life -= dt
+
+        keep = life > 0.0
+        if keep.all():
+            return
+        survivors = np.flatnonzero(keep)
+        count = len(survivors)
+        for field in self.FIELDS + ("value", "style"):
+            array = getattr(self, field)
+            array[:count] = array[survivors]
+        self.count = count
+
+    def _layout(self, alpha: float):
+        """Per-number left, top, width and height, plus each digit's number, glyph and x offset
+
+        Digits are split out with array arithmetic rather than str(), and laid out from the
+        atlas glyph widths, so the cost per number stays in NumPy.
+        """
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        if alpha < 1.0:
+            prev_x = self.prev_x[:n]
+            prev_y = self.prev_y[:n]
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        atlases = [self.text.glyphs(self.font_size, color) for color in self.colors]
+        digit_width = np.array([[atlas.areas[digit].width for digit in DIGITS] for atlas in atlases])
+        line_height = np.array([atlas.height for atlas in atlases])
+
+        value = self.value[:n]
+        style = self.style[:n].astype(np.int64)
+        digits = np.ones(n, dtype=np.int64)
+        for power in range(1, MAX_DIGITS):
+            digits += value >= 10 ** power
+        number = np.repeat(np.arange(n), digits)
+        first = np.repeat(np.cumsum(digits) - digits, digits)
+        place = digits[number] - 1 - (np.arange(len(number)) - first)  # Power of ten of each digit
+        glyph = value[number] // 10 ** place % 10
+        glyph_width = digit_width[style[number], glyph]
+        offset = np.cumsum(glyph_width) - glyph_width
+        offset -= offset[first]
+
+        width = np.bincount(number, weights=glyph_width, minlength=n).astype(np.int64)
+        height = line_height[style]
+        left = x.astype(np.int64) - width // 2
+        top = y.astype(np.int64) - height // 2
+        return atlases, left, top, width, height, number, glyph, offset
+
+    def render(self, screen: pygame.Surface, alpha: float = 1.0):
+        """Draw every live number, centered on its position, in one blits() call"""
+        n = self.count
+        if n == 0:
+            return
+        atlases, left, top, _, _, number, glyph, offset = self._layout(alpha)
+        style = self.style[:n].astype(np.int64)
+        fade = np.minimum((self.life[:n] / self.lifetime * FADE_LEVELS).astype(np.int64), FADE_LEVELS - 1)
+
+        # Lookup tables: atlas copy by (style, fade level), atlas area by (style, digit)
+        surfaces = [atlas.faded(level, FADE_LEVELS) for atlas in atlases for level in range(FADE_LEVELS)]
+        areas = [atlas.areas[digit] for atlas in atlases for digit in DIGITS]
+        surface_keys = (style * FADE_LEVELS + fade)[number]
+        area_keys = style[number] * len(DIGITS) + glyph
+        screen.blits(zip(map(surfaces.__getitem__, surface_keys.tolist()),
+                         zip((left[number] + offset).tolist(), top[number].tolist()),
+                         map(areas.__getitem__, area_keys.tolist())), False)
+
+    def render_bounds(self, alpha: float = 1.0) -> List[pygame.Rect]:
+        """Rects covering every number render() draws"""
+        if self.count == 0:
+            return []
+        _, left, top, width, height = self._layout(alpha)[:5]
+        return [pygame.Rect(*rect) for rect in zip(left.tolist(), top.tolist(), width.tolist(), height.tolist())]
+
+    def stats(self) -> dict:
+        return {"live": self.count, "budget": self.capacity, "emitted": self.emitted, "dropped": self.dropped}
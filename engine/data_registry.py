@@ -0,0 +1,256 @@
+"""
+Game data (tuning, arena layout, enemy templates, waves) parsed and validated once, then served from memory
+"""
+
+import json
+import os
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+
+DATA_ROOT = "data"
+
+# Used when a file is missing, matching the game's historical fallbacks
+DEFAULT_TUNING = {
+    "player": {
+        "max_health": 100,
+        "max_mana": 50,
+        "move_speed": 300,
+        "mana_regen": 20,
+        "projectile_cost": 5,
+        "projectile_speed": 500,
+        "projectile_damage": 25
+    }
+}
+DEFAULT_ENEMIES = {
+    "slime": {
+        "health": 50,
+        "speed": 80,
+        "damage": 20,
+        "size": 24,
+        "color": [100, 255, 100],
+        "coins": 5,
+        "chase_range": 300,
+        "attack_cooldown": 1.5,
+        "separation_radius": 28,
+        "separation_weight": 0.8,
+        "alignment_weight": 0.0
+    }
+}
+
+DEFAULT_ARENA = {
+    "cell_size": 32,
+    "obstacles": []
+}
+
+ENEMY_NUMBERS = ("health", "speed", "damage", "size", "coins", "chase_range", "attack_cooldown",
+                 "separation_radius", "separation_weight", "alignment_weight")
+WAVE_FILE = re.compile(r"wave_(\d+)\.json$")
+
+class DataError(ValueError):
+    """A data file failed to parse or validate"""
+
+
+class FrozenDict(dict):
+    """A dict that refuses changes; copy it with dict() to get a mutable one"""
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Registry data is read-only; copy it with dict() first")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+def freeze(value):
+    """Recursively turn dicts into FrozenDicts and lists into tuples"""
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _number(data: dict, key: str, path: str, minimum: float = 0.0):
+    value = data.get(key)
+    if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float)) or value < minimum):
+        raise DataError(f"{path}: {key!r} must be a number >= {minimum}, got {value!r}")
+
+def _validate_tuning(data, path: str):
+    if not isinstance(data, dict) or not all(isinstance(section, dict) for section in data.values()):
+        raise DataError(f"{path}: expected an object of sections")
+    for key in DEFAULT_TUNING["player"]:
+        _number(data.get("player", {}), key, path)
+    max_count = data.get("endless", {}).get("max_count")
+    if max_count is not None and (isinstance(max_count, bool) or not isinstance(max_count, int) or max_count < 1):
+        raise DataError(f"{path}: endless 'max_count' must be a whole number >= 1, got {max_count!r}")
+
+def _validate_arena(data, path: str):
+    if not isinstance(data, dict) or not isinstance(data.get("obstacles", []), list):
+        raise DataError(f"{path}: expected an object with an \"obstacles\" list")
+    _number(data, "cell_size", path, 4)
+    for obstacle in data.get("obstacles", []):
+        if not isinstance(obstacle, dict) or not all(key in obstacle for key in ("x", "y", "w", "h")):
+            raise DataError(f"{path}: every obstacle needs x, y, w and h (fractions of the arena)")
+        for key in ("x", "y", "w", "h"):
+            _number(obstacle, key, path)
+
+def _validate_enemy(data, path: str):
+    if not isinstance(data, dict):
+        raise DataError(f"{path}: expected an object")
+    for key in ENEMY_NUMBERS:
+        _number(data, key, path)
+    if data.get("size", 1) <= 0 or data.get("health", 1) <= 0:
+        raise DataError(f"{path}: size and health must be positive")
+    color = data.get("color", [0, 0, 0])
+    if (not isinstance(color, list) or len(color) != 3 or
+            not all(isinstance(c, int) and 0 <= c <= 255 for c in color)):
+        raise DataError(f"{path}: color must be three integers 0-255, got {color!r}")
+    if not isinstance(data.get("sprite", ""), str):
+        raise DataError(f"{path}: sprite must be an atlas sprite name, got {data['sprite']!r}")
+
+def _validate_wave(data, path: str, number: int):
+    if not isinstance(data, dict) or not isinstance(data.get("enemies"), list):
+        raise DataError(f"{path}: expected an object with an \"enemies\" list")
+    if data.get("wave_number", number) != number:
+        raise DataError(f"{path}: wave_number {data['wave_number']} does not match the file name")
+    for group in data["enemies"]:
+        if not isinstance(group, dict) or not isinstance(group.get("type"), str):
+            raise DataError(f"{path}: every enemy group needs a \"type\"")
+        count = group.get("count")
+        if isinstance(count, bool) or not isinstance(count, int) or count < 0:
+            raise DataError(f"{path}: count must be a non-negative integer, got {count!r}")
+        _number(group, "spawn_delay", path)
+
+
+class DataRegistry:
+    """Every file under data/, loaded once at startup and looked up from memory
+
+    Call poll() (e.g. once a frame during development) to reload files whose
+    modification time changed. A reload that fails to parse or validate is reported and
+    ignored, so the game keeps running on the last good data. version counts reloads.
+    """
+
+    def __init__(self, root: str = DATA_ROOT, poll_interval: float = 0.5):
+        self.root = root
+        self.poll_interval = poll_interval
+        self.next_poll = 0.0
+        self.version = 0
+
+        # Start from the defaults, then read everything that exists
+        self.tuning = freeze(DEFAULT_TUNING)
+        self.arena = freeze(DEFAULT_ARENA)
+        self.enemies = freeze(DEFAULT_ENEMIES)
+        self.waves = FrozenDict()
+        self.mtimes: Dict[str, float] = self._scan()
+        self.tuning, self.arena, self.enemies, self.waves = self._apply(list(self.mtimes), [])
+
+    def enemy(self, name: str) -> Optional[FrozenDict]:
+        return self.enemies.get(name)
+
+    def wave(self, number: int) -> Optional[FrozenDict]:
+        """A hand-authored wave, or None where waves are generated"""
+        return self.waves.get(number)
+
+    def poll(self, force: bool = False) -> List[str]:
+        """Reload files changed on disk since the last poll; returns their paths"""
+        now = time.monotonic()
+        if not force and now < self.next_poll:
+            return []
+        self.next_poll = now + self.poll_interval
+
+        current = self._scan()
+        changed = [path for path, mtime in current.items() if self.mtimes.get(path) != mtime]
+        removed = [path for path in self.mtimes if path not in current]
+        if not changed and not removed:
+            return []
+
+        # Remember these mtimes even on failure, so a bad save is reported once, not every poll
+        self.mtimes = current
+        try:
+            self.tuning, self.arena, self.enemies, self.waves = self._apply(changed, removed)
+        except DataError as error:
+            print(f"WARNING: {error} - keeping the previous data")
+            return []
+        self.version += 1
+        return sorted(changed + removed)
+
+    def _scan(self) -> Dict[str, float]:
+        """Relative path -> mtime of every data file"""
+        mtimes = {}
+        patterns = (("", r"(tuning|arena)\.json$"), ("enemies", r".+\.json$"), ("waves", WAVE_FILE.pattern))
+        for directory, pattern in patterns:
+            full = os.path.join(self.root, directory)
+            if not os.path.isdir(full):
+                continue
+            for entry in os.scandir(full):
+                if entry.is_file() and re.match(pattern, entry.name):
+                    mtimes[os.path.join(directory, entry.name) if directory else entry.name] = entry.stat().st_mtime
+        return mtimes
+
+    def _apply(self, changed: List[str], removed: List[str]) -> Tuple[FrozenDict, ...]:
+        """New (tuning, arena, enemies, waves) with the given files re-read; current state is untouched"""
+        tuning = self.tuning
+        arena = self.arena
+        enemies = dict(self.enemies)
+        waves = dict(self.waves)
+
+        for path in removed:
+            kind, key = self._classify(path)
+            if kind == "tuning":
+                tuning = freeze(DEFAULT_TUNING)
+            elif kind == "arena":
+                arena = freeze(DEFAULT_ARENA)
+            elif kind == "enemy":
+                enemies.pop(key, None)
+            else:
+                waves.pop(key, None)
+
+        for path in changed:
+            kind, key = self._classify(path)
+            full = os.path.join(self.root, path)
+            try:
+                with open(full, "r") as f:
+                    data = json.load(f)
+            except (OSError, ValueError) as error:
+                raise DataError(f"{full}: {error}") from error
+
+            if kind == "tuning":
+                _validate_tuning(data, full)
+                tuning = freeze(data)
+            elif kind == "arena":
+                _validate_arena(data, full)
+                arena = freeze(data)
+            elif kind == "enemy":
+                _validate_enemy(data, full)
+                enemies[key] = freeze(data)
+            else:
+                _validate_wave(data, full, key)
+                waves[key] = freeze(data)
+
+        if not enemies:
+            enemies = dict(freeze(DEFAULT_ENEMIES))
+        for number, wave in waves.items():
+            for group in wave["enemies"]:
+                if group["type"] not in enemies:
+                    raise DataError(f"wave {number}: unknown enemy type {group['type']!r}")
+        return tuning, arena, FrozenDict(enemies), FrozenDict(waves)
+
+    @staticmethod
+    def _classify(path: str) -> Tuple[str, object]:
+        directory, name = os.path.split(path)
+        if directory == "enemies":
+            return "enemy", os.path.splitext(name)[0]
+        if directory == "waves":
+            return "wave", int(WAVE_FILE.match(name).group(1))
+        return os.path.splitext(name)[0], None
+
+
+_default_registry: Optional[DataRegistry] = None
+
+def default_registry() -> DataRegistry:
+    """The process-wide registry, loaded on first use"""
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = DataRegistry()
+    return _default_registry
@@ -0,0 +1,88 @@
+"""
+Dirty-rectangle rendering: redraw and present only the parts of the screen that changed
+"""
+
+import pygame
+from typing import List, Optional
+
+# Above this fraction of the screen, a plain full redraw and flip is cheaper
+DEFAULT_THRESHOLD = 0.4
+
+# Merging is quadratic in the worst case; past this many rects the frame goes full instead
+MAX_RECTS = 512
+
+def merge_rects(rects: List[pygame.Rect]) -> List[pygame.Rect]:
+    """Union overlapping rects, skipping pairs whose bounding box would cover more than both
+
+    Blindly unioning chains of barely-touching rects (say the full-width HUD and an enemy
+    below it) snowballs into boxes far bigger than what actually changed.
+    """
+    merged: List[pygame.Rect] = []
+    for rect in sorted(rects, key=lambda r: r.x):
+        rect = rect.copy()
+        grew = True
+        while grew:
+            grew = False
+            for i in reversed(rect.collidelistall(merged)):
+                other = merged[i]
+                union = rect.union(other)
+                if union.width * union.height <= rect.width * rect.height + other.width * other.height:
+                    rect = union
+                    merged.pop(i)
+                    grew = True
+        merged.append(rect)
+    return merged
+
+class DirtyRectRenderer:
+    """Cached arena background plus the bounds drawn last frame
+
+    A frame is erased from the background wherever something was drawn last frame or
+    will be drawn this frame. Overlays that cover the whole screen (shop, game over,
+    pause) force a full redraw, and so does the first frame after one.
+    """
+
+    def __init__(self, background: pygame.Surface, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self.set_background(background)
+
+    def set_background(self, background: pygame.Surface):
+        """Use a new background (e.g. after a resize); the next frame is drawn in full"""
+        self.background = background
+        self.screen_area = background.get_width() * background.get_height()
+        self.previous: List[pygame.Rect] = []
+        self.hud_state = None
+        self.hud_dirty = True
+        self.full_redraw = True
+
+    def collect(self, bounds: List[pygame.Rect], hud_regions: List[pygame.Rect],
+                hud_state: tuple) -> Optional[List[pygame.Rect]]:
+        """Dirty rects for this frame, or None when it should be drawn in full"""
+        if self.full_redraw:
+            return None
+
+        rects = self.previous + bounds
+        if len(rects) > MAX_RECTS:
+            return None
+
+        # The HUD is translucent, so it is redrawn when it changes or anything under it moves
+        self.hud_dirty = hud_state != self.hud_state or any(region.collidelist(rects) != -1
+                                                            for region in hud_regions)
+        if self.hud_dirty:
+            rects = rects + hud_regions
+
+        dirty = merge_rects(rects)
+        if sum(rect.width * rect.height for rect in dirty) > self.threshold * self.screen_area:
+            return None
+        return dirty
+
+    def erase(self, screen: pygame.Surface, dirty: List[pygame.Rect]):
+        """Restore the background under every dirty rect"""
+        background = self.background
+        for rect in dirty:
+            screen.blit(background, rect, rect)
+
+    def finish(self, bounds: List[pygame.Rect], hud_state: tuple, overlay: bool):
+        """Remember what this frame drew; an overlay frame leaves the whole screen stale"""
+        self.previous = bounds
+        self.hud_state = hud_state
+        self.full_redraw = overlay
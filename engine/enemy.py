@@ -6,11 +6,22 @@ import pygame
 import random
 import math
 from engine.entity import Entity
+from engine.flow_field import FlowField
+from engine.particles import ParticleSystem
 
 class Enemy(Entity):
     """Base enemy class with chase AI and contact damage"""
 
-    def __init__(self, x: float, y: float, enemy_data: dict):
+    __slots__ = ("max_health", "health", "move_speed", "damage", "coins_value", "chase_range",
+                 "attack_cooldown", "last_attack_time", "movement_offset_x", "movement_offset_y",
+                 "base_velocity_x", "base_velocity_y", "ai_tier", "next_think", "separation_radius",
+                 "separation_weight", "alignment_weight", "sprite")
+
+    def __init__(self, x: float, y: float, enemy_data: dict, rng: random.Random = random):
+        self.reset(x, y, enemy_data, rng)
+
+    def reset(self, x: float, y: float, enemy_data: dict, rng: random.Random = random):
+        """(Re)initialize all state - shared by __init__ and Pool.acquire"""
         size = enemy_data.get("size", 24)
         super().__init__(x, y, size, size)
 
@@ -24,27 +35,46 @@ class Enemy(Entity):
         # Visual
         color_data = enemy_data.get("color", [100, 255, 100])
         self.color = tuple(color_data)
+        self.sprite = enemy_data.get("sprite")  # Atlas sprite name; None (or no atlas) draws a colored box
 
         # AI behavior
         self.chase_range = enemy_data.get("chase_range", 300)
         self.attack_cooldown = enemy_data.get("attack_cooldown", 1.0)
         self.last_attack_time = 0.0
 
+        # Flocking (see Flocking): keep separation_radius from neighbors, optionally match their heading
+        self.separation_radius = enemy_data.get("separation_radius", 0)
+        self.separation_weight = enemy_data.get("separation_weight", 0.0)
+        self.alignment_weight = enemy_data.get("alignment_weight", 0.0)
+
         # Movement variation to prevent stacking
-        self.movement_offset_x = random.uniform(-20, 20)
-        self.movement_offset_y = random.uniform(-20, 20)
+        self.movement_offset_x = rng.uniform(-20, 20)
+        self.movement_offset_y = rng.uniform(-20, 20)
 
         # Constant movement with random initial direction
-        angle = random.uniform(0, 2 * math.pi)
+        angle = rng.uniform(0, 2 * math.pi)
         self.base_velocity_x = math.cos(angle) * self.move_speed
         self.base_velocity_y = math.sin(angle) * self.move_speed
 
-    def update(self, dt: float, player, screen_rect: pygame.Rect):
+        # AI level of detail (see AIScheduler): distance tier and the tick steering is next due
+        self.ai_tier = 0
+        self.next_think = 0
+
+    def update(self, dt: float, player, screen_rect: pygame.Rect, rng: random.Random = random,
+               field: FlowField = None):
         """Update enemy with constant movement and wall bouncing"""
         if not player.alive:
             return
 
-        # Calculate distance to player for chase behavior
+        self.think(player, field)
+        self.move(dt, screen_rect, rng, field)
+
+    def think(self, player, field: FlowField = None) -> float:
+        """Steering decision: base movement, pulled toward the player when in chase range
+
+        With a flow field the pull follows the field around obstacles instead of a straight
+        line. Returns the distance to the player.
+        """
         distance = self.distance_to(player)
 
         # Mix base movement with player chasing
@@ -56,8 +86,14 @@ class Enemy(Entity):
             player_distance = math.sqrt(dx * dx + dy * dy)
 
             if player_distance > 0:
-                player_vel_x = (dx / player_distance) * self.move_speed * player_influence
-                player_vel_y = (dy / player_distance) * self.move_speed * player_influence
+                dir_x = dx / player_distance
+                dir_y = dy / player_distance
+                if field is not None:
+                    flow_x, flow_y = field.direction(self.center_x, self.center_y)
+                    if flow_x or flow_y:
+                        dir_x, dir_y = flow_x, flow_y
+                player_vel_x = dir_x * self.move_speed * player_influence
+                player_vel_y = dir_y * self.move_speed * player_influence
 
                 # Blend with base movement
                 self.velocity_x = self.base_velocity_x * (1 - player_influence) + player_vel_x
@@ -69,13 +105,29 @@ class Enemy(Entity):
             # Use base constant movement
             self.velocity_x = self.base_velocity_x
             self.velocity_y = self.base_velocity_y
+        return distance
 
-        # Update position
+    def move(self, dt: float, screen_rect: pygame.Rect, rng: random.Random = random, field: FlowField = None):
+        """Integrate the current velocity, bounce off obstacles and walls and tick the attack cooldown"""
         super().update(dt)
+        bounced = False
+
+        # Obstacle bouncing - step back along each blocked axis
+        if field is not None:
+            hit_x, hit_y = field.blocked_axes(self.x, self.y, self.prev_x, self.prev_y, self.width, self.height)
+            if hit_x:
+                self.x = self.prev_x
+                self.base_velocity_x = -self.base_velocity_x
+                self.velocity_x = -self.velocity_x
+                bounced = True
+            if hit_y:
+                self.y = self.prev_y
+                self.base_velocity_y = -self.base_velocity_y
+                self.velocity_y = -self.velocity_y
+                bounced = True
 
         # Wall bouncing - bounce off screen edges
         margin = 10
-        bounced = False
 
         if self.x <= margin or self.x >= screen_rect.width - self.width - margin:
             self.base_velocity_x = -self.base_velocity_x
@@ -93,7 +145,7 @@ class Enemy(Entity):
 
         # Add slight randomness to prevent predictable bouncing patterns
         if bounced:
-            angle_variation = random.uniform(-0.3, 0.3)  # Small angle change
+            angle_variation = rng.uniform(-0.3, 0.3)  # Small angle change
             current_angle = math.atan2(self.base_velocity_y, self.base_velocity_x)
             new_angle = current_angle + angle_variation
             speed = math.sqrt(self.base_velocity_x**2 + self.base_velocity_y**2)
@@ -115,28 +167,17 @@ class Enemy(Entity):
             return True
         return False
 
-    def take_damage(self, damage: int):
-        """Apply damage to enemy"""
+    def take_damage(self, damage: int, particles: ParticleSystem = None):
+        """Apply damage to enemy, with a hit spark (and a death burst) when given a ParticleSystem"""
         self.health -= damage
         if self.health <= 0:
             self.alive = False
-
-    def render(self, screen: pygame.Surface):
-        """Render enemy with health bar"""
-        # Draw enemy body
-        pygame.draw.rect(screen, self.color, self.rect)
-
-        # Draw health bar if damaged
-        if self.health < self.max_health:
-            bar_width = self.width
-            bar_height = 4
-            bar_x = self.x
-            bar_y = self.y - 8
-
-            # Background (red)
-            pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-
-            # Health (green)
-            health_ratio = self.health / self.max_health
-            health_width = bar_width * health_ratio
-            pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
\ No newline at end of file
+        if particles is not None:
+            particles.emit("hit", self.center_x, self.center_y)
+            if not self.alive:
+                particles.emit("death", self.center_x, self.center_y, self.color)
+
+    def render_bounds(self, alpha: float = 1.0) -> pygame.Rect:
+        """Body plus the health bar 8px above it"""
+        x, y = self.interpolated_position(alpha)
+        return pygame.Rect(x - 1, y - 9, self.width + 2, self.height + 10)
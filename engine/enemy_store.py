@@ -0,0 +1,374 @@
+"""
+Struct-of-arrays enemy storage with a vectorized simulation step
+"""
+
+import math
+import random
+import numpy as np
+import pygame
+from typing import Dict, List, Optional
+from engine.enemy import Enemy
+from engine.flow_field import FlowField
+from engine.flocking import Flocking
+
+# Must match the constants in Enemy.update
+PLAYER_INFLUENCE = 0.3
+BOUNCE_MARGIN = 10
+
+class EnemyProxy(Enemy):
+    """Thin Enemy view onto one slot of an EnemyStore
+
+    Per-template values (size, damage, coins, ...) are plain attributes; everything the
+    simulation writes lives in the store's arrays, so the inherited Enemy methods
+    (attack, take_damage, render, rect, ...) work unchanged.
+    """
+
+    __slots__ = ("_store", "_index")
+
+    def __init__(self, store: 'EnemyStore', index: int, enemy_data: dict):
+        # Deliberately skips Enemy.__init__ - state is owned by the store
+        self._store = store
+        self._index = index
+
+        size = enemy_data.get("size", 24)
+        self.width = size
+        self.height = size
+        self.max_health = enemy_data.get("health", 50)
+        self.move_speed = enemy_data.get("speed", 100)
+        self.damage = enemy_data.get("damage", 20)
+        self.coins_value = enemy_data.get("coins", 5)
+        self.color = tuple(enemy_data.get("color", [100, 255, 100]))
+        self.sprite = enemy_data.get("sprite")
+        self.chase_range = enemy_data.get("chase_range", 300)
+        self.attack_cooldown = enemy_data.get("attack_cooldown", 1.0)
+        self.separation_radius = enemy_data.get("separation_radius", 0)
+        self.separation_weight = enemy_data.get("separation_weight", 0.0)
+        self.alignment_weight = enemy_data.get("alignment_weight", 0.0)
+
+    def _slot_property(name: str):
+        def getter(self):
+            return getattr(self._store, name)[self._index]
+
+        def setter(self, value):
+            getattr(self._store, name)[self._index] = value
+
+        return property(getter, setter)
+
+    x = _slot_property("x")
+    y = _slot_property("y")
+    prev_x = _slot_property("prev_x")
+    prev_y = _slot_property("prev_y")
+    velocity_x = _slot_property("velocity_x")
+    velocity_y = _slot_property("velocity_y")
+    base_velocity_x = _slot_property("base_velocity_x")
+    base_velocity_y = _slot_property("base_velocity_y")
+    movement_offset_x = _slot_property("movement_offset_x")
+    movement_offset_y = _slot_property("movement_offset_y")
+    health = _slot_property("health")
+    last_attack_time = _slot_property("last_attack_time")
+    ai_tier = _slot_property("ai_tier")
+    next_think = _slot_property("next_think")
+    del _slot_property
+
+    @property
+    def alive(self) -> bool:
+        return bool(self._store.alive[self._index])
+
+    @alive.setter
+    def alive(self, value: bool):
+        self._store.alive[self._index] = value
+
+    def update(self, dt: float, player, screen_rect: pygame.Rect, rng: random.Random = random):
+        """Proxies are advanced in bulk by EnemyStore.step"""
+        raise RuntimeError("EnemyProxy is updated through EnemyStore.step()")
+
+    def _detach(self):
+        """Copy this slot's state out of the store before the slot is reused"""
+        snapshot = _SlotSnapshot()
+        index = self._index
+        for field in EnemyStore.FIELDS + ("alive",):
+            setattr(snapshot, field, getattr(self._store, field)[index:index + 1].copy())
+        self._store = snapshot
+        self._index = 0
+
+
+class _SlotSnapshot:
+    """Single-slot stand-in for an EnemyStore, held by proxies of removed enemies"""
+
+
+class EnemyStore:
+    """Keeps every live enemy in contiguous NumPy arrays and steps them in one pass"""
+
+    # Per-enemy state arrays (float64 so results match the scalar Python path exactly)
+    FIELDS = ("x", "y", "prev_x", "prev_y", "velocity_x", "velocity_y", "base_velocity_x",
+              "base_velocity_y", "movement_offset_x", "movement_offset_y", "health", "last_attack_time",
+              "ai_tier", "next_think")
+
+    def __init__(self, capacity: int = 256):
+        self.capacity = capacity
+        self.count = 0
+
+        for field in self.FIELDS:
+            setattr(self, field, np.zeros(capacity, dtype=np.float64))
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.template_id = np.zeros(capacity, dtype=np.int32)
+
+        # Template table, indexed by template_id
+        self.template_ids: Dict[str, int] = {}
+        self.template_size = np.zeros(0, dtype=np.float64)
+        self.template_speed = np.zeros(0, dtype=np.float64)
+        self.template_chase_range = np.zeros(0, dtype=np.float64)
+        self.template_max_health = np.zeros(0, dtype=np.float64)
+        self.template_separation_radius = np.zeros(0, dtype=np.float64)
+        self.template_separation_weight = np.zeros(0, dtype=np.float64)
+        self.template_alignment_weight = np.zeros(0, dtype=np.float64)
+        self.template_color: List[tuple] = []
+        self.template_sprite: List[Optional[str]] = []
+
+        # One proxy per occupied slot, in slot order. Mutated in place so callers can hold on to it.
+        self.proxies: List[EnemyProxy] = []
+
+    def __len__(self) -> int:
+        return self.count
+
+    def register_template(self, name: str, enemy_data: dict) -> int:
+        """Add (or replace) the per-type constants used by the vectorized step"""
+        size = enemy_data.get("size", 24)
+        speed = enemy_data.get("speed", 100)
+        chase_range = enemy_data.get("chase_range", 300)
+        max_health = enemy_data.get("health", 50)
+        color = tuple(enemy_data.get("color", [100, 255, 100]))
+        sprite = enemy_data.get("sprite")
+        separation_radius = enemy_data.get("separation_radius", 0)
+        separation_weight = enemy_data.get("separation_weight", 0.0)
+        alignment_weight = enemy_data.get("alignment_weight", 0.0)
+
+        template_id = self.template_ids.get(name)
+        if template_id is None:
+            template_id = len(self.template_ids)
+            self.template_ids[name] = template_id
+            self.template_size = np.append(self.template_size, size)
+            self.template_speed = np.append(self.template_speed, speed)
+            self.template_chase_range = np.append(self.template_chase_range, chase_range)
+            self.template_max_health = np.append(self.template_max_health, max_health)
+            self.template_separation_radius = np.append(self.template_separation_radius, separation_radius)
+            self.template_separation_weight = np.append(self.template_separation_weight, separation_weight)
+            self.template_alignment_weight = np.append(self.template_alignment_weight, alignment_weight)
+            self.template_color.append(color)
+            self.template_sprite.append(sprite)
+        else:
+            self.template_size[template_id] = size
+            self.template_speed[template_id] = speed
+            self.template_chase_range[template_id] = chase_range
+            self.template_max_health[template_id] = max_health
+            self.template_separation_radius[template_id] = separation_radius
+            self.template_separation_weight[template_id] = separation_weight
+            self.template_alignment_weight[template_id] = alignment_weight
+            self.template_color[template_id] = color
+            self.template_sprite[template_id] = sprite
+        return template_id
+
+    def _grow(self):
+        """Double capacity, keeping existing slots"""
+        new_capacity = self.capacity * 2
+        for field in self.FIELDS + ("alive", "template_id"):
+            old = getattr(self, field)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, field, new)
+        self.capacity = new_capacity
+
+    def spawn(self, x: float, y: float, enemy_data: dict, template_name: str,
+              rng: random.Random = random) -> EnemyProxy:
+        """Create an enemy in the next free slot; consumes randomness exactly like Enemy.__init__"""
+        template_id = self.template_ids.get(template_name)
+        if template_id is None:
+            template_id = self.register_template(template_name, enemy_data)
+
+        if self.count == self.capacity:
+            self._grow()
+
+        index = self.count
+        self.count += 1
+
+        proxy = EnemyProxy(self, index, enemy_data)
+        self.proxies.append(proxy)
+
+        self.x[index] = x
+        self.y[index] = y
+        self.prev_x[index] = x
+        self.prev_y[index] = y
+        self.velocity_x[index] = 0.0
+        self.velocity_y[index] = 0.0
+        self.health[index] = proxy.max_health
+        self.last_attack_time[index] = 0.0
+        self.ai_tier[index] = 0
+        self.next_think[index] = 0
+        self.alive[index] = True
+        self.template_id[index] = template_id
+
+        # Same draw order as Enemy.__init__
+        self.movement_offset_x[index] = rng.uniform(-20, 20)
+        self.movement_offset_y[index] = rng.uniform(-20, 20)
+        angle = rng.uniform(0, 2 * math.pi)
+        self.base_velocity_x[index] = math.cos(angle) * proxy.move_speed
+        self.base_velocity_y[index] = math.sin(angle) * proxy.move_speed
+
+        return proxy
+
+    def remove_dead(self) -> List[EnemyProxy]:
+        """Compact dead enemies out of the arrays (order preserved) and return their proxies"""
+        n = self.count
+        alive = self.alive[:n]
+        if alive.all():
+            return []
+
+        keep = np.flatnonzero(alive)
+        dead = [self.proxies[i] for i in np.flatnonzero(~alive)]
+
+        # Dead proxies keep a detached snapshot so late readers (coins, stats) still work
+        for proxy in dead:
+            proxy._detach()
+
+        kept = len(keep)
+        for field in self.FIELDS + ("alive", "template_id"):
+            array = getattr(self, field)
+            array[:kept] = array[keep]
+        self.alive[kept:n] = False
+        self.count = kept
+
+        self.proxies[:] = [self.proxies[i] for i in keep]
+        for index, proxy in enumerate(self.proxies):
+            proxy._index = index
+        return dead
+
+    def clear(self):
+        """Drop every enemy"""
+        for proxy in self.proxies:
+            proxy._detach()
+        self.alive[:self.count] = False
+        self.count = 0
+        self.proxies.clear()
+
+    def step(self, dt: float, player, screen_rect: pygame.Rect, rng: random.Random = random,
+             field: FlowField = None):
+        """Vectorized equivalent of calling Enemy.update on every slot, in slot order
+
+        Expects dead slots to have been compacted out with remove_dead() first.
+        """
+        if self.count == 0 or not player.alive:
+            return
+        self.steer(player, field=field)
+        self.integrate(dt, screen_rect, rng, field)
+
+    def steer(self, player, indices: np.ndarray = None, field: FlowField = None) -> np.ndarray:
+        """Vectorized Enemy.think: set velocities from the chase blend; returns distances
+
+        indices limits the update to those slots (the AI scheduler's picks for this tick).
+        """
+        n = self.count
+        select = slice(0, n) if indices is None else indices
+        x = self.x[select]
+        y = self.y[select]
+        base_vx = self.base_velocity_x[select]
+        base_vy = self.base_velocity_y[select]
+
+        template_id = self.template_id[select]
+        size = self.template_size[template_id]
+        speed = self.template_speed[template_id]
+        chase_range = self.template_chase_range[template_id]
+
+        # Chase blend toward the player when in range
+        dx = player.center_x - (x + size / 2)
+        dy = player.center_y - (y + size / 2)
+        distance = np.sqrt(dx * dx + dy * dy)
+        chasing = (distance <= chase_range) & (distance > 0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dir_x = dx / distance
+            dir_y = dy / distance
+        if field is not None:
+            flow_x, flow_y = field.directions(x + size / 2, y + size / 2)
+            flowing = (flow_x != 0) | (flow_y != 0)
+            dir_x = np.where(flowing, flow_x, dir_x)
+            dir_y = np.where(flowing, flow_y, dir_y)
+        player_vel_x = dir_x * speed * PLAYER_INFLUENCE
+        player_vel_y = dir_y * speed * PLAYER_INFLUENCE
+        self.velocity_x[select] = np.where(chasing, base_vx * (1 - PLAYER_INFLUENCE) + player_vel_x, base_vx)
+        self.velocity_y[select] = np.where(chasing, base_vy * (1 - PLAYER_INFLUENCE) + player_vel_y, base_vy)
+        return distance
+
+    def flock(self, chosen: np.ndarray, flocking: Flocking, tick: int = 0):
+        """Add separation/alignment to the velocities of the chosen slots (after steer)"""
+        n = self.count
+        template_id = self.template_id[:n]
+        size = self.template_size[template_id]
+        delta_x, delta_y = flocking.steer(chosen, self.x[:n] + size / 2, self.y[:n] + size / 2,
+                                          self.velocity_x[:n], self.velocity_y[:n], self.template_speed[template_id],
+                                          self.template_separation_radius[template_id],
+                                          self.template_separation_weight[template_id],
+                                          self.template_alignment_weight[template_id], tick)
+        self.velocity_x[chosen] += delta_x
+        self.velocity_y[chosen] += delta_y
+
+    def integrate(self, dt: float, screen_rect: pygame.Rect, rng: random.Random = random,
+                  field: FlowField = None):
+        """Vectorized Enemy.move on every slot: integrate, bounce off obstacles and walls, tick cooldowns"""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        vx = self.velocity_x[:n]
+        vy = self.velocity_y[:n]
+        base_vx = self.base_velocity_x[:n]
+        base_vy = self.base_velocity_y[:n]
+        size = self.template_size[self.template_id[:n]]
+
+        # Integrate position
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += vx * dt
+        y += vy * dt
+
+        # Obstacle bouncing
+        hit = None
+        if field is not None:
+            prev_x = self.prev_x[:n]
+            prev_y = self.prev_y[:n]
+            hit_x, hit_y = field.blocked_axes_many(x, y, prev_x, prev_y, size, size)
+            x[hit_x] = prev_x[hit_x]
+            base_vx[hit_x] = -base_vx[hit_x]
+            vx[hit_x] = -vx[hit_x]
+            y[hit_y] = prev_y[hit_y]
+            base_vy[hit_y] = -base_vy[hit_y]
+            vy[hit_y] = -vy[hit_y]
+            hit = hit_x | hit_y
+
+        # Wall bouncing
+        max_x = screen_rect.width - size - BOUNCE_MARGIN
+        max_y = screen_rect.height - size - BOUNCE_MARGIN
+        bounce_x = (x <= BOUNCE_MARGIN) | (x >= max_x)
+        bounce_y = (y <= BOUNCE_MARGIN) | (y >= max_y)
+
+        base_vx[bounce_x] = -base_vx[bounce_x]
+        vx[bounce_x] = -vx[bounce_x]
+        x[:] = np.where(bounce_x, np.maximum(BOUNCE_MARGIN, np.minimum(x, max_x)), x)
+
+        base_vy[bounce_y] = -base_vy[bounce_y]
+        vy[bounce_y] = -vy[bounce_y]
+        y[:] = np.where(bounce_y, np.maximum(BOUNCE_MARGIN, np.minimum(y, max_y)), y)
+
+        # Angle jitter uses scalar math so random draws and rounding match Enemy.update
+        bounced = bounce_x | bounce_y
+        if hit is not None:
+            bounced |= hit
+        for i in np.flatnonzero(bounced):
+            bvx = float(base_vx[i])
+            bvy = float(base_vy[i])
+            angle_variation = rng.uniform(-0.3, 0.3)
+            new_angle = math.atan2(bvy, bvx) + angle_variation
+            bounce_speed = math.sqrt(bvx**2 + bvy**2)
+            base_vx[i] = math.cos(new_angle) * bounce_speed
+            base_vy[i] = math.sin(new_angle) * bounce_speed
+
+        # Attack cooldowns
+        self.last_attack_time[:n] += dt
@@ -7,11 +7,15 @@ import math
 from typing import Tuple
 
 class Entity:
-    """Base class for all game entities (players, enemies, projectiles)"""
+    """Base class for all game entities (players and enemies)"""
+
+    __slots__ = ("x", "y", "prev_x", "prev_y", "width", "height", "velocity_x", "velocity_y", "alive", "color")
 
     def __init__(self, x: float, y: float, width: float, height: float):
         self.x = x
         self.y = y
+        self.prev_x = x  # Position before the last simulation tick, for render interpolation
+        self.prev_y = y
         self.width = width
         self.height = height
         self.velocity_x = 0.0
@@ -34,6 +38,17 @@ class Entity:
         """Pygame rectangle for collision detection"""
         return pygame.Rect(self.x, self.y, self.width, self.height)
 
+    def interpolated_position(self, alpha: float) -> Tuple[float, float]:
+        """Position alpha of the way from the previous tick's to the current one"""
+        if alpha >= 1.0:
+            return self.x, self.y
+        return self.prev_x + (self.x - self.prev_x) * alpha, self.prev_y + (self.y - self.prev_y) * alpha
+
+    def render_bounds(self, alpha: float = 1.0) -> pygame.Rect:
+        """Screen area SpriteBatchRenderer may draw into, padded for float truncation (used for dirty rects)"""
+        x, y = self.interpolated_position(alpha)
+        return pygame.Rect(x - 1, y - 1, self.width + 2, self.height + 2)
+
     def distance_to(self, other: 'Entity') -> float:
         """Calculate distance to another entity"""
         dx = self.center_x - other.center_x
@@ -59,13 +74,11 @@ class Entity:
 
     def update(self, dt: float):
         """Update entity position based on velocity and delta time"""
+        self.prev_x = self.x
+        self.prev_y = self.y
         self.x += self.velocity_x * dt
         self.y += self.velocity_y * dt
 
-    def render(self, screen: pygame.Surface):
-        """Render the entity (override in subclasses)"""
-        pygame.draw.rect(screen, self.color, self.rect)
-
     def collides_with(self, other: 'Entity') -> bool:
         """Check collision with another entity"""
         return self.rect.colliderect(other.rect)
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Boids-style separation and alignment for enemies, using a bucketed neighbor index
+"""
+
+import numpy as np
+from typing import Tuple
+from engine.profiler import Profiler
+
+# At most this many members of each of the four cells around an enemy are examined, which
+# bounds the per-tick cost even when a whole wave piles into a few cells. Fuller cells are
+# sampled through a window that moves on every tick, so every member gets seen in turn.
+DEFAULT_SAMPLE = 8
+
+# Packs signed cells into one int64 key (same layout as the projectile broadphase)
+_CELL_OFFSET = 1 << 20
+_BLOCK_CELLS = ((0, 0), (1, 0), (0, 1), (1, 1))
+
+def _cell_keys(cell_x: np.ndarray, cell_y: np.ndarray) -> np.ndarray:
+    return ((cell_x + _CELL_OFFSET) << 32) | (cell_y + _CELL_OFFSET)
+
+
+class NeighborIndex:
+    """Enemy centres sorted by grid cell, so each cell's members are one contiguous run
+
+    Cells are twice the query radius, so everything within the radius of a point lies in the
+    2x2 block of cells nearest to it: the point's own cell and the neighbors on the sides of
+    the half it sits in.
+    """
+
+    def __init__(self, sample: int = DEFAULT_SAMPLE):
+        self.sample = sample
+        self.cell_size = 1.0
+        self.block_x = np.zeros(0, dtype=np.int64)  # Top-left cell of each point's 2x2 block
+        self.block_y = np.zeros(0, dtype=np.int64)
+        self.order = np.zeros(0, dtype=np.intp)
+
+        # One entry per occupied cell: its key, and where its run starts in order
+        self.cell_keys = np.zeros(0, dtype=np.int64)
+        self.cell_starts = np.zeros(0, dtype=np.intp)
+        self.cell_counts = np.zeros(0, dtype=np.intp)
+
+    def rebuild(self, x: np.ndarray, y: np.ndarray, radius: float):
+        self.cell_size = 2.0 * radius
+        half_x = np.floor_divide(x, radius).astype(np.int64)
+        half_y = np.floor_divide(y, radius).astype(np.int64)
+        cell_x = half_x >> 1
+        cell_y = half_y >> 1
+        self.block_x = cell_x + (half_x & 1) - 1
+        self.block_y = cell_y + (half_y & 1) - 1
+        keys = _cell_keys(cell_x, cell_y)
+        self.order = np.argsort(keys, kind="stable")
+        self.cell_keys, self.cell_starts, self.cell_counts = np.unique(keys[self.order], return_index=True,
+                                                                       return_counts=True)
+
+    def pairs(self, indices: np.ndarray, tick: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """(owner, neighbor) candidate pairs for the given enemies; owner indexes into indices
+
+        Candidates are `sample` consecutive members (wrapping around) of each cell in an
+        enemy's block, starting tick * sample into the cell, so they include the enemy itself
+        and points beyond the radius; callers filter by distance.
+        """
+        block_x = self.block_x[indices]
+        block_y = self.block_y[indices]
+        starts = []
+        sizes = []
+        counts = []
+        last = len(self.cell_keys) - 1
+        for dx, dy in _BLOCK_CELLS:
+            keys = _cell_keys(block_x + dx, block_y + dy)
+            cell = np.minimum(np.searchsorted(self.cell_keys, keys), last)
+            occupied = self.cell_keys[cell] == keys
+            starts.append(self.cell_starts[cell])
+            sizes.append(self.cell_counts[cell])
+            counts.append(np.where(occupied, np.minimum(self.cell_counts[cell], self.sample), 0))
+        start = np.concatenate(starts)
+        size = np.concatenate(sizes)
+        count = np.concatenate(counts)
+        rotation = np.where(size > self.sample, tick * self.sample % size, 0)
+
+        total = int(count.sum())
+        owner = np.repeat(np.tile(np.arange(len(indices)), len(_BLOCK_CELLS)), count)
+        first = np.repeat(np.cumsum(count) - count, count)
+        offset = (np.repeat(rotation, count) + np.arange(total) - first) % np.repeat(size, count)
+        member = np.repeat(start, count) + offset
+        return owner, self.order[member]
+
+
+class Flocking:
+    """Adds separation (and optional alignment) to the velocity of enemies that just steered
+
+    Per-enemy settings come from the enemy templates: separation_radius, separation_weight
+    and alignment_weight. Separation pushes away from neighbors inside the radius, harder the
+    closer they are, scaled to at most separation_weight x move speed; alignment blends the
+    velocity toward the neighbors' average. The index is rebuilt once per tick over every
+    enemy, and only the enemies steering this tick query it.
+    """
+
+    def __init__(self, profiler: Profiler = None, sample: int = DEFAULT_SAMPLE):
+        self.index = NeighborIndex(sample)
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.pairs = 0  # Candidate pairs examined last tick
+
+    def steer(self, chosen: np.ndarray, center_x: np.ndarray, center_y: np.ndarray, velocity_x: np.ndarray,
+              velocity_y: np.ndarray, speed: np.ndarray, radius: np.ndarray, separation_weight: np.ndarray,
+              alignment_weight: np.ndarray, tick: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+        """Velocity change for each chosen enemy; every array argument covers all enemies
+
+        tick picks which members of crowded cells are sampled (see NeighborIndex.pairs).
+        """
+        self.pairs = 0
+        delta_x = np.zeros(len(chosen))
+        delta_y = np.zeros(len(chosen))
+        active = (radius[chosen] > 0) & ((separation_weight[chosen] != 0) | (alignment_weight[chosen] != 0))
+        if not active.any():
+            return delta_x, delta_y
+
+        with self.profiler.scope("separation"):
+            self.index.rebuild(center_x, center_y, max(1.0, float(radius.max())))
+            owner, neighbor = self.index.pairs(chosen, tick)
+            self.pairs = len(owner)
+            me = chosen[owner]
+
+            offset_x = center_x[me] - center_x[neighbor]
+            offset_y = center_y[me] - center_y[neighbor]
+            distance = np.sqrt(offset_x * offset_x + offset_y * offset_y)
+            reach = radius[me]
+            near = (distance < reach) & (neighbor != me)
+
+            # Separation: away from each neighbor, full strength at contact, fading to zero at the radius
+            # (pairs that are not near, or exactly on top of each other, get zero weight)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                falloff = np.where(near & (distance > 0), (1.0 - distance / reach) / distance, 0.0)
+            push_x = np.bincount(owner, weights=offset_x * falloff, minlength=len(chosen))
+            push_y = np.bincount(owner, weights=offset_y * falloff, minlength=len(chosen))
+            length = np.sqrt(push_x * push_x + push_y * push_y)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scale = np.where(length > 1.0, 1.0 / length, 1.0)
+            strength = separation_weight[chosen] * speed[chosen] * scale
+            delta_x += push_x * strength
+            delta_y += push_y * strength
+
+            # Alignment: toward the neighbors' mean velocity
+            if (alignment_weight[chosen] != 0).any():
+                owner, neighbor = owner[near], neighbor[near]
+                neighbors = np.bincount(owner, minlength=len(chosen))
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    mean_x = np.bincount(owner, weights=velocity_x[neighbor], minlength=len(chosen)) / neighbors
+                    mean_y = np.bincount(owner, weights=velocity_y[neighbor], minlength=len(chosen)) / neighbors
+                flocking = neighbors > 0
+                weight = alignment_weight[chosen]
+                delta_x += np.where(flocking, (mean_x - velocity_x[chosen]) * weight, 0.0)
+                delta_y += np.where(flocking, (mean_y - velocity_y[chosen]) * weight, 0.0)
+
+        delta_x[~active] = 0.0
+        delta_y[~active] = 0.0
+        return delta_x, delta_y
@@ -0,0 +1,212 @@
+"""
+Arena obstacles and a shared flow field that steers every enemy around them
+"""
+
+import math
+import numpy as np
+import pygame
+from typing import List, Tuple
+
+# Neighbour offsets (dx, dy), straight ones first so ties prefer them
+NEIGHBOURS = ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (-1, 1), (1, -1), (-1, -1))
+_DIAGONAL = math.sqrt(0.5)
+_UNIT_X = np.array([dx * (_DIAGONAL if dx and dy else 1.0) for dx, dy in NEIGHBOURS])
+_UNIT_Y = np.array([dy * (_DIAGONAL if dx and dy else 1.0) for dx, dy in NEIGHBOURS])
+
+OBSTACLE_COLOR = (70, 70, 110)
+OBSTACLE_EDGE_COLOR = (120, 120, 170)
+
+class FlowField:
+    """Grid of blocked cells plus one distance field toward the player
+
+    Obstacles come from data/arena.json as fractions of the arena size and are snapped to
+    whole cells, so the grid and the obstacle rects agree exactly. update() rebuilds the
+    field with a breadth-first wavefront from the player's cell, only when that cell
+    changes; each step of the wavefront is a handful of whole-grid array operations. Every
+    cell then stores a unit vector toward its lowest-distance neighbour, so steering an
+    enemy is a single lookup however many enemies there are.
+    """
+
+    def __init__(self, width: int, height: int, arena: dict):
+        self.cell_size = arena.get("cell_size", 32)
+        self.cols = max(1, math.ceil(width / self.cell_size))
+        self.rows = max(1, math.ceil(height / self.cell_size))
+
+        self.blocked = np.zeros((self.rows, self.cols), dtype=bool)
+        self.rects: List[pygame.Rect] = []
+        for obstacle in arena.get("obstacles", ()):
+            left = min(self.cols, max(0, round(obstacle["x"] * width / self.cell_size)))
+            top = min(self.rows, max(0, round(obstacle["y"] * height / self.cell_size)))
+            right = min(self.cols, max(left + 1, round((obstacle["x"] + obstacle["w"]) * width / self.cell_size)))
+            bottom = min(self.rows, max(top + 1, round((obstacle["y"] + obstacle["h"]) * height / self.cell_size)))
+            if left >= right or top >= bottom:
+                continue
+            self.blocked[top:bottom, left:right] = True
+            self.rects.append(pygame.Rect(left * self.cell_size, top * self.cell_size,
+                                          (right - left) * self.cell_size, (bottom - top) * self.cell_size))
+
+        # Obstacle edges as plain floats and as arrays, for the scalar and vectorized tests
+        self.bounds: List[Tuple[float, float, float, float]] = [
+            (float(rect.left), float(rect.top), float(rect.right), float(rect.bottom)) for rect in self.rects]
+        bounds = np.array(self.bounds, dtype=np.float64).reshape(-1, 4)
+        self.left, self.top, self.right, self.bottom = bounds.T.copy()
+
+        # Distance (in cells) to the goal and the unit step toward it; (0, 0) where there is none
+        self.distance = np.full((self.rows, self.cols), np.inf)
+        self.dir_x = np.zeros((self.rows, self.cols))
+        self.dir_y = np.zeros((self.rows, self.cols))
+        self.goal = None
+        self.rebuilds = 0
+
+    def cell(self, x: float, y: float) -> Tuple[int, int]:
+        """(col, row) of a point, clamped to the grid"""
+        col = min(self.cols - 1, max(0, int(x // self.cell_size)))
+        row = min(self.rows - 1, max(0, int(y // self.cell_size)))
+        return col, row
+
+    def update(self, x: float, y: float) -> bool:
+        """Retarget the field at a point; returns True if it had to be rebuilt"""
+        goal = self.cell(x, y)
+        if goal == self.goal:
+            return False
+        self.goal = goal
+        self._rebuild(*goal)
+        self.rebuilds += 1
+        return True
+
+    def _rebuild(self, goal_col: int, goal_row: int):
+        rows, cols = self.rows, self.cols
+        open_cells = ~self.blocked
+
+        # Breadth-first wavefront: grow the frontier one cell in each straight direction per step
+        distance = np.full((rows, cols), np.inf)
+        reached = np.zeros((rows, cols), dtype=bool)
+        frontier = np.zeros((rows, cols), dtype=bool)
+        grown = np.empty((rows, cols), dtype=bool)
+        frontier[goal_row, goal_col] = True
+        reached[goal_row, goal_col] = True
+        distance[goal_row, goal_col] = 0.0
+        step = 0
+        while True:
+            step += 1
+            grown[:] = False
+            grown[1:, :] |= frontier[:-1, :]
+            grown[:-1, :] |= frontier[1:, :]
+            grown[:, 1:] |= frontier[:, :-1]
+            grown[:, :-1] |= frontier[:, 1:]
+            np.logical_and(grown, open_cells, out=frontier)
+            frontier &= ~reached
+            if not frontier.any():
+                break
+            reached |= frontier
+            distance[frontier] = step
+        self.distance = distance
+
+        # Each cell points at its closest neighbour; diagonals may not cut an obstacle's corner
+        padded = np.full((rows + 2, cols + 2), np.inf)
+        padded[1:-1, 1:-1] = distance
+        passable = np.zeros((rows + 2, cols + 2), dtype=bool)
+        passable[1:-1, 1:-1] = open_cells
+        candidates = np.empty((len(NEIGHBOURS), rows, cols))
+        for k, (dx, dy) in enumerate(NEIGHBOURS):
+            candidates[k] = padded[1 + dy:1 + dy + rows, 1 + dx:1 + dx + cols]
+            if dx and dy:
+                corner_open = (passable[1 + dy:1 + dy + rows, 1:-1] & passable[1:-1, 1 + dx:1 + dx + cols])
+                candidates[k][~corner_open] = np.inf
+        best = candidates.argmin(axis=0)
+        downhill = np.take_along_axis(candidates, best[None], axis=0)[0] < distance
+        self.dir_x = np.where(downhill, _UNIT_X[best], 0.0)
+        self.dir_y = np.where(downhill, _UNIT_Y[best], 0.0)
+
+    def direction(self, x: float, y: float) -> Tuple[float, float]:
+        """Unit step toward the goal from a point; (0, 0) in the goal cell or where it is unreachable"""
+        col, row = self.cell(x, y)
+        return float(self.dir_x[row, col]), float(self.dir_y[row, col])
+
+    def directions(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized direction()"""
+        col = np.clip(np.floor_divide(x, self.cell_size), 0, self.cols - 1).astype(np.intp)
+        row = np.clip(np.floor_divide(y, self.cell_size), 0, self.rows - 1).astype(np.intp)
+        return self.dir_x[row, col], self.dir_y[row, col]
+
+    def overlaps(self, x: float, y: float, width: float, height: float) -> bool:
+        """Does this box overlap any obstacle?"""
+        for left, top, right, bottom in self.bounds:
+            if x < right and x + width > left and y < bottom and y + height > top:
+                return True
+        return False
+
+    def overlaps_many(self, x: np.ndarray, y: np.ndarray, width: np.ndarray, height: np.ndarray) -> np.ndarray:
+        """Vectorized overlaps() over many boxes"""
+        if not self.bounds:
+            return np.zeros(len(x), dtype=bool)
+        hit = ((x[:, None] < self.right) & ((x + width)[:, None] > self.left) &
+               (y[:, None] < self.bottom) & ((y + height)[:, None] > self.top))
+        return hit.any(axis=1)
+
+    def blocked_axes(self, x: float, y: float, prev_x: float, prev_y: float, width: float,
+                     height: float) -> Tuple[bool, bool]:
+        """Which axes of a move from (prev_x, prev_y) to (x, y) ran into an obstacle"""
+        if not self.overlaps(x, y, width, height):
+            return False, False
+        hit_x = self.overlaps(x, prev_y, width, height)
+        hit_y = self.overlaps(prev_x, y, width, height)
+        if not hit_x and not hit_y:
+            # Only the diagonal move is blocked (an obstacle corner)
+            return True, True
+        return hit_x, hit_y
+
+    def blocked_axes_many(self, x: np.ndarray, y: np.ndarray, prev_x: np.ndarray, prev_y: np.ndarray,
+                          width: np.ndarray, height: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized blocked_axes()"""
+        hit_x = self.overlaps_many(x, y, width, height)
+        hit_y = hit_x.copy()
+        hits = np.flatnonzero(hit_x)
+        if len(hits):
+            # Only the few boxes that hit anything need the per-axis tests
+            size_x, size_y = width[hits], height[hits]
+            along_x = self.overlaps_many(x[hits], prev_y[hits], size_x, size_y)
+            along_y = self.overlaps_many(prev_x[hits], y[hits], size_x, size_y)
+            corner = ~along_x & ~along_y
+            hit_x[hits] = along_x | corner
+            hit_y[hits] = along_y | corner
+        return hit_x, hit_y
+
+    def resolve(self, entity):
+        """Undo the parts of an entity's last move that went into an obstacle"""
+        hit_x, hit_y = self.blocked_axes(entity.x, entity.y, entity.prev_x, entity.prev_y,
+                                         entity.width, entity.height)
+        if hit_x:
+            entity.x = entity.prev_x
+        if hit_y:
+            entity.y = entity.prev_y
+
+    def blocked_points(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Which points lie inside an obstacle (points off the grid never do)"""
+        col = np.floor_divide(x, self.cell_size).astype(np.intp)
+        row = np.floor_divide(y, self.cell_size).astype(np.intp)
+        inside = (col >= 0) & (col < self.cols) & (row >= 0) & (row < self.rows)
+        result = np.zeros(len(x), dtype=bool)
+        result[inside] = self.blocked[row[inside], col[inside]]
+        return result
+
+    def blocked_segments(self, x0: np.ndarray, y0: np.ndarray, x1: np.ndarray, y1: np.ndarray) -> np.ndarray:
+        """Which segments from (x0, y0) to (x1, y1) pass through an obstacle
+
+        Points are tested every half cell along each segment, so a fast mover cannot step
+        over an obstacle between its start and end.
+        """
+        dx = x1 - x0
+        dy = y1 - y0
+        result = self.blocked_points(x1, y1)
+        reach = float(np.max(np.maximum(np.abs(dx), np.abs(dy)), initial=0.0))
+        steps = int(math.ceil(reach * 2 / self.cell_size))
+        for step in range(1, steps):
+            t = step / steps
+            result |= self.blocked_points(x0 + dx * t, y0 + dy * t)
+        return result
+
+    def render(self, surface: pygame.Surface):
+        for rect in self.rects:
+            pygame.draw.rect(surface, OBSTACLE_COLOR, rect)
+            pygame.draw.rect(surface, OBSTACLE_EDGE_COLOR, rect, 2)
@@ -0,0 +1,166 @@
+"""
+Per-tick player input and the providers that produce it
+"""
+
+import math
+import random
+import numpy as np
+import pygame
+from abc import ABC, abstractmethod
+from typing import List
+
+class InputState:
+    """Everything the player reads from input during one simulation tick"""
+
+    __slots__ = ("up", "down", "left", "right", "mouse_x", "mouse_y", "fire")
+
+    def __init__(self, up: bool = False, down: bool = False, left: bool = False, right: bool = False,
+                 mouse_x: int = 0, mouse_y: int = 0, fire: bool = False):
+        self.up = up
+        self.down = down
+        self.left = left
+        self.right = right
+        self.mouse_x = mouse_x
+        self.mouse_y = mouse_y
+        self.fire = fire
+
+    @property
+    def mouse_pos(self) -> tuple:
+        """Aim position in screen coordinates"""
+        return (self.mouse_x, self.mouse_y)
+
+    def copy(self) -> 'InputState':
+        return InputState(self.up, self.down, self.left, self.right,
+                          self.mouse_x, self.mouse_y, self.fire)
+
+
+class InputProvider(ABC):
+    """Source of InputState for ArenaScene - keyboard/mouse, a script, or a bot"""
+
+    @abstractmethod
+    def poll(self, scene) -> InputState:
+        """Input for the tick about to be simulated"""
+
+
+class PygameInputProvider(InputProvider):
+    """Live keyboard and mouse; fire follows the scene's left-button state"""
+
+    def poll(self, scene) -> InputState:
+        keys = pygame.key.get_pressed()
+        mouse_x, mouse_y = pygame.mouse.get_pos()
+        return InputState(
+            up=bool(keys[pygame.K_w] or keys[pygame.K_UP]),
+            down=bool(keys[pygame.K_s] or keys[pygame.K_DOWN]),
+            left=bool(keys[pygame.K_a] or keys[pygame.K_LEFT]),
+            right=bool(keys[pygame.K_d] or keys[pygame.K_RIGHT]),
+            mouse_x=mouse_x,
+            mouse_y=mouse_y,
+            fire=scene.mouse_pressed
+        )
+
+
+class ScriptedInputProvider(InputProvider):
+    """Plays back a fixed list of states, one per tick, then idles (or loops)"""
+
+    def __init__(self, states: List[InputState], loop: bool = False):
+        self.states = states
+        self.loop = loop
+        self.index = 0
+
+    def poll(self, scene) -> InputState:
+        if self.index >= len(self.states):
+            if not self.loop or not self.states:
+                return InputState()
+            self.index = 0
+
+        state = self.states[self.index]
+        self.index += 1
+        return state
+
+
+class RandomInputProvider(InputProvider):
+    """Mashes random movement and aim, holding each choice for a few ticks"""
+
+    def __init__(self, seed: int = None, hold_ticks: int = 15):
+        self.rng = random.Random(seed)
+        self.hold_ticks = hold_ticks
+        self.ticks_left = 0
+        self.state = InputState()
+
+    def poll(self, scene) -> InputState:
+        if self.ticks_left <= 0:
+            rng = self.rng
+            self.state = InputState(
+                up=rng.random() < 0.3,
+                down=rng.random() < 0.3,
+                left=rng.random() < 0.3,
+                right=rng.random() < 0.3,
+                mouse_x=rng.randrange(scene.screen_rect.width),
+                mouse_y=rng.randrange(scene.screen_rect.height),
+                fire=rng.random() < 0.7
+            )
+            self.ticks_left = self.hold_ticks
+        self.ticks_left -= 1
+        return self.state
+
+
+class BotInputProvider(InputProvider):
+    """Simple kiting bot: shoots the nearest enemy and backs away from anything too close"""
+
+    def __init__(self, flee_distance: float = 150):
+        self.flee_distance = flee_distance
+
+    def poll(self, scene) -> InputState:
+        player = scene.player
+        screen_rect = scene.screen_rect
+
+        nearest = self._nearest_enemy(scene)
+
+        if nearest is None:
+            # Drift back to the middle between waves
+            target_x, target_y = screen_rect.centerx, screen_rect.centery
+            dx = target_x - player.center_x
+            dy = target_y - player.center_y
+            return InputState(up=dy < -20, down=dy > 20, left=dx < -20, right=dx > 20,
+                              mouse_x=target_x, mouse_y=target_y, fire=False)
+
+        nearest_x, nearest_y, nearest_distance = nearest
+        state = InputState(mouse_x=int(nearest_x), mouse_y=int(nearest_y), fire=True)
+        if nearest_distance < self.flee_distance:
+            dx = player.center_x - nearest_x
+            dy = player.center_y - nearest_y
+            state.up = dy < 0
+            state.down = dy > 0
+            state.left = dx < 0
+            state.right = dx > 0
+        return state
+
+    def _nearest_enemy(self, scene):
+        """(center_x, center_y, distance) of the closest live enemy, or None; ties go to the earliest"""
+        player = scene.player
+        store = scene.enemy_store
+        if store is not None:
+            # Same arithmetic as Entity.distance_to, straight from the arrays
+            live = np.flatnonzero(store.alive[:store.count])
+            if len(live) == 0:
+                return None
+            half = store.template_size[store.template_id[live]] / 2
+            center_x = store.x[live] + half
+            center_y = store.y[live] + half
+            dx = player.center_x - center_x
+            dy = player.center_y - center_y
+            distance = np.sqrt(dx * dx + dy * dy)
+            best = int(np.argmin(distance))
+            return float(center_x[best]), float(center_y[best]), float(distance[best])
+
+        nearest = None
+        nearest_distance = math.inf
+        for enemy in scene.enemies:
+            if enemy.alive:
+                distance = player.distance_to(enemy)
+                if distance < nearest_distance:
+                    nearest = enemy
+                    nearest_distance = distance
+        if nearest is None:
+            return None
+        return nearest.center_x, nearest.center_y, nearest_distance
@@ -0,0 +1,228 @@
+"""
+Pooled hit-spark and death-burst particles in fixed-capacity arrays
+"""
+
+import math
+import numpy as np
+import pygame
+from typing import Dict, List, Tuple
+
+# Particles fade out over this many pre-rendered alpha steps
+FADE_LEVELS = 4
+
+# Dirty-rect bounds cover whole cells of this size around live particles rather than one rect each
+BOUNDS_CELL = 32
+
+# Used for any key missing from the "particles" section of tuning.json
+DEFAULT_PARTICLES = {
+    "enabled": True,
+    "budget": 4096,  # Hard cap on live particles (~3 ms to draw); the arrays are allocated once at this size
+    "drag": 3.0,  # Velocity lost per second, as an exponential rate
+    "emitters": {
+        "hit": {"count": 6, "cap": 1024, "speed": [60, 220], "life": [0.12, 0.3], "size": 2,
+                "color": [255, 230, 140]},
+        "death": {"count": 24, "cap": 3072, "speed": [40, 260], "life": [0.3, 0.8], "size": 3}
+    }
+}
+
+# Per-emitter fallbacks; an emitter without a color uses the one passed to emit()
+DEFAULT_EMITTER = {"count": 8, "cap": 1024, "speed": [50, 200], "life": [0.2, 0.5], "size": 2, "color": None}
+
+class Emitter:
+    """One named effect: particles per burst, their speed/life ranges and look, and a live cap"""
+
+    __slots__ = ("index", "count", "cap", "speed_min", "speed_max", "life_min", "life_max", "size", "color")
+
+    def __init__(self, index: int, config: dict):
+        config = dict(DEFAULT_EMITTER, **(config or {}))
+        self.index = index
+        self.count = max(0, int(config["count"]))
+        self.cap = max(0, int(config["cap"]))
+        self.speed_min, self.speed_max = config["speed"]
+        self.life_min, self.life_max = config["life"]
+        self.size = max(1, int(config["size"]))
+        self.color = tuple(config["color"]) if config["color"] is not None else None
+
+
+class ParticleSystem:
+    """Every live particle in preallocated parallel arrays, never more than the budget
+
+    Live particles occupy slots [0, count) as in ProjectileBatch. update() moves, slows,
+    ages and compacts all of them in one vectorized pass. A burst that would pass the
+    global budget or its emitter's cap is cut short instead of growing anything, so the
+    arrays are only reallocated when a hot reload changes the budget. Particles are purely
+    visual: they draw from their own random stream and are not part of the simulation digest.
+    """
+
+    FIELDS = ("x", "y", "prev_x", "prev_y", "velocity_x", "velocity_y", "life", "lifetime")
+
+    def __init__(self, config: dict = None, seed: int = None):
+        self.rng = np.random.default_rng(seed)
+
+        self.emitters: Dict[str, Emitter] = {}
+        self.live = np.zeros(0, dtype=np.int64)  # Live particles per emitter
+
+        self.capacity = 0
+        self.count = 0
+        for field in self.FIELDS:
+            setattr(self, field, np.zeros(0, dtype=np.float64))
+        self.emitter = np.zeros(0, dtype=np.int16)
+        self.style = np.zeros(0, dtype=np.int32)
+
+        # Distinct (color, size) looks, indexed by the style array
+        self.styles: List[Tuple[tuple, int]] = []
+        self._style_ids: Dict[Tuple[tuple, int], int] = {}
+
+        # Running totals: particles spawned, and ones a budget or cap turned away
+        self.emitted = 0
+        self.dropped = 0
+
+        self.apply_config(config)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def apply_config(self, config: dict = None):
+        """Take settings from the "particles" tuning section (at startup, and again on a data hot reload)
+
+        Live particles carry on under their emitter's name. Those of an emitter that is gone,
+        or past a smaller budget, are dropped.
+        """
+        config = dict(DEFAULT_PARTICLES, **(config or {}))
+        self.enabled = config["enabled"]
+        self.drag = config["drag"]
+        emitters = {name: Emitter(index, settings) for index, (name, settings) in enumerate(config["emitters"].items())}
+        capacity = max(0, int(config["budget"]))
+
+        remap = np.array([emitters[name].index if name in emitters else -1 for name in self.emitters],
+                         dtype=np.int64)
+        survivors = np.flatnonzero(remap[self.emitter[:self.count]] >= 0)[:capacity]
+        count = len(survivors)
+        for field in self.FIELDS + ("emitter", "style"):
+            old = getattr(self, field)
+            array = np.zeros(capacity, dtype=old.dtype)
+            array[:count] = old[survivors]
+            setattr(self, field, array)
+        self.emitter[:count] = remap[self.emitter[:count]]
+
+        self.emitters = emitters
+        self.capacity = capacity
+        self.count = count
+        self.live = np.bincount(self.emitter[:count], minlength=len(emitters))
+
+    def clear(self):
+        """Drop every live particle (new game)"""
+        self.count = 0
+        self.live[:] = 0
+
+    def emit(self, name: str, x: float, y: float, color: tuple = (255, 255, 255)) -> int:
+        """Spawn one burst of the named emitter at (x, y); returns how many particles it got"""
+        emitter = self.emitters.get(name)
+        if not self.enabled or emitter is None:
+            return 0
+        room = min(self.capacity - self.count, emitter.cap - int(self.live[emitter.index]))
+        count = max(0, min(emitter.count, room))
+        self.dropped += emitter.count - count
+        if count == 0:
+            return 0
+
+        rng = self.rng
+        angle = rng.uniform(0.0, 2.0 * math.pi, count)
+        speed = rng.uniform(emitter.speed_min, emitter.speed_max, count)
+        life = rng.uniform(emitter.life_min, emitter.life_max, count)
+
+        start = self.count
+        end = start + count
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.prev_x[start:end] = x
+        self.prev_y[start:end] = y
+        self.velocity_x[start:end] = np.cos(angle) * speed
+        self.velocity_y[start:end] = np.sin(angle) * speed
+        self.life[start:end] = life
+        self.lifetime[start:end] = life
+        self.emitter[start:end] = emitter.index
+        self.style[start:end] = self._style_id(emitter.color or tuple(color), emitter.size)
+
+        self.count = end
+        self.live[emitter.index] += count
+        self.emitted += count
+        return count
+
+    def _style_id(self, color: tuple, size: int) -> int:
+        key = (color, size)
+        style = self._style_ids.get(key)
+        if style is None:
+            style = self._style_ids[key] = len(self.styles)
+            self.styles.append(key)
+        return style
+
+    def update(self, dt: float):
+        """Advance, slow, age and cull every particle in one pass"""
+        n = self.count
+        if n == 0:
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        velocity_x = self.velocity_x[:n]
+        velocity_y = self.velocity_y[:n]
+        x += velocity_x * dt
+        y += velocity_y * dt
+        if self.drag:
+            slowdown = math.exp(-self.drag * dt)
+            velocity_x *= slowdown
+            velocity_y *= slowdown
+        life = self.life[:n]
+        life -= dt
+
+        keep = life > 0.0
+        if keep.all():
+            return
+        survivors = np.flatnonzero(keep)
+        count = len(survivors)
+        for field in self.FIELDS + ("emitter", "style"):
+            array = getattr(self, field)
+            array[:count] = array[survivors]
+        self.count = count
+        self.live = np.bincount(self.emitter[:count], minlength=len(self.emitters))
+
+    def sprite_layers(self, alpha: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """(sprite keys, lefts, tops) for every live particle, keys being style * FADE_LEVELS + fade level
+
+        alpha < 1 interpolates between the previous and current tick's positions.
+        """
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        if alpha < 1.0:
+            prev_x = self.prev_x[:n]
+            prev_y = self.prev_y[:n]
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        style = self.style[:n]
+        half = np.array([size // 2 for _, size in self.styles], dtype=np.int64)[style]
+        level = np.minimum((self.life[:n] / self.lifetime[:n] * FADE_LEVELS).astype(np.int64), FADE_LEVELS - 1)
+        return style * FADE_LEVELS + level, x.astype(np.int64) - half, y.astype(np.int64) - half
+
+    def render_bounds(self, alpha: float = 1.0) -> List[pygame.Rect]:
+        """One rect per BOUNDS_CELL cell holding a particle, grown by the largest sprite"""
+        if self.count == 0:
+            return []
+        _, x, y = self.sprite_layers(alpha)
+        cells = np.unique(np.stack((x // BOUNDS_CELL, y // BOUNDS_CELL), axis=1), axis=0)
+        reach = max(size for _, size in self.styles)
+        return [pygame.Rect(col * BOUNDS_CELL, row * BOUNDS_CELL, BOUNDS_CELL + reach, BOUNDS_CELL + reach)
+                for col, row in cells.tolist()]
+
+    def stats(self) -> dict:
+        """Budget usage, in the spirit of Pool.stats()"""
+        return {
+            "live": self.count,
+            "budget": self.capacity,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "per_emitter": {name: int(self.live[emitter.index]) for name, emitter in self.emitters.items()}
+        }
@@ -5,17 +5,28 @@ Player entity with movement and shooting capabilities
 import pygame
 import math
 from engine.entity import Entity
-from engine.projectile import Projectile
-from typing import List
+from engine.projectile_engine import ProjectileEngine, PROJECTILE_SIZE
+from engine.input import InputState
 
 class Player(Entity):
     """Player character with WASD movement and mouse shooting"""
 
+    __slots__ = ("max_health", "max_mana", "move_speed", "mana_regen", "projectile_cost",
+                 "projectile_speed", "projectile_damage", "health", "mana")
+
     def __init__(self, x: float, y: float, tuning_data: dict):
         super().__init__(x, y, 32, 32)  # 32x32 player
         self.color = (0, 100, 255)  # Blue player
 
         # Player stats from tuning data
+        self.apply_tuning(tuning_data)
+
+        # Current stats
+        self.health = self.max_health
+        self.mana = self.max_mana
+
+    def apply_tuning(self, tuning_data: dict):
+        """Take stats from the "player" tuning section (at spawn, and again on a data hot reload)"""
         config = tuning_data.get("player", {})
         self.max_health = config.get("max_health", 100)
         self.max_mana = config.get("max_mana", 50)
@@ -25,28 +36,20 @@ class Player(Entity):
         self.projectile_speed = config.get("projectile_speed", 500)
         self.projectile_damage = config.get("projectile_damage", 25)
 
-        # Current stats
-        self.health = self.max_health
-        self.mana = self.max_mana
-
-        # Input state
-        self.keys_pressed = set()
-
-    def handle_input(self, keys: pygame.key.ScancodeWrapper, mouse_pos: tuple, mouse_pressed: bool,
-                    projectiles: List[Projectile], screen_rect: pygame.Rect):
+    def handle_input(self, input_state: InputState, projectiles: ProjectileEngine, screen_rect: pygame.Rect):
         """Handle player input for movement and shooting"""
 
         # Movement input
         self.velocity_x = 0
         self.velocity_y = 0
 
-        if keys[pygame.K_w] or keys[pygame.K_UP]:
+        if input_state.up:
             self.velocity_y -= self.move_speed
-        if keys[pygame.K_s] or keys[pygame.K_DOWN]:
+        if input_state.down:
             self.velocity_y += self.move_speed
-        if keys[pygame.K_a] or keys[pygame.K_LEFT]:
+        if input_state.left:
             self.velocity_x -= self.move_speed
-        if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
+        if input_state.right:
             self.velocity_x += self.move_speed
 
         # Normalize diagonal movement
@@ -56,10 +59,10 @@ class Player(Entity):
             self.velocity_y *= factor
 
         # Shooting input
-        if mouse_pressed and self.mana >= self.projectile_cost:
-            self.shoot(mouse_pos, projectiles)
+        if input_state.fire and self.mana >= self.projectile_cost:
+            self.shoot(input_state.mouse_pos, projectiles)
 
-    def shoot(self, target_pos: tuple, projectiles: List[Projectile]):
+    def shoot(self, target_pos: tuple, projectiles: ProjectileEngine):
         """Create a projectile towards the target position"""
         if self.mana < self.projectile_cost:
             return
@@ -75,13 +78,13 @@ class Player(Entity):
             vel_y = (dy / distance) * self.projectile_speed
 
             # Create projectile
-            projectile = Projectile(
-                self.center_x - 4, self.center_y - 4,  # Center on player
+            offset = PROJECTILE_SIZE / 2
+            projectiles.spawn(
+                self.center_x - offset, self.center_y - offset,  # Center on player
                 vel_x, vel_y,
                 self.projectile_damage,
                 friendly=True
             )
-            projectiles.append(projectile)
 
             # Consume mana
             self.mana -= self.projectile_cost
@@ -105,21 +108,7 @@ class Player(Entity):
             self.health = 0
             self.alive = False
 
-    def render(self, screen: pygame.Surface):
-        """Render player with health indicator"""
-        # Draw player body
-        pygame.draw.rect(screen, self.color, self.rect)
-
-        # Draw health bar above player
-        bar_width = self.width
-        bar_height = 6
-        bar_x = self.x
-        bar_y = self.y - 10
-
-        # Background (red)
-        pygame.draw.rect(screen, (255, 0, 0), (bar_x, bar_y, bar_width, bar_height))
-
-        # Health (green)
-        health_ratio = self.health / self.max_health
-        health_width = bar_width * health_ratio
-        pygame.draw.rect(screen, (0, 255, 0), (bar_x, bar_y, health_width, bar_height))
\ No newline at end of file
+    def render_bounds(self, alpha: float = 1.0) -> pygame.Rect:
+        """Body plus the health bar 10px above it"""
+        x, y = self.interpolated_position(alpha)
+        return pygame.Rect(x - 1, y - 11, self.width + 2, self.height + 12)
@@ -0,0 +1,55 @@
+"""
+Generic free-list object pool
+"""
+
+from typing import Dict, List
+
+class Pool:
+    """Recycles instances of a class instead of leaving dead ones to the GC
+
+    The pooled class must implement reset(*args, **kwargs), which fully re-initializes an
+    instance; acquire() forwards its arguments to it. Brand-new instances are created with
+    cls.__new__ and initialized through the same reset hook, so pooled and fresh objects
+    always start from identical state.
+    """
+
+    def __init__(self, cls: type, prefill: int = 0):
+        self.cls = cls
+        self.free: List = [cls.__new__(cls) for _ in range(prefill)]
+
+        # Statistics for sizing pools per tuning profile
+        self.live = 0
+        self.high_water = 0
+        self.hits = 0
+        self.misses = 0
+
+    def acquire(self, *args, **kwargs):
+        """Take an instance from the free list (or allocate one) and reset it"""
+        if self.free:
+            obj = self.free.pop()
+            self.hits += 1
+        else:
+            obj = self.cls.__new__(self.cls)
+            self.misses += 1
+
+        obj.reset(*args, **kwargs)
+
+        self.live += 1
+        if self.live > self.high_water:
+            self.high_water = self.live
+        return obj
+
+    def release(self, obj):
+        """Return an instance to the free list; the caller must drop its references"""
+        self.free.append(obj)
+        self.live -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """Usage counters: live, free, high_water, hits, misses"""
+        return {
+            "live": self.live,
+            "free": len(self.free),
+            "high_water": self.high_water,
+            "hits": self.hits,
+            "misses": self.misses
+        }
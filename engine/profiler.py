@@ -0,0 +1,203 @@
+"""
+Lightweight frame profiler with scoped timers, a live overlay and Chrome trace export
+"""
+
+import json
+import time
+import pygame
+from collections import defaultdict
+from typing import Dict, List
+from engine.text_cache import default_text_cache
+
+class _NullScope:
+    """Shared do-nothing context manager handed out while profiling is disabled"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+_NULL_SCOPE = _NullScope()
+
+class _Scope:
+    """Times one block and writes it to the profiler's ring buffer on exit"""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: 'Profiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler.record(self.name, self.start, time.perf_counter() - self.start)
+        return False
+
+
+class Profiler:
+    """Records named timings into fixed-size ring buffers
+
+    Disabled profilers hand out a shared null context manager, so instrumented code costs
+    one method call per scope when profiling is off.
+    """
+
+    def __init__(self, enabled: bool = False, capacity: int = 8192, frame_history: int = 240):
+        self.enabled = enabled
+
+        # Scope records, oldest overwritten first
+        self.capacity = capacity
+        self.names: List[str] = [""] * capacity
+        self.starts: List[float] = [0.0] * capacity
+        self.durations: List[float] = [0.0] * capacity
+        self.frames: List[int] = [0] * capacity
+        self.head = 0
+        self.size = 0
+
+        # Per-frame history for the overlay graph and per-system breakdown
+        self.frame_history = frame_history
+        self.frame_times: List[float] = [0.0] * frame_history
+        self.frame_totals: List[Dict[str, float]] = [{} for _ in range(frame_history)]
+        self.frame_index = 0
+        self.frame_count = 0
+        self.frame_start = None
+
+        # Totals for the frame in progress, published by end_frame()
+        self.current = defaultdict(float)
+        self.last_frame: Dict[str, float] = {}
+
+    def scope(self, name: str):
+        """Context manager timing the enclosed block under name"""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def record(self, name: str, start: float, duration: float):
+        """Store one timing; also used directly by callers that time themselves"""
+        head = self.head
+        self.names[head] = name
+        self.starts[head] = start
+        self.durations[head] = duration
+        self.frames[head] = self.frame_count
+        self.head = (head + 1) % self.capacity
+        if self.size < self.capacity:
+            self.size += 1
+        self.current[name] += duration
+
+    def begin_frame(self):
+        if self.enabled:
+            self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Close the frame: publish its per-system totals and its duration"""
+        if not self.enabled or self.frame_start is None:
+            return
+
+        slot = self.frame_index
+        self.frame_times[slot] = time.perf_counter() - self.frame_start
+        self.last_frame = dict(self.current)
+        self.frame_totals[slot] = self.last_frame
+        self.current.clear()
+        self.frame_index = (slot + 1) % self.frame_history
+        self.frame_count += 1
+        self.frame_start = None
+
+    def toggle(self):
+        """Switch recording on or off, dropping any half-finished frame"""
+        self.enabled = not self.enabled
+        self.frame_start = None
+        self.current.clear()
+
+    def recent_frame_times(self) -> List[float]:
+        """Frame durations in seconds, oldest first"""
+        count = min(self.frame_count, self.frame_history)
+        start = (self.frame_index - count) % self.frame_history
+        return [self.frame_times[(start + i) % self.frame_history] for i in range(count)]
+
+    def average_breakdown(self, frames: int = 60) -> Dict[str, float]:
+        """Mean seconds per frame spent in each scope over the last few frames"""
+        count = min(frames, self.frame_count, self.frame_history)
+        if count == 0:
+            return {}
+
+        totals = defaultdict(float)
+        for i in range(1, count + 1):
+            for name, duration in self.frame_totals[(self.frame_index - i) % self.frame_history].items():
+                totals[name] += duration
+        return {name: total / count for name, total in totals.items()}
+
+    def export_chrome_trace(self, path: str):
+        """Write the ring buffer as Chrome trace event JSON (chrome://tracing, Perfetto)"""
+        start = (self.head - self.size) % self.capacity
+        events = []
+        for i in range(self.size):
+            slot = (start + i) % self.capacity
+            events.append({
+                "name": self.names[slot],
+                "ph": "X",
+                "ts": self.starts[slot] * 1e6,
+                "dur": self.durations[slot] * 1e6,
+                "pid": 1,
+                "tid": 1,
+                "args": {"frame": self.frames[slot]}
+            })
+
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+class ProfilerOverlay:
+    """Live frame-time graph and per-system breakdown drawn over the game"""
+
+    def __init__(self):
+        self.visible = False
+        self.font = default_text_cache().font(20)
+        self.bg_color = (10, 10, 20)
+        self.text_color = (230, 230, 230)
+        self.graph_color = (100, 220, 120)
+        self.budget_color = (255, 90, 90)
+
+        self.width = 260
+        self.graph_height = 60
+        self.frame_budget = 1.0 / 60.0
+
+    def render(self, screen: pygame.Surface, profiler: Profiler):
+        if not self.visible:
+            return
+
+        breakdown = sorted(profiler.average_breakdown().items(), key=lambda item: item[1], reverse=True)
+        height = self.graph_height + 30 + 18 * len(breakdown)
+        x = screen.get_width() - self.width - 10
+        y = 110
+
+        panel = pygame.Surface((self.width, height))
+        panel.set_alpha(200)
+        panel.fill(self.bg_color)
+        screen.blit(panel, (x, y))
+
+        # Frame-time graph, scaled so the 60 FPS budget sits at half height
+        frame_times = profiler.recent_frame_times()
+        scale = (self.graph_height / 2) / self.frame_budget
+        graph_bottom = y + self.graph_height + 5
+        budget_y = graph_bottom - self.frame_budget * scale
+        pygame.draw.line(screen, self.budget_color, (x, budget_y), (x + self.width, budget_y))
+        if len(frame_times) > 1:
+            step = self.width / (profiler.frame_history - 1)
+            points = [(x + i * step, graph_bottom - min(t * scale, self.graph_height))
+                      for i, t in enumerate(frame_times)]
+            pygame.draw.lines(screen, self.graph_color, False, points)
+
+        # Per-system breakdown
+        last = frame_times[-1] * 1000 if frame_times else 0.0
+        text_y = graph_bottom + 5
+        header = self.font.render(f"frame {last:.2f} ms", True, self.text_color)
+        screen.blit(header, (x + 5, text_y))
+        for name, seconds in breakdown:
+            text_y += 18
+            line = self.font.render(f"{name:<18} {seconds * 1000:6.2f} ms", True, self.text_color)
+            screen.blit(line, (x + 5, text_y))
@@ -0,0 +1,308 @@
+"""
+Array-backed projectile engine with batched movement and culling
+"""
+
+import math
+import numpy as np
+import pygame
+from typing import Collection, Dict, List, Tuple
+from engine.flow_field import FlowField
+
+PROJECTILE_SIZE = 8
+PROJECTILE_LIFETIME = 3.0  # Seconds before auto-destroy
+FRIENDLY_COLOR = (255, 255, 0)  # Yellow for player
+HOSTILE_COLOR = (255, 100, 100)  # Red for enemy
+
+# Projectiles this far outside the screen are culled
+OFFSCREEN_MARGIN = 50
+
+# Batches up to this size take the scalar path in ProjectileBatch.candidates
+SMALL_BATCH = 64
+
+# Packs signed grid cells (within +/-2**20) into one int64 key for vectorized membership tests
+_CELL_OFFSET = 1 << 20
+
+def _cell_keys(cell_x: np.ndarray, cell_y: np.ndarray) -> np.ndarray:
+    return ((cell_x + _CELL_OFFSET) << 32) | (cell_y + _CELL_OFFSET)
+
+def sweep_boxes(ax, ay, a_dx, a_dy, a_width, a_height, bx, by, b_dx, b_dy, b_width, b_height) -> np.ndarray:
+    """Swept AABB test: the fraction of the tick (0-1) at which box a first overlaps box b
+
+    Each box starts at its (x, y) and moves by its (dx, dy) over the tick; boxes already
+    overlapping give 0 and boxes that never touch give infinity. Arguments are arrays (or
+    scalars) broadcast together. Edges that only touch do not count, matching Rect.colliderect.
+    """
+    enter = []
+    leave = []
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for a, da, a_size, b, db, b_size in ((ax, a_dx, a_width, bx, b_dx, b_width),
+                                             (ay, a_dy, a_height, by, b_dy, b_height)):
+            velocity = np.asarray(da - db, dtype=np.float64)
+            gap_start = (b - (a + a_size)) / velocity  # When a's far edge reaches b's near edge
+            gap_end = (b + b_size - a) / velocity  # When a's near edge passes b's far edge
+            overlapping = (a < b + b_size) & (a + a_size > b)
+            enter.append(np.where(velocity == 0, np.where(overlapping, -np.inf, np.inf),
+                                  np.minimum(gap_start, gap_end)))
+            leave.append(np.where(velocity == 0, np.where(overlapping, np.inf, -np.inf),
+                                  np.maximum(gap_start, gap_end)))
+    first = np.maximum(enter[0], enter[1])
+    last = np.minimum(leave[0], leave[1])
+    touching = (first < last) & (first <= 1.0) & (last > 0.0)
+    return np.where(touching, np.maximum(first, 0.0), np.inf)
+
+
+class ProjectileBatch:
+    """One partition of projectiles stored in preallocated parallel arrays
+
+    Live projectiles always occupy slots [0, count). Removal compacts survivors to the
+    front, so there is never a list copy or per-element list.remove.
+    """
+
+    FIELDS = ("x", "y", "prev_x", "prev_y", "velocity_x", "velocity_y", "damage", "age", "lifetime")
+
+    def __init__(self, capacity: int, color: tuple):
+        self.capacity = capacity
+        self.count = 0
+
+        # Pool statistics, same keys as Pool.stats()
+        self.high_water = 0
+        self.hits = 0
+        self.misses = 0
+        self.color = color
+        self.width = PROJECTILE_SIZE
+        self.height = PROJECTILE_SIZE
+
+        for field in self.FIELDS:
+            setattr(self, field, np.zeros(capacity, dtype=np.float64))
+        self.alive = np.zeros(capacity, dtype=bool)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _grow(self):
+        """Double capacity, keeping existing slots"""
+        new_capacity = self.capacity * 2
+        for field in self.FIELDS + ("alive",):
+            old = getattr(self, field)
+            new = np.zeros(new_capacity, dtype=old.dtype)
+            new[:self.capacity] = old
+            setattr(self, field, new)
+        self.capacity = new_capacity
+
+    def push(self, x: float, y: float, vel_x: float, vel_y: float, damage: float,
+             lifetime: float = PROJECTILE_LIFETIME) -> int:
+        """Append a projectile and return its slot"""
+        if self.count == self.capacity:
+            self._grow()
+            self.misses += 1
+        else:
+            self.hits += 1
+
+        index = self.count
+        self.count += 1
+        if self.count > self.high_water:
+            self.high_water = self.count
+        self.x[index] = x
+        self.y[index] = y
+        self.prev_x[index] = x
+        self.prev_y[index] = y
+        self.velocity_x[index] = vel_x
+        self.velocity_y[index] = vel_y
+        self.damage[index] = damage
+        self.age[index] = 0.0
+        self.lifetime[index] = lifetime
+        self.alive[index] = True
+        return index
+
+    def update(self, dt: float, screen_rect: pygame.Rect, obstacles: FlowField = None):
+        """Advance, age and cull every projectile in one pass (including any that hit an obstacle)"""
+        n = self.count
+        if n == 0:
+            return
+
+        x = self.x[:n]
+        y = self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.velocity_x[:n] * dt
+        y += self.velocity_y[:n] * dt
+        age = self.age[:n]
+        age += dt
+
+        keep = (self.alive[:n] & (age < self.lifetime[:n]) &
+                (x >= -OFFSCREEN_MARGIN) & (x <= screen_rect.width + OFFSCREEN_MARGIN) &
+                (y >= -OFFSCREEN_MARGIN) & (y <= screen_rect.height + OFFSCREEN_MARGIN))
+        if obstacles is not None:
+            # The whole path of each shot's center this tick, so thin walls stop fast shots too
+            half_x = self.width / 2
+            half_y = self.height / 2
+            keep &= ~obstacles.blocked_segments(self.prev_x[:n] + half_x, self.prev_y[:n] + half_y,
+                                                x + half_x, y + half_y)
+
+        if keep.all():
+            return
+
+        survivors = np.flatnonzero(keep)
+        kept = len(survivors)
+        for field in self.FIELDS + ("alive",):
+            array = getattr(self, field)
+            array[:kept] = array[survivors]
+        self.alive[kept:n] = False
+        self.count = kept
+
+    def candidates(self, occupied_cells: Collection, cell_size: float, swept: bool = False) -> np.ndarray:
+        """Indices of live projectiles touching any occupied broadphase cell
+
+        With swept=True each projectile's bounds cover its whole move this tick, from
+        (prev_x, prev_y) to (x, y), however many cells that crosses.
+        """
+        n = self.count
+        if n == 0 or not occupied_cells:
+            return np.zeros(0, dtype=np.intp)
+
+        inv = 1.0 / cell_size
+
+        # Below this size NumPy's per-call overhead outweighs a plain loop over the cells
+        if n <= SMALL_BATCH:
+            found = []
+            alive = self.alive[:n].tolist()
+            bounds = zip(*(array.tolist() for array in self.swept_bounds(swept)))
+            for i, (min_x, min_y, max_x, max_y) in enumerate(bounds):
+                if not alive[i]:
+                    continue
+                min_cx = math.floor(min_x * inv)
+                max_cx = math.floor(max_x * inv)
+                min_cy = math.floor(min_y * inv)
+                max_cy = math.floor(max_y * inv)
+                if any((cx, cy) in occupied_cells
+                       for cx in range(min_cx, max_cx + 1) for cy in range(min_cy, max_cy + 1)):
+                    found.append(i)
+            return np.array(found, dtype=np.intp)
+
+        occupied = np.fromiter((_cell_keys(cx, cy) for cx, cy in occupied_cells), dtype=np.int64)
+
+        min_x, min_y, max_x, max_y = self.swept_bounds(swept)
+        min_cx = np.floor(min_x * inv).astype(np.int64)
+        max_cx = np.floor(max_x * inv).astype(np.int64)
+        min_cy = np.floor(min_y * inv).astype(np.int64)
+        max_cy = np.floor(max_y * inv).astype(np.int64)
+
+        # Test every cell offset up to the widest span in the batch; a still projectile spans
+        # at most 2x2 cells, so this is four tests unless something moved more than a cell
+        span_x = max_cx - min_cx
+        span_y = max_cy - min_cy
+        hit = np.zeros(n, dtype=bool)
+        for offset_x in range(int(span_x.max()) + 1):
+            for offset_y in range(int(span_y.max()) + 1):
+                inside = (span_x >= offset_x) & (span_y >= offset_y)
+                hit |= inside & np.isin(_cell_keys(min_cx + offset_x, min_cy + offset_y), occupied)
+        hit &= self.alive[:n]
+        return np.flatnonzero(hit)
+
+    def swept_bounds(self, swept: bool = True):
+        """(min_x, min_y, max_x, max_y) arrays of each projectile's box, over its whole move if swept"""
+        n = self.count
+        x = self.x[:n]
+        y = self.y[:n]
+        if not swept:
+            return x, y, x + self.width, y + self.height
+        prev_x = self.prev_x[:n]
+        prev_y = self.prev_y[:n]
+        return (np.minimum(x, prev_x), np.minimum(y, prev_y),
+                np.maximum(x, prev_x) + self.width, np.maximum(y, prev_y) + self.height)
+
+    def sweep(self, indices: np.ndarray, targets: List) -> List[Tuple[int, object]]:
+        """Every (projectile index, target) pair that touches during this tick, in hit order
+
+        Pairs come back grouped by projectile in ascending index order and, within a
+        projectile, by the time of first contact, so the first live target listed is the one
+        it actually reached first. Targets need x, y, prev_x, prev_y, width and height.
+        """
+        if not targets:
+            return []
+        indices = np.asarray(indices, dtype=np.intp)
+        columns = np.array([(target.prev_x, target.prev_y, target.x, target.y, target.width, target.height)
+                            for target in targets], dtype=np.float64).T
+        target_x, target_y, target_end_x, target_end_y, target_width, target_height = columns
+
+        start_x = self.prev_x[indices]
+        start_y = self.prev_y[indices]
+        times = sweep_boxes(start_x, start_y, self.x[indices] - start_x, self.y[indices] - start_y,
+                            self.width, self.height, target_x, target_y, target_end_x - target_x,
+                            target_end_y - target_y, target_width, target_height)
+
+        hits = np.flatnonzero(times <= 1.0)
+        hits = hits[np.lexsort((hits, times[hits], indices[hits]))]
+        return [(int(indices[k]), targets[k]) for k in hits.tolist()]
+
+    def clear(self):
+        """Remove every projectile"""
+        self.alive[:self.count] = False
+        self.count = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Usage counters: live, free, high_water, hits, misses (a miss is a capacity doubling)"""
+        return {
+            "live": self.count,
+            "free": self.capacity - self.count,
+            "high_water": self.high_water,
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+    def sprite_positions(self, alpha: float = 1.0):
+        """Top-left corners, as (xs, ys) lists, of the (2r+1)-square box around each live circle
+
+        alpha < 1 interpolates between the previous and current tick's positions.
+        """
+        n = self.count
+        if n == 0:
+            return [], []
+
+        radius = self.width // 2
+        live = np.flatnonzero(self.alive[:n])
+        x = self.x[live]
+        y = self.y[live]
+        if alpha < 1.0:
+            prev_x = self.prev_x[live]
+            prev_y = self.prev_y[live]
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        left = (x + self.width / 2).astype(np.int64) - radius
+        top = (y + self.height / 2).astype(np.int64) - radius
+        return left.tolist(), top.tolist()
+
+    def render_bounds(self, alpha: float = 1.0) -> list:
+        """Rects covering every circle SpriteBatchRenderer draws"""
+        size = (self.width // 2) * 2 + 1
+        return [pygame.Rect(x, y, size, size) for x, y in zip(*self.sprite_positions(alpha))]
+
+
+class ProjectileEngine:
+    """All projectiles in the arena, partitioned into friendly and hostile batches"""
+
+    def __init__(self, capacity: int = 1024):
+        self.friendly = ProjectileBatch(capacity, FRIENDLY_COLOR)
+        self.hostile = ProjectileBatch(capacity, HOSTILE_COLOR)
+
+    def __len__(self) -> int:
+        return self.friendly.count + self.hostile.count
+
+    def spawn(self, x: float, y: float, vel_x: float, vel_y: float, damage: float,
+              friendly: bool = True, lifetime: float = PROJECTILE_LIFETIME) -> int:
+        """Fire a projectile (used by Player.shoot and enemy ranged attacks)"""
+        batch = self.friendly if friendly else self.hostile
+        return batch.push(x, y, vel_x, vel_y, damage, lifetime)
+
+    def update(self, dt: float, screen_rect: pygame.Rect, obstacles: FlowField = None):
+        """Advance both partitions"""
+        self.friendly.update(dt, screen_rect, obstacles)
+        self.hostile.update(dt, screen_rect, obstacles)
+
+    def clear(self):
+        """Remove every projectile"""
+        self.friendly.clear()
+        self.hostile.clear()
+
+    def render_bounds(self, alpha: float = 1.0) -> list:
+        return self.friendly.render_bounds(alpha) + self.hostile.render_bounds(alpha)
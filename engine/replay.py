@@ -0,0 +1,223 @@
+"""
+Compact binary recording and playback of per-tick player input
+"""
+
+import json
+import struct
+import zlib
+from typing import Iterator, Optional, Tuple
+from engine.input import InputProvider, InputState
+
+MAGIC = b"RRRP"
+VERSION = 1
+HEADER = struct.Struct("<4sBQdHHI")  # magic, version, seed, dt, width, height, tuning crc32
+
+# Tick byte layout. With RUN_BIT set, the low 7 bits are (repeat count - 1) of the previous tick.
+RUN_BIT = 0x80
+MAX_RUN = 128
+UP, DOWN, LEFT, RIGHT, FIRE = 0x01, 0x02, 0x04, 0x08, 0x10
+MOUSE_DELTA = 0x20  # Followed by zigzag varints dx, dy
+EXTENDED = 0x40  # Followed by one extended-flags byte
+
+# Extended flags
+EXT_RESTART = 0x01  # ArenaScene.restart_game ran before this tick
+EXT_RESIZE = 0x02  # Followed by varints width, height; ArenaScene.resize ran before this tick
+EXT_END = 0x04  # End of stream, followed by a varint tick count and a 32-byte state digest
+
+def tuning_crc(tuning_data: dict) -> int:
+    """Fingerprint of the tuning a run was recorded with"""
+    return zlib.crc32(json.dumps(tuning_data, sort_keys=True).encode())
+
+def _write_varint(out: bytearray, value: int):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+def _zigzag(value: int) -> int:
+    return (value << 1) ^ (value >> 63)
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+class ReplayRecorder:
+    """Encodes one input record per simulated tick, delta- and run-length compressed"""
+
+    def __init__(self, seed: int, dt: float, width: int, height: int, tuning_data: dict):
+        self.data = bytearray(HEADER.pack(MAGIC, VERSION, seed, dt, width, height, tuning_crc(tuning_data)))
+        self.ticks = 0
+
+        self.last_flags = None
+        self.last_mouse = (0, 0)
+        self.run_length = 0
+        self.pending_ext = 0
+        self.pending_size = None
+
+    @classmethod
+    def for_scene(cls, scene, dt: float) -> 'ReplayRecorder':
+        """Create a recorder matching a scene's seed, size and tuning, and attach it"""
+        recorder = cls(scene.seed, dt, scene.screen_rect.width, scene.screen_rect.height, scene.tuning_data)
+        scene.replay_recorder = recorder
+        return recorder
+
+    def mark_restart(self):
+        """Note that the scene restarted before the next tick"""
+        self.pending_ext |= EXT_RESTART
+
+    def mark_resize(self, width: int, height: int):
+        """Note that the arena was resized before the next tick"""
+        self.pending_ext |= EXT_RESIZE
+        self.pending_size = (width, height)
+
+    def record(self, input_state: Optional[InputState]):
+        """Append one tick; None means the scene took no input (dead player)"""
+        self.ticks += 1
+
+        flags = 0
+        mouse = self.last_mouse
+        if input_state is not None:
+            if input_state.up:
+                flags |= UP
+            if input_state.down:
+                flags |= DOWN
+            if input_state.left:
+                flags |= LEFT
+            if input_state.right:
+                flags |= RIGHT
+            if input_state.fire:
+                flags |= FIRE
+            mouse = (int(input_state.mouse_x), int(input_state.mouse_y))
+
+        if flags == self.last_flags and mouse == self.last_mouse and not self.pending_ext:
+            self.run_length += 1
+            if self.run_length == MAX_RUN:
+                self._flush_run()
+            return
+
+        self._flush_run()
+        self.last_flags = flags
+
+        if mouse != self.last_mouse:
+            flags |= MOUSE_DELTA
+        if self.pending_ext:
+            flags |= EXTENDED
+
+        out = self.data
+        out.append(flags)
+        if flags & MOUSE_DELTA:
+            _write_varint(out, _zigzag(mouse[0] - self.last_mouse[0]))
+            _write_varint(out, _zigzag(mouse[1] - self.last_mouse[1]))
+            self.last_mouse = mouse
+        if flags & EXTENDED:
+            out.append(self.pending_ext)
+            if self.pending_ext & EXT_RESIZE:
+                _write_varint(out, self.pending_size[0])
+                _write_varint(out, self.pending_size[1])
+            self.pending_ext = 0
+            self.pending_size = None
+
+    def _flush_run(self):
+        if self.run_length:
+            self.data.append(RUN_BIT | (self.run_length - 1))
+            self.run_length = 0
+
+    def finish(self, scene) -> bytes:
+        """Close the stream with the scene's final state digest and return the encoded replay"""
+        self._flush_run()
+        self.data.append(EXTENDED)
+        self.data.append(EXT_END)
+        _write_varint(self.data, self.ticks)
+        self.data += bytes.fromhex(scene.state_digest())
+        return bytes(self.data)
+
+    def save(self, path: str, scene):
+        """Finish the recording and write it to disk"""
+        with open(path, "wb") as f:
+            f.write(self.finish(scene))
+
+
+class Replay:
+    """A decoded replay file"""
+
+    def __init__(self, data: bytes):
+        magic, version, seed, dt, width, height, crc = HEADER.unpack_from(data)
+        if magic != MAGIC:
+            raise ValueError("Not a RetroRumble replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        self.data = data
+        self.seed = seed
+        self.dt = dt
+        self.width = width
+        self.height = height
+        self.tuning_crc = crc
+        self.ticks = None
+        self.final_digest = None
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path, "rb") as f:
+            return cls(f.read())
+
+    def frames(self) -> Iterator[Tuple[InputState, int, Optional[Tuple[int, int]]]]:
+        """Yield (input, extended flags, new size or None) for every recorded tick"""
+        data = self.data
+        pos = HEADER.size
+        flags = 0
+        mouse_x = mouse_y = 0
+        state = InputState()
+
+        while pos < len(data):
+            byte = data[pos]
+            pos += 1
+
+            if byte & RUN_BIT:
+                for _ in range((byte & 0x7F) + 1):
+                    yield state, 0, None
+                continue
+
+            flags = byte
+            ext = 0
+            size = None
+            if flags & MOUSE_DELTA:
+                dx, pos = _read_varint(data, pos)
+                dy, pos = _read_varint(data, pos)
+                mouse_x += _unzigzag(dx)
+                mouse_y += _unzigzag(dy)
+            if flags & EXTENDED:
+                ext = data[pos]
+                pos += 1
+                if ext & EXT_END:
+                    self.ticks, pos = _read_varint(data, pos)
+                    self.final_digest = data[pos:pos + 32].hex()
+                    return
+                if ext & EXT_RESIZE:
+                    width, pos = _read_varint(data, pos)
+                    height, pos = _read_varint(data, pos)
+                    size = (width, height)
+
+            state = InputState(bool(flags & UP), bool(flags & DOWN), bool(flags & LEFT), bool(flags & RIGHT),
+                               mouse_x, mouse_y, bool(flags & FIRE))
+            yield state, ext, size
+
+
+class ReplayInputProvider(InputProvider):
+    """Hands the scene whatever input the replay player set for the current tick"""
+
+    def __init__(self):
+        self.current = InputState()
+
+    def poll(self, scene) -> InputState:
+        return self.current
@@ -0,0 +1,156 @@
+"""
+Double-buffered world snapshots in shared memory: one process writes, another reads
+"""
+
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Optional
+
+# Scalar slots at the start of every snapshot buffer
+SCALARS = ("seq", "tick", "time", "dt", "input_ack",
+           "player_x", "player_y", "player_prev_x", "player_prev_y", "player_health", "player_max_health",
+           "player_mana", "player_max_mana", "player_alive",
+           "coins", "wave", "enemies_remaining", "wave_complete",
+           "enemy_count", "friendly_count", "hostile_count", "template_count")
+SCALAR_INDEX = {name: i for i, name in enumerate(SCALARS)}
+
+# Per-entity columns
+ENEMY_FIELDS = ("x", "y", "prev_x", "prev_y", "health", "template_id")
+PROJECTILE_FIELDS = ("x", "y", "prev_x", "prev_y")
+TEMPLATE_FIELDS = ("size", "max_health", "r", "g", "b")
+
+SEQ = SCALAR_INDEX["seq"]
+READ_RETRIES = 8
+
+class Snapshot:
+    """Named float64 views onto one snapshot buffer"""
+
+    def __init__(self, array: np.ndarray, max_enemies: int, max_projectiles: int, max_templates: int):
+        self.array = array
+        self.max_enemies = max_enemies
+        self.max_projectiles = max_projectiles
+        self.max_templates = max_templates
+
+        offset = len(SCALARS)
+        self.scalars = array[:offset]
+        self.enemies = array[offset:offset + len(ENEMY_FIELDS) * max_enemies].reshape(len(ENEMY_FIELDS), -1)
+        offset += len(ENEMY_FIELDS) * max_enemies
+        self.friendly = array[offset:offset + len(PROJECTILE_FIELDS) * max_projectiles].reshape(
+            len(PROJECTILE_FIELDS), -1)
+        offset += len(PROJECTILE_FIELDS) * max_projectiles
+        self.hostile = array[offset:offset + len(PROJECTILE_FIELDS) * max_projectiles].reshape(
+            len(PROJECTILE_FIELDS), -1)
+        offset += len(PROJECTILE_FIELDS) * max_projectiles
+        self.templates = array[offset:offset + len(TEMPLATE_FIELDS) * max_templates].reshape(
+            max_templates, len(TEMPLATE_FIELDS))
+
+    @staticmethod
+    def size(max_enemies: int, max_projectiles: int, max_templates: int) -> int:
+        """float64 slots one buffer needs"""
+        return (len(SCALARS) + len(ENEMY_FIELDS) * max_enemies +
+                2 * len(PROJECTILE_FIELDS) * max_projectiles + len(TEMPLATE_FIELDS) * max_templates)
+
+    def __getitem__(self, name: str) -> float:
+        return float(self.scalars[SCALAR_INDEX[name]])
+
+    def __setitem__(self, name: str, value: float):
+        self.scalars[SCALAR_INDEX[name]] = value
+
+    def copy_from(self, other: 'Snapshot'):
+        """Copy just the used part of another snapshot of the same shape"""
+        self.scalars[:] = other.scalars
+        enemies = int(self["enemy_count"])
+        friendly = int(self["friendly_count"])
+        hostile = int(self["hostile_count"])
+        templates = int(self["template_count"])
+        self.enemies[:, :enemies] = other.enemies[:, :enemies]
+        self.friendly[:, :friendly] = other.friendly[:, :friendly]
+        self.hostile[:, :hostile] = other.hostile[:, :hostile]
+        self.templates[:templates] = other.templates[:templates]
+
+
+class SharedSnapshots:
+    """Two snapshot buffers and a "latest" slot in one shared memory block
+
+    The writer always fills the buffer that is not published, then flips "latest". Each
+    buffer carries a sequence number that is odd while it is being written (a seqlock),
+    so a reader that was lapped by two writes notices and retries instead of locking.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, max_enemies: int, max_projectiles: int,
+                 max_templates: int, owner: bool):
+        self.memory = memory
+        self.owner = owner
+        self.shape = (max_enemies, max_projectiles, max_templates)
+
+        buffer_size = Snapshot.size(max_enemies, max_projectiles, max_templates)
+        array = np.ndarray((1 + 2 * buffer_size,), dtype=np.float64, buffer=memory.buf)
+        self.control = array[:1]  # Index of the latest complete buffer
+        self.buffers = [Snapshot(array[1 + i * buffer_size:1 + (i + 1) * buffer_size], *self.shape)
+                        for i in range(2)]
+        self.writing = None
+
+    @classmethod
+    def create(cls, max_enemies: int = 16384, max_projectiles: int = 8192,
+               max_templates: int = 16) -> 'SharedSnapshots':
+        size = (1 + 2 * Snapshot.size(max_enemies, max_projectiles, max_templates)) * 8
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        snapshots = cls(memory, max_enemies, max_projectiles, max_templates, owner=True)
+        snapshots.control[0] = 0
+        for snapshot in snapshots.buffers:
+            snapshot.scalars[:] = 0.0
+        return snapshots
+
+    @classmethod
+    def attach(cls, name: str, max_enemies: int, max_projectiles: int,
+               max_templates: int) -> 'SharedSnapshots':
+        memory = shared_memory.SharedMemory(name=name)
+        return cls(memory, max_enemies, max_projectiles, max_templates, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self.memory.name
+
+    def local_snapshot(self) -> Snapshot:
+        """A private, same-shaped snapshot for read() to copy into"""
+        return Snapshot(np.zeros(Snapshot.size(*self.shape), dtype=np.float64), *self.shape)
+
+    def begin_write(self) -> Snapshot:
+        """The unpublished buffer, marked as being written"""
+        index = 1 - int(self.control[0])
+        snapshot = self.buffers[index]
+        snapshot.scalars[SEQ] += 1  # Odd: write in progress
+        self.writing = index
+        return snapshot
+
+    def end_write(self):
+        """Mark the buffer complete and publish it"""
+        snapshot = self.buffers[self.writing]
+        snapshot.scalars[SEQ] += 1
+        self.control[0] = self.writing
+        self.writing = None
+
+    def read(self, into: Snapshot) -> Optional[Snapshot]:
+        """Copy the latest complete snapshot into `into`
+
+        Returns None if nothing was published yet or the writer kept lapping the reader.
+        """
+        for _ in range(READ_RETRIES):
+            source = self.buffers[int(self.control[0])]
+            seq = source.scalars[SEQ]
+            if seq == 0:
+                return None
+            if seq % 2:
+                continue
+            into.copy_from(source)
+            if source.scalars[SEQ] == seq:
+                return into
+        return None
+
+    def close(self):
+        """Detach; the creating side also frees the block"""
+        self.control = None
+        self.buffers = []
+        self.memory.close()
+        if self.owner:
+            self.memory.unlink()
@@ -0,0 +1,156 @@
+"""
+Uniform-grid spatial hash used as the collision broadphase
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Sequence, Tuple
+
+# Collision layers - what an indexed entity is, not what it collides with
+# (player projectiles are not indexed: ProjectileBatch.candidates tests them against these cells)
+LAYER_PLAYER = "player"
+LAYER_HOSTILE = "hostile"  # Enemies
+
+# Inserted bounds are padded so pygame.Rect's truncation of float positions can never
+# put an overlapping pair in disjoint cells
+EDGE_SLACK = 2
+
+# Packs signed cells into one int64 key (same layout as the projectile broadphase)
+_CELL_OFFSET = 1 << 20
+
+class SpatialHash:
+    """Buckets axis-aligned boxes into square grid cells so narrowphase checks only visit nearby pairs"""
+
+    def __init__(self, cell_size: float = 64):
+        self.cell_size = cell_size
+        self.inv_cell_size = 1.0 / cell_size
+
+        # layer -> (cell_x, cell_y) -> [item, ...]
+        self.layers: Dict[str, Dict[Tuple[int, int], list]] = {}
+
+    def clear(self, layer: str = None):
+        """Remove every item from one layer, or from all layers"""
+        if layer is None:
+            for cells in self.layers.values():
+                cells.clear()
+        elif layer in self.layers:
+            self.layers[layer].clear()
+
+    def insert(self, item, x: float, y: float, width: float, height: float, layer: str):
+        """Insert an item with the given bounds into every cell it overlaps"""
+        cells = self.layers.setdefault(layer, {})
+        inv = self.inv_cell_size
+        min_cx = math.floor((x - EDGE_SLACK) * inv)
+        max_cx = math.floor((x + width + EDGE_SLACK) * inv)
+        min_cy = math.floor((y - EDGE_SLACK) * inv)
+        max_cy = math.floor((y + height + EDGE_SLACK) * inv)
+
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [item]
+                else:
+                    bucket.append(item)
+
+    def insert_entity(self, entity, layer: str, swept: bool = False):
+        """Insert an entity using its current bounds, or with swept=True the box covering its
+        whole move this tick, from (prev_x, prev_y) to (x, y)"""
+        if not swept:
+            self.insert(entity, entity.x, entity.y, entity.width, entity.height, layer)
+            return
+        x, prev_x = entity.x, entity.prev_x
+        y, prev_y = entity.y, entity.prev_y
+        self.insert(entity, min(x, prev_x), min(y, prev_y), entity.width + abs(x - prev_x),
+                    entity.height + abs(y - prev_y), layer)
+
+    def rebuild(self, entities, layer: str, swept: bool = False):
+        """Replace a layer's contents with the live entities given"""
+        self.clear(layer)
+        self.layers.setdefault(layer, {})
+        for entity in entities:
+            if entity.alive:
+                self.insert_entity(entity, layer, swept)
+
+    def rebuild_boxes(self, items: Sequence, indices: np.ndarray, x: np.ndarray, y: np.ndarray,
+                      width: np.ndarray, height: np.ndarray, layer: str):
+        """Replace a layer's contents with boxes given as arrays; box k belongs to items[indices[k]]
+
+        Cells are computed for every box at once and grouped with a sort, so nothing is read
+        from the items themselves. Buckets list their items in the order given, exactly as
+        rebuild() would have inserted them.
+        """
+        cells = self.layers.setdefault(layer, {})
+        cells.clear()
+        if len(indices) == 0:
+            return
+
+        inv = self.inv_cell_size
+        min_cx = np.floor((x - EDGE_SLACK) * inv).astype(np.int64)
+        max_cx = np.floor((x + width + EDGE_SLACK) * inv).astype(np.int64)
+        min_cy = np.floor((y - EDGE_SLACK) * inv).astype(np.int64)
+        max_cy = np.floor((y + height + EDGE_SLACK) * inv).astype(np.int64)
+        span_x = max_cx - min_cx
+        span_y = max_cy - min_cy
+
+        # One (box, cell) pair per cell each box overlaps, one pass per cell offset
+        owners = []
+        cell_x = []
+        cell_y = []
+        for offset_x in range(int(span_x.max()) + 1):
+            for offset_y in range(int(span_y.max()) + 1):
+                owner = np.flatnonzero((span_x >= offset_x) & (span_y >= offset_y))
+                owners.append(owner)
+                cell_x.append(min_cx[owner] + offset_x)
+                cell_y.append(min_cy[owner] + offset_y)
+        owner = np.concatenate(owners)
+        cell_x = np.concatenate(cell_x)
+        cell_y = np.concatenate(cell_y)
+
+        keys = ((cell_x + _CELL_OFFSET) << 32) | (cell_y + _CELL_OFFSET)
+        order = np.lexsort((owner, keys))
+        _, starts = np.unique(keys[order], return_index=True)
+        ends = np.append(starts[1:], len(order))
+        members = list(map(items.__getitem__, np.asarray(indices)[owner[order]].tolist()))
+        for cx, cy, start, end in zip(cell_x[order][starts].tolist(), cell_y[order][starts].tolist(),
+                                      starts.tolist(), ends.tolist()):
+            cells[(cx, cy)] = members[start:end]
+
+    def occupied_cells(self, layer: str):
+        """Keys of the non-empty cells in a layer"""
+        return self.layers.get(layer, {}).keys()
+
+    def query_rect(self, x: float, y: float, width: float, height: float, layer: str) -> List:
+        """Items whose cells overlap the given box (broadphase candidates, no exact test)"""
+        cells = self.layers.get(layer)
+        if not cells:
+            return []
+
+        inv = self.inv_cell_size
+        min_cx = math.floor(x * inv)
+        max_cx = math.floor((x + width) * inv)
+        min_cy = math.floor(y * inv)
+        max_cy = math.floor((y + height) * inv)
+
+        # Fast path: the box sits in one cell, so no item can be seen twice
+        if min_cx == max_cx and min_cy == max_cy:
+            bucket = cells.get((min_cx, min_cy))
+            return list(bucket) if bucket else []
+
+        found = []
+        seen = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for item in bucket:
+                    item_id = id(item)
+                    if item_id not in seen:
+                        seen.add(item_id)
+                        found.append(item)
+        return found
+
+    def query_entity(self, entity, layer: str) -> List:
+        """Broadphase candidates overlapping an entity's bounds"""
+        return self.query_rect(entity.x, entity.y, entity.width, entity.height, layer)
@@ -0,0 +1,209 @@
+"""
+Pre-rendered entity sprites, drawn with one Surface.blits call per layer
+"""
+
+import pygame
+import numpy as np
+from itertools import repeat
+from typing import Dict, Optional
+from engine.assets import AssetManager
+from engine.particles import ParticleSystem, FADE_LEVELS
+
+# Health bars are baked at this many fill levels at most (one per pixel for narrower bars)
+HEALTH_BAR_LEVELS = 32
+
+HEALTH_BACK_COLOR = (255, 0, 0)
+HEALTH_FILL_COLOR = (0, 255, 0)
+
+# Atlas sprite the player is drawn with, when the atlas has one
+PLAYER_SPRITE = "player"
+
+def _converted(surface: pygame.Surface) -> pygame.Surface:
+    """Match the display's pixel format when there is a display (headless runs have none)"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert()
+
+class SpriteCache:
+    """Surfaces for every body, circle and health bar drawn so far, baked on first use
+
+    With an AssetManager, sprite() hands out atlas sprites scaled to the entity's size,
+    and falls back to a colored body for names the atlas lacks (or when none is built).
+    Atlas sprites are kept as copies, never subsurfaces, so evicted atlas pages can be
+    freed, and they are dropped whenever the manager's generation moves on.
+    """
+
+    def __init__(self, assets: AssetManager = None):
+        self.assets = assets
+        self.generation = assets.generation if assets is not None else 0
+        self.surfaces: Dict[tuple, pygame.Surface] = {}
+
+    def sprite(self, name: Optional[str], color: tuple, width: int, height: int) -> pygame.Surface:
+        assets = self.assets
+        if assets is not None and assets.generation != self.generation:
+            self.generation = assets.generation
+            self.surfaces = {key: surface for key, surface in self.surfaces.items() if key[0] != "sprite"}
+
+        key = ("sprite", name, color, width, height)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            if name is None or assets is None or not assets.has(name):
+                surface = self.body(color, width, height)
+            else:
+                surface = assets.get(name)
+                if surface.get_size() != (width, height):
+                    surface = pygame.transform.scale(surface, (width, height))
+                else:
+                    surface = surface.copy()
+            self.surfaces[key] = surface
+        return surface
+
+    def body(self, color: tuple, width: int, height: int) -> pygame.Surface:
+        key = ("body", color, width, height)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((width, height))
+            surface.fill(color)
+            surface = self.surfaces[key] = _converted(surface)
+        return surface
+
+    def circle(self, color: tuple, radius: int) -> pygame.Surface:
+        """A (2r+1)-square sprite of the circle pygame.draw.circle makes at its center"""
+        key = ("circle", color, radius)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            colorkey = (255, 0, 255) if color == (0, 0, 0) else (0, 0, 0)
+            surface = pygame.Surface((radius * 2 + 1, radius * 2 + 1))
+            surface.fill(colorkey)
+            pygame.draw.circle(surface, color, (radius, radius), radius)
+            surface = _converted(surface)
+            surface.set_colorkey(colorkey)
+            self.surfaces[key] = surface
+        return surface
+
+    def particle(self, color: tuple, size: int, level: int, levels: int) -> pygame.Surface:
+        """A size-square of color at alpha (level + 1) / levels, for fading particles"""
+        key = ("particle", color, size, level, levels)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((size, size))
+            surface.fill(color)
+            surface = _converted(surface)
+            surface.set_alpha(255 * (level + 1) // levels)
+            self.surfaces[key] = surface
+        return surface
+
+    def health_bar(self, width: int, height: int, ratio: float) -> pygame.Surface:
+        """Red bar with a green fill, quantized to HEALTH_BAR_LEVELS steps"""
+        levels = min(width, HEALTH_BAR_LEVELS)
+        level = max(0, min(levels, int(ratio * levels)))
+        key = ("health", width, height, level)
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = pygame.Surface((width, height))
+            surface.fill(HEALTH_BACK_COLOR)
+            surface.fill(HEALTH_FILL_COLOR, (0, 0, width * level // levels, height))
+            surface = self.surfaces[key] = _converted(surface)
+        return surface
+
+
+class SpriteBatchRenderer:
+    """Draws the player, enemies, projectiles and particles from cached sprites
+
+    Enemy bodies, enemy health bars, each projectile partition and all particles are one
+    blits() call each. Bars therefore sit above every body rather than just their own, which only
+    shows where enemies overlap. alpha < 1 draws everything that fraction of the way
+    from the previous simulation tick's positions to the current ones.
+    """
+
+    def __init__(self, assets: AssetManager = None):
+        self.cache = SpriteCache(assets)
+
+    def render(self, screen: pygame.Surface, player, enemies, projectiles, enemy_store=None,
+               alpha: float = 1.0, particles: ParticleSystem = None):
+        cache = self.cache
+
+        if player.alive:
+            x, y = player.interpolated_position(alpha)
+            screen.blit(cache.sprite(PLAYER_SPRITE, player.color, player.width, player.height), (int(x), int(y)))
+            screen.blit(cache.health_bar(player.width, 6, player.health / player.max_health),
+                        (int(x), int(y - 10)))
+
+        if enemy_store is not None:
+            bodies, bars = self._store_layers(enemy_store, alpha)
+        else:
+            bodies, bars = self._enemy_layers(enemies, alpha)
+        screen.blits(bodies, False)
+        screen.blits(bars, False)
+
+        for batch in (projectiles.friendly, projectiles.hostile):
+            if batch.count:
+                sprite = cache.circle(batch.color, batch.width // 2)
+                screen.blits(zip(repeat(sprite), zip(*batch.sprite_positions(alpha))), False)
+
+        if particles is not None:
+            self.render_particles(screen, particles, alpha)
+
+    def render_particles(self, screen: pygame.Surface, particles: ParticleSystem, alpha: float = 1.0):
+        """Every live particle in one blits() call, each at the fade level of its remaining life"""
+        if not particles.count:
+            return
+        cache = self.cache
+        sprites = [cache.particle(color, size, level, FADE_LEVELS)
+                   for color, size in particles.styles for level in range(FADE_LEVELS)]
+        keys, left, top = particles.sprite_layers(alpha)
+        screen.blits(zip(map(sprites.__getitem__, keys.tolist()), zip(left.tolist(), top.tolist())), False)
+
+    def _enemy_layers(self, enemies, alpha: float):
+        """Body and health-bar blit lists for Enemy objects"""
+        cache = self.cache
+        interpolate = alpha < 1.0
+        bodies = []
+        bars = []
+        for enemy in enemies:
+            if not enemy.alive:
+                continue
+            x = enemy.x
+            y = enemy.y
+            if interpolate:
+                prev_x = enemy.prev_x
+                prev_y = enemy.prev_y
+                x = prev_x + (x - prev_x) * alpha
+                y = prev_y + (y - prev_y) * alpha
+            bodies.append((cache.sprite(enemy.sprite, enemy.color, enemy.width, enemy.height), (int(x), int(y))))
+            if enemy.health < enemy.max_health:
+                bars.append((cache.health_bar(enemy.width, 4, enemy.health / enemy.max_health),
+                             (int(x), int(y - 8))))
+        return bodies, bars
+
+    def _store_layers(self, store, alpha: float):
+        """Body and health-bar blit lists straight from an EnemyStore's arrays"""
+        cache = self.cache
+        n = store.count
+        live = np.flatnonzero(store.alive[:n])
+        template_id = store.template_id[live]
+        x = store.x[live]
+        y = store.y[live]
+        if alpha < 1.0:
+            prev_x = store.prev_x[live]
+            prev_y = store.prev_y[live]
+            x = prev_x + (x - prev_x) * alpha
+            y = prev_y + (y - prev_y) * alpha
+        size = store.template_size.astype(np.int64).tolist()
+
+        sprites = [cache.sprite(sprite, color, size[t], size[t])
+                   for t, (sprite, color) in enumerate(zip(store.template_sprite, store.template_color))]
+        bodies = list(zip([sprites[t] for t in template_id.tolist()],
+                          zip(x.astype(np.int64).tolist(), y.astype(np.int64).tolist())))
+
+        health = store.health[live]
+        max_health = store.template_max_health[template_id]
+        damaged = np.flatnonzero(health < max_health)
+        bars = [(cache.health_bar(size[t], 4, ratio), (bx, by)) for t, ratio, bx, by in zip(
+            template_id[damaged].tolist(), (health[damaged] / max_health[damaged]).tolist(),
+            x[damaged].astype(np.int64).tolist(), (y[damaged] - 8).astype(np.int64).tolist())]
+        return bodies, bars
+
+    def clear(self):
+        """Drop every cached sprite (e.g. after the display format changes)"""
+        self.cache.surfaces.clear()
@@ -0,0 +1,118 @@
+"""
+Shared fonts, an LRU cache of rendered text, and glyph atlases for composing numbers
+"""
+
+import pygame
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+# Rendered strings kept before the least recently used ones are dropped
+DEFAULT_CAPACITY = 512
+
+# Characters a glyph atlas bakes unless told otherwise: enough for counts, damage and timers
+NUMBER_GLYPHS = "0123456789+-.,:/%x "
+
+def _converted_alpha(surface: pygame.Surface) -> pygame.Surface:
+    """Match the display's pixel format when there is a display (headless runs have none)"""
+    if pygame.display.get_surface() is None:
+        return surface
+    return surface.convert_alpha()
+
+class GlyphAtlas:
+    """One font's glyphs for a fixed character set, rendered once side by side on one surface
+
+    Callers compose strings from each glyph's area (its advance), so there is no kerning;
+    fonts give digits equal widths, which makes that invisible for numbers.
+    """
+
+    def __init__(self, font: pygame.font.Font, color: tuple, charset: str = NUMBER_GLYPHS):
+        self.color = color
+        self.charset = charset
+        glyphs = [font.render(char, True, color) for char in charset]
+        self.height = max(glyph.get_height() for glyph in glyphs)
+
+        atlas = pygame.Surface((sum(glyph.get_width() for glyph in glyphs), self.height), pygame.SRCALPHA)
+        self.areas: Dict[str, pygame.Rect] = {}
+        x = 0
+        for char, glyph in zip(charset, glyphs):
+            atlas.blit(glyph, (x, 0))
+            self.areas[char] = pygame.Rect(x, 0, glyph.get_width(), self.height)
+            x += glyph.get_width()
+        self.surface = _converted_alpha(atlas)
+
+        self.fades: Dict[Tuple[int, int], pygame.Surface] = {}
+
+    def faded(self, level: int, levels: int) -> pygame.Surface:
+        """The atlas at alpha (level + 1) / levels (the last level is the atlas itself)"""
+        if level >= levels - 1:
+            return self.surface
+        key = (level, levels)
+        surface = self.fades.get(key)
+        if surface is None:
+            surface = self.surface.copy()
+            surface.set_alpha(255 * (level + 1) // levels)
+            self.fades[key] = surface
+        return surface
+
+
+class TextCache:
+    """One Font per (face, size), rendered text surfaces in an LRU, and glyph atlases by color
+
+    face None is pygame's default font. Cached surfaces are shared, so callers must not
+    draw on them.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.fonts: Dict[tuple, pygame.font.Font] = {}
+        self.surfaces: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+        self.atlases: Dict[tuple, GlyphAtlas] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, size: int, face: str = None) -> pygame.font.Font:
+        key = (face, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.Font(face, size)
+        return font
+
+    def render(self, text: str, size: int, color: tuple, face: str = None) -> pygame.Surface:
+        """Antialiased text, rendered only the first time this (font, text, color) is asked for"""
+        key = (face, size, text, tuple(color))
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self.surfaces[key] = self.font(size, face).render(text, True, color)
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def glyphs(self, size: int, color: tuple, face: str = None, charset: str = NUMBER_GLYPHS) -> GlyphAtlas:
+        key = (face, size, tuple(color), charset)
+        atlas = self.atlases.get(key)
+        if atlas is None:
+            atlas = self.atlases[key] = GlyphAtlas(self.font(size, face), tuple(color), charset)
+        return atlas
+
+    def clear(self):
+        """Drop rendered text and atlases (e.g. after the display format changes); fonts are kept"""
+        self.surfaces.clear()
+        self.atlases.clear()
+
+    def stats(self) -> dict:
+        return {"fonts": len(self.fonts), "cached": len(self.surfaces), "atlases": len(self.atlases),
+                "hits": self.hits, "misses": self.misses}
+
+
+_default_cache: Optional[TextCache] = None
+
+def default_text_cache() -> TextCache:
+    """The process-wide cache every UI element shares, created on first use"""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TextCache()
+    return _default_cache
@@ -0,0 +1,40 @@
+"""
+Fixed-timestep accumulator: wall-clock frame time in, whole simulation ticks out
+"""
+
+class FixedTimestep:
+    """Releases accumulated frame time as fixed ticks and reports the leftover fraction
+
+    Each frame, call advance() with the real elapsed time and run update(dt) that many
+    times, then render with alpha. After a hitch (window drag, GC pause) at most
+    max_steps ticks run and the rest of the backlog is dropped, so a slow frame cannot
+    snowball into ever more catch-up work.
+    """
+
+    def __init__(self, tick_rate: float = 60.0, max_steps: int = 5):
+        self.tick_rate = tick_rate
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+        # Stats
+        self.ticks = 0
+        self.dropped_time = 0.0
+
+    def advance(self, frame_time: float) -> int:
+        """Add one frame's elapsed seconds and return how many ticks to simulate"""
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt + 1e-9)  # Exact multiples must not lose a tick to rounding
+        if steps > self.max_steps:
+            dropped = (steps - self.max_steps) * self.dt
+            self.dropped_time += dropped
+            self.accumulator -= dropped
+            steps = self.max_steps
+        self.accumulator = max(0.0, self.accumulator - steps * self.dt)
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """How far the next frame sits between the last tick and the one after it, 0..1"""
+        return min(self.accumulator / self.dt, 1.0)
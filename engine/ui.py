@@ -4,18 +4,24 @@ Modern UI elements for RetroRumble including HUD and shop
 
 import pygame
 import math
+from engine.text_cache import default_text_cache
 
 class HUD:
-    """Modern heads-up display with gradients and improved styling"""
+    """Modern heads-up display with gradients and improved styling
+
+    Everything that never changes is baked once into the panel layer and the stat-bar
+    images. Text that shows a value is re-rendered only when that value changes.
+    """
 
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
 
-        # Modern fonts
-        self.title_font = pygame.font.Font(None, 32)
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 18)
+        # Modern fonts, shared through the text cache so resizing does not reload them
+        self.text = default_text_cache()
+        self.title_font = self.text.font(32)
+        self.font = self.text.font(24)
+        self.small_font = self.text.font(18)
 
         # Modern color scheme
         self.bg_color = (15, 15, 25)  # Dark blue-gray
@@ -25,142 +31,171 @@ class HUD:
         self.mana_color = (80, 150, 255)  # Bright blue
         self.coins_color = (255, 215, 0)  # Gold
         self.border_color = (60, 60, 80)  # Gray border
+        self.complete_color = (0, 255, 100)  # Bright green
+
+        # Layout
+        self.hud_height = 100
+        self.coins_x = self.screen_width - 200
+        self.health_bar = pygame.Rect(30, 25, 250, 18)
+        self.mana_bar = pygame.Rect(30, 55, 250, 12)
+
+        # Prebaked layers
+        self.panel = self._build_panel()
+        self.health_empty, self.health_full = self._build_stat_bar(self.health_bar, self.health_color)
+        self.mana_empty, self.mana_full = self._build_stat_bar(self.mana_bar, self.mana_color)
+        self.complete_text = self._glow_text(self.font.render("WAVE COMPLETE", True, self.complete_color))
+        self.controls_text = self.small_font.render("Shift+Space: Fullscreen | TAB: Shop | Space: Pause",
+                                                    True, (150, 150, 150))
+
+        # Value-keyed text: name -> (value, surface)
+        self.text_cache = {}
 
     def render(self, screen: pygame.Surface, player, wave_manager, coins: int):
         """Render the modern HUD with gradients and styling"""
-        # Modern HUD panel
-        hud_height = 100
-        self._render_modern_panel(screen, 0, 0, self.screen_width, hud_height)
+        screen.blit(self.panel, (0, 0))
 
         # Left side - Player stats
-        self._render_modern_stat_bar(screen, 30, 25, 250, 18, player.health, player.max_health,
-                                   self.health_color, "HEALTH", show_numbers=True)
-
-        self._render_modern_stat_bar(screen, 30, 55, 250, 12, player.mana, player.max_mana,
-                                   self.mana_color, "MANA", show_numbers=True)
+        self._render_stat_bar(screen, "health", self.health_bar, self.health_empty, self.health_full,
+                              player.health, player.max_health)
+        self._render_stat_bar(screen, "mana", self.mana_bar, self.mana_empty, self.mana_full,
+                              player.mana, player.max_mana)
 
         # Center - Game info with modern styling
         center_x = self.screen_width // 2
 
-        # Wave display with glow effect
-        wave_text = self.title_font.render(f"WAVE {wave_manager.current_wave}", True, self.accent_color)
-        wave_rect = wave_text.get_rect(centerx=center_x, y=20)
-        self._render_text_with_glow(screen, wave_text, wave_rect, self.accent_color)
+        # Wave display with glow effect (offset by the one-pixel glow margin)
+        wave_text = self._cached_text("wave", wave_manager.current_wave,
+                                      lambda wave: self._glow_text(
+                                          self.title_font.render(f"WAVE {wave}", True, self.accent_color)))
+        screen.blit(wave_text, wave_text.get_rect(centerx=center_x, y=19))
 
         # Enemies counter
-        enemies_text = self.font.render(f"Enemies: {wave_manager.enemies_remaining}", True, self.text_color)
-        enemies_rect = enemies_text.get_rect(centerx=center_x, y=50)
-        screen.blit(enemies_text, enemies_rect)
+        enemies_text = self._cached_text("enemies", wave_manager.enemies_remaining,
+                                         lambda count: self.font.render(f"Enemies: {count}", True, self.text_color))
+        screen.blit(enemies_text, enemies_text.get_rect(centerx=center_x, y=50))
 
-        # Right side - Coins with icon effect
-        coins_x = self.screen_width - 200
-        coins_bg = pygame.Surface((180, 60))
-        coins_bg.set_alpha(150)
-        coins_bg.fill(self.bg_color)
-        screen.blit(coins_bg, (coins_x, 20))
-
-        # Coin icon (circle)
-        pygame.draw.circle(screen, self.coins_color, (coins_x + 20, 35), 8)
-        pygame.draw.circle(screen, (200, 160, 0), (coins_x + 20, 35), 8, 2)
-
-        coins_text = self.font.render(f"{coins}", True, self.coins_color)
-        screen.blit(coins_text, (coins_x + 35, 25))
-
-        coins_label = self.small_font.render("COINS", True, self.text_color)
-        screen.blit(coins_label, (coins_x + 35, 50))
+        # Right side - Coins
+        coins_text = self._cached_text("coins", coins,
+                                       lambda value: self.font.render(f"{value}", True, self.coins_color))
+        screen.blit(coins_text, (self.coins_x + 35, 25))
 
         # Wave status indicator
         if wave_manager.wave_complete and wave_manager.enemies_remaining == 0:
-            status_text = self.font.render("WAVE COMPLETE", True, (0, 255, 100))
-            status_rect = status_text.get_rect(centerx=center_x, y=75)
-            self._render_text_with_glow(screen, status_text, status_rect, (0, 255, 100))
+            screen.blit(self.complete_text, self.complete_text.get_rect(centerx=center_x, y=74))
 
         # Controls hint in bottom right
-        controls_text = self.small_font.render("Shift+Space: Fullscreen | TAB: Shop | Space: Pause", True, (150, 150, 150))
-        controls_rect = controls_text.get_rect(right=self.screen_width - 10, bottom=self.screen_height - 10)
-        screen.blit(controls_text, controls_rect)
-
-    def _render_modern_panel(self, screen: pygame.Surface, x: int, y: int, width: int, height: int):
-        """Render a modern panel with gradient background"""
-        # Create gradient surface
-        gradient_surface = pygame.Surface((width, height))
+        controls_rect = self.controls_text.get_rect(right=self.screen_width - 10, bottom=self.screen_height - 10)
+        screen.blit(self.controls_text, controls_rect)
+
+    def state(self, player, wave_manager, coins: int) -> tuple:
+        """Everything render() shows; the HUD only needs redrawing when this changes"""
+        return (self._fill_width(self.health_bar, player.health, player.max_health), int(player.health),
+                int(player.max_health), self._fill_width(self.mana_bar, player.mana, player.max_mana),
+                int(player.mana), int(player.max_mana), wave_manager.current_wave,
+                wave_manager.enemies_remaining, coins,
+                wave_manager.wave_complete and wave_manager.enemies_remaining == 0)
+
+    def regions(self) -> list:
+        """Screen rects render() draws into"""
+        controls_rect = self.controls_text.get_rect(right=self.screen_width - 10, bottom=self.screen_height - 10)
+        return [pygame.Rect(0, 0, self.screen_width, self.hud_height), controls_rect]
+
+    def _cached_text(self, name: str, value, build) -> pygame.Surface:
+        """Surface for name showing value, rebuilt with build(value) only when value changed"""
+        cached = self.text_cache.get(name)
+        if cached is not None and cached[0] == value:
+            return cached[1]
+        surface = build(value)
+        self.text_cache[name] = (value, surface)
+        return surface
+
+    def _render_stat_bar(self, screen: pygame.Surface, name: str, rect: pygame.Rect,
+                         empty: pygame.Surface, full: pygame.Surface, current: float, maximum: float):
+        """Blit a prebaked bar: the empty image, then the full image clipped to the fill width"""
+        screen.blit(empty, rect)
+        fill_width = self._fill_width(rect, current, maximum)
+        if fill_width > 0:
+            screen.blit(full, rect, (0, 0, fill_width, rect.height))
+
+        numbers = (int(current), int(maximum))
+        numbers_text = self._cached_text(name, numbers,
+                                         lambda value: self.small_font.render(f"{value[0]}/{value[1]}",
+                                                                              True, self.text_color))
+        screen.blit(numbers_text, numbers_text.get_rect(right=rect.right, y=rect.y - 18))
+
+    def _fill_width(self, rect: pygame.Rect, current: float, maximum: float) -> int:
+        if maximum <= 0:
+            return 0
+        return min(int((current / maximum) * rect.width), rect.width)
+
+    def _build_panel(self) -> pygame.Surface:
+        """Bake the translucent panel, coin box, bar labels and coin icon into one layer"""
+        panel = pygame.Surface((self.screen_width, self.hud_height), pygame.SRCALPHA)
+        panel.fill((*self.bg_color, 220))
+
+        # Coin box: a 150-alpha box over the 220-alpha panel, pre-composited
+        coin_box_alpha = 255 - (255 - 220) * (255 - 150) // 255
+        panel.fill((*self.bg_color, coin_box_alpha), (self.coins_x, 20, 180, 60))
+        pygame.draw.rect(panel, self.border_color, (0, 0, self.screen_width, self.hud_height), 2)
 
-        for i in range(height):
-            alpha = int(200 * (1 - i / height))
-            color = (*self.bg_color, alpha)
-            gradient_surface.set_at((0, i), color)
-
-        # Fill the rest
-        gradient_surface.set_alpha(220)
-        gradient_surface.fill(self.bg_color)
-        screen.blit(gradient_surface, (x, y))
-
-        # Border
-        pygame.draw.rect(screen, self.border_color, (x, y, width, height), 2)
+        # Coin icon (circle)
+        pygame.draw.circle(panel, self.coins_color, (self.coins_x + 20, 35), 8)
+        pygame.draw.circle(panel, (200, 160, 0), (self.coins_x + 20, 35), 8, 2)
+
+        # Static labels
+        for label, rect in (("HEALTH", self.health_bar), ("MANA", self.mana_bar)):
+            panel.blit(self.small_font.render(label, True, self.text_color), (rect.x, rect.y - 18))
+        panel.blit(self.small_font.render("COINS", True, self.text_color), (self.coins_x + 35, 50))
+        return panel
+
+    def _build_stat_bar(self, rect: pygame.Rect, color: tuple):
+        """Bake a bar's empty and completely full images; partial fills clip the full one"""
+        width, height = rect.size
+        highlight = pygame.Surface((width, height // 3))
+        highlight.set_alpha(80)
+        highlight.fill((255, 255, 255))
 
-    def _render_modern_stat_bar(self, screen: pygame.Surface, x: int, y: int, width: int, height: int,
-                               current: float, maximum: float, color: tuple, label: str, show_numbers: bool = False):
-        """Render a modern stat bar with styling"""
         # Background with inner shadow effect
-        bg_color = (30, 30, 40)
-        pygame.draw.rect(screen, bg_color, (x, y, width, height))
-        pygame.draw.rect(screen, (10, 10, 15), (x, y, width, height), 2)
-
-        # Fill with gradient
-        if maximum > 0:
-            fill_width = int((current / maximum) * width)
-            if fill_width > 0:
-                # Create gradient fill
-                for i in range(fill_width):
-                    alpha = 0.7 + 0.3 * (i / width)
-                    fill_color = tuple(int(c * alpha) for c in color)
-                    pygame.draw.line(screen, fill_color, (x + i, y), (x + i, y + height))
-
-        # Glossy highlight
-        highlight_height = height // 3
-        highlight_surface = pygame.Surface((width, highlight_height))
-        highlight_surface.set_alpha(80)
-        highlight_surface.fill((255, 255, 255))
-        screen.blit(highlight_surface, (x, y))
-
-        # Border
-        pygame.draw.rect(screen, self.border_color, (x, y, width, height), 1)
-
-        # Label
-        label_text = self.small_font.render(label, True, self.text_color)
-        screen.blit(label_text, (x, y - 18))
-
-        # Numbers
-        if show_numbers:
-            numbers_text = self.small_font.render(f"{int(current)}/{int(maximum)}", True, self.text_color)
-            numbers_rect = numbers_text.get_rect(right=x + width, y=y - 18)
-            screen.blit(numbers_text, numbers_rect)
-
-    def _render_text_with_glow(self, screen: pygame.Surface, text_surface: pygame.Surface,
-                              rect: pygame.Rect, glow_color: tuple):
-        """Render text with a glow effect"""
-        # Create glow by rendering offset copies
-        glow_offsets = [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)]
-
-        for offset_x, offset_y in glow_offsets:
-            glow_rect = rect.copy()
-            glow_rect.x += offset_x
-            glow_rect.y += offset_y
-            screen.blit(text_surface, glow_rect)
-
-        # Render main text
-        screen.blit(text_surface, rect)
+        empty = pygame.Surface((width, height))
+        empty.fill((30, 30, 40))
+        pygame.draw.rect(empty, (10, 10, 15), (0, 0, width, height), 2)
+
+        # Horizontal gradient strip
+        full = pygame.Surface((width, height))
+        for i in range(width):
+            alpha = 0.7 + 0.3 * (i / width)
+            full.fill(tuple(int(c * alpha) for c in color), (i, 0, 1, height))
+
+        # Glossy highlight and border on both
+        for surface in (empty, full):
+            surface.blit(highlight, (0, 0))
+            pygame.draw.rect(surface, self.border_color, (0, 0, width, height), 1)
+        return empty, full
+
+    def _glow_text(self, text_surface: pygame.Surface) -> pygame.Surface:
+        """Bake the glow (the text plus eight one-pixel offset copies) into a single surface"""
+        width, height = text_surface.get_size()
+        glow = pygame.Surface((width + 2, height + 2), pygame.SRCALPHA)
+        for offset_x in (0, 1, 2):
+            for offset_y in (0, 1, 2):
+                glow.blit(text_surface, (offset_x, offset_y))
+        return glow
 
 
 class ShopModal:
-    """Modern shop interface with improved styling"""
+    """Modern shop interface with improved styling
+
+    The modal is composed once per affordability state (which items the player can pay
+    for) and reused until coins cross an item price. Resizing builds a new ShopModal.
+    """
 
     def __init__(self, screen_width: int, screen_height: int):
         self.screen_width = screen_width
         self.screen_height = screen_height
-        self.title_font = pygame.font.Font(None, 48)
-        self.font = pygame.font.Font(None, 28)
-        self.small_font = pygame.font.Font(None, 20)
+        self.text = default_text_cache()
+        self.title_font = self.text.font(48)
+        self.font = self.text.font(28)
+        self.small_font = self.text.font(20)
         self.visible = False
 
         # Modern styling
@@ -186,6 +221,17 @@ class ShopModal:
             {"name": "Rapid Fire", "price": 100, "description": "Reduce mana cost by 2"}
         ]
 
+        # Where the cached modal is drawn relative to its resting position; slide
+        # animations move this instead of rebuilding the surface
+        self.offset = (0, 0)
+
+        # Prebaked layers
+        self.overlay = pygame.Surface((self.screen_width, self.screen_height))
+        self.overlay.set_alpha(180)
+        self.overlay.fill((0, 0, 0))
+        self.background = self._build_background()
+        self.modal_cache = {}  # affordability tuple -> composed modal surface
+
     def toggle_visibility(self):
         """Show/hide the shop modal"""
         self.visible = not self.visible
@@ -204,67 +250,83 @@ class ShopModal:
         if not self.visible:
             return
 
-        # Dark overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self.overlay, (0, 0))
+
+        # The modal surface has a one-pixel margin for the outer glow border
+        x = self.x + self.offset[0]
+        y = self.y + self.offset[1]
+        screen.blit(self.modal_surface(coins), (x - 1, y - 1))
+
+        screen.blit(self.text.render(f"Coins: {coins}", 28, (255, 215, 0)), (x + 50, y + 70))
+
+    def modal_surface(self, coins: int) -> pygame.Surface:
+        """The composed modal (without the coin count) for whatever coins can afford"""
+        affordable = tuple(coins >= item["price"] for item in self.shop_items)
+        surface = self.modal_cache.get(affordable)
+        if surface is None:
+            surface = self._compose_modal(affordable)
+            self.modal_cache[affordable] = surface
+        return surface
+
+    def _build_background(self) -> pygame.Surface:
+        """Bake the window, borders, title, coin icon and instructions"""
+        background = pygame.Surface((self.width + 2, self.height + 2))
 
         # Modern shop window with gradient
-        self._render_gradient_rect(screen, self.x, self.y, self.width, self.height,
-                                 self.bg_color, (40, 50, 70))
+        self._render_gradient_rect(background, 1, 1, self.width, self.height,
+                                   self.bg_color, (40, 50, 70))
 
         # Border with glow
-        pygame.draw.rect(screen, self.border_color, (self.x, self.y, self.width, self.height), 3)
-        pygame.draw.rect(screen, self.accent_color, (self.x-1, self.y-1, self.width+2, self.height+2), 1)
+        pygame.draw.rect(background, self.border_color, (1, 1, self.width, self.height), 3)
+        pygame.draw.rect(background, self.accent_color, (0, 0, self.width + 2, self.height + 2), 1)
 
         # Title with modern styling
         title_text = self.title_font.render("RETRO SHOP", True, self.accent_color)
-        title_rect = title_text.get_rect(centerx=self.x + self.width // 2, y=self.y + 20)
-        screen.blit(title_text, title_rect)
+        background.blit(title_text, title_text.get_rect(centerx=1 + self.width // 2, y=21))
+
+        # Coin icon; the count itself changes too often to bake
+        pygame.draw.circle(background, (255, 215, 0), (31, 81), 8)
+
+        # Instructions
+        instructions = [
+            "Click items to purchase (Coming Soon!)",
+            "ESC or TAB to close"
+        ]
+
+        for i, instruction in enumerate(instructions):
+            inst_text = self.small_font.render(instruction, True, (150, 150, 150))
+            inst_rect = inst_text.get_rect(centerx=1 + self.width // 2, y=1 + self.height - 50 + i * 20)
+            background.blit(inst_text, inst_rect)
+        return background
 
-        # Coins display with icon
-        coins_y = self.y + 70
-        pygame.draw.circle(screen, (255, 215, 0), (self.x + 30, coins_y + 10), 8)
-        coins_text = self.font.render(f"Coins: {coins}", True, (255, 215, 0))
-        screen.blit(coins_text, (self.x + 50, coins_y))
+    def _compose_modal(self, affordable: tuple) -> pygame.Surface:
+        """Draw the item buttons for one affordability state over the baked background"""
+        modal = self.background.copy()
 
         # Shop items with modern buttons
-        item_start_y = self.y + 110
-        for i, item in enumerate(self.shop_items):
+        item_start_y = 111
+        for i, (item, can_afford) in enumerate(zip(self.shop_items, affordable)):
             item_y = item_start_y + i * 50
 
             # Item background
-            can_afford = coins >= item["price"]
             bg_color = self.button_color if can_afford else (40, 40, 50)
             text_color = self.text_color if can_afford else (120, 120, 120)
 
-            pygame.draw.rect(screen, bg_color, (self.x + 20, item_y, self.width - 40, 40))
-            pygame.draw.rect(screen, self.border_color, (self.x + 20, item_y, self.width - 40, 40), 1)
+            pygame.draw.rect(modal, bg_color, (21, item_y, self.width - 40, 40))
+            pygame.draw.rect(modal, self.border_color, (21, item_y, self.width - 40, 40), 1)
 
             # Item text
             name_text = self.font.render(item["name"], True, text_color)
-            screen.blit(name_text, (self.x + 30, item_y + 5))
+            modal.blit(name_text, (31, item_y + 5))
 
             desc_text = self.small_font.render(item["description"], True, (180, 180, 180))
-            screen.blit(desc_text, (self.x + 30, item_y + 25))
+            modal.blit(desc_text, (31, item_y + 25))
 
             # Price
             price_text = self.font.render(f"{item['price']} coins", True, (255, 215, 0))
-            price_rect = price_text.get_rect(right=self.x + self.width - 30, centery=item_y + 20)
-            screen.blit(price_text, price_rect)
-
-        # Instructions
-        instructions = [
-            "Click items to purchase (Coming Soon!)",
-            "ESC or TAB to close"
-        ]
-
-        for i, instruction in enumerate(instructions):
-            inst_text = self.small_font.render(instruction, True, (150, 150, 150))
-            inst_rect = inst_text.get_rect(centerx=self.x + self.width // 2,
-                                         y=self.y + self.height - 50 + i * 20)
-            screen.blit(inst_text, inst_rect)
+            price_rect = price_text.get_rect(right=1 + self.width - 30, centery=item_y + 20)
+            modal.blit(price_text, price_rect)
+        return modal
 
     def _render_gradient_rect(self, screen: pygame.Surface, x: int, y: int, width: int, height: int,
                             start_color: tuple, end_color: tuple):
@@ -272,4 +334,4 @@ class ShopModal:
         for i in range(height):
             ratio = i / height
             color = tuple(int(start_color[j] + (end_color[j] - start_color[j]) * ratio) for j in range(3))
-            pygame.draw.line(screen, color, (x, y + i), (x + width, y + i))
\ No newline at end of file
+            pygame.draw.line(screen, color, (x, y + i), (x + width, y + i))
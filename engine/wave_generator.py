@@ -0,0 +1,115 @@
+"""
+Endless-mode waves: seeded, formula-driven, and streamed one spawn event at a time
+"""
+
+import random
+from typing import Dict, Iterator, List, Tuple
+
+# Default ceiling on one wave's enemy count: as many as split mode's snapshot can show
+MAX_WAVE_COUNT = 16384
+
+# Used for any key missing from the "endless" section of tuning.json
+DEFAULT_ENDLESS = {
+    "enabled": False,
+    "base_count": 12,
+    "wave_scale_factor": 1.15,  # Enemy count grows by this factor per wave
+    "max_count": MAX_WAVE_COUNT,  # Most enemies in one wave, after modifiers
+    "base_enemy_health_multiplier": 1.15,  # Health is multiplied by this once per tier
+    "health_tier_waves": 3,
+    "speed_per_wave": 0.02,
+    "max_speed_multiplier": 1.8,
+    "spawn_duration": 12.0,  # Seconds over which a wave's spawns are spread...
+    "max_spawn_interval": 0.8,  # ...but never slower than one spawn per this many seconds
+    "mix": [{"type": "slime", "weight": 1.0, "from_wave": 1}],
+    "modifiers": [
+        {"name": "swarm", "every": 5, "count": 2.0, "health": 0.5},
+        {"name": "brutes", "every": 8, "count": 0.4, "health": 3.0, "speed": 0.75, "size": 1.5}
+    ]
+}
+
+# Scaled templates are registered under "<type>@endless", replaced at every wave start
+ENDLESS_SUFFIX = "@endless"
+
+class WavePlan:
+    """Everything the formulas decided about one wave"""
+
+    __slots__ = ("wave", "count", "health", "speed", "size", "interval", "modifiers")
+
+    def __init__(self, wave: int, count: int, health: float, speed: float, size: float,
+                 interval: float, modifiers: List[str]):
+        self.wave = wave
+        self.count = count
+        self.health = health
+        self.speed = speed
+        self.size = size
+        self.interval = interval
+        self.modifiers = modifiers
+
+
+class WaveGenerator:
+    """Turns a wave number into a WavePlan, scaled templates and a lazy spawn stream
+
+    Nothing proportional to the wave size is ever built: spawns() yields (time, template)
+    events on demand, so a 50,000-enemy wave costs the same memory as a 10-enemy one
+    until the enemies are actually spawned. Each wave draws from its own seeded stream,
+    so its contents do not depend on what happened during earlier waves.
+    """
+
+    def __init__(self, config: dict, enemy_templates: Dict[str, dict], seed: int):
+        self.config = dict(DEFAULT_ENDLESS, **config)
+        self.enemy_templates = enemy_templates
+        self.seed = seed
+
+    def plan(self, wave: int) -> WavePlan:
+        config = self.config
+        count = config["base_count"] * config["wave_scale_factor"] ** (wave - 1)
+        health = config["base_enemy_health_multiplier"] ** ((wave - 1) // max(1, config["health_tier_waves"]))
+        speed = min(config["max_speed_multiplier"], 1.0 + config["speed_per_wave"] * (wave - 1))
+        size = 1.0
+
+        modifiers = []
+        for modifier in config["modifiers"]:
+            if wave % modifier["every"] == 0:
+                modifiers.append(modifier["name"])
+                count *= modifier.get("count", 1.0)
+                health *= modifier.get("health", 1.0)
+                speed *= modifier.get("speed", 1.0)
+                size *= modifier.get("size", 1.0)
+
+        count = max(1, int(round(min(count, config["max_count"]))))
+        interval = min(config["max_spawn_interval"], config["spawn_duration"] / count)
+        return WavePlan(wave, count, health, speed, size, interval, modifiers)
+
+    def templates(self, plan: WavePlan) -> Dict[str, dict]:
+        """This wave's scaled copy of every enemy type in the mix"""
+        scaled = {}
+        for entry in self._mix(plan.wave):
+            base = self.enemy_templates[entry["type"]]
+            template = dict(base)
+            template["health"] = max(1, int(round(base.get("health", 50) * plan.health)))
+            template["speed"] = base.get("speed", 100) * plan.speed
+            template["size"] = max(4, int(round(base.get("size", 24) * plan.size)))
+            scaled[entry["type"] + ENDLESS_SUFFIX] = template
+        return scaled
+
+    def spawns(self, plan: WavePlan) -> Iterator[Tuple[float, str]]:
+        """Lazy stream of (spawn_time, template_name), in time order"""
+        mix = self._mix(plan.wave)
+        if not mix:
+            return iter(())
+        names = [entry["type"] + ENDLESS_SUFFIX for entry in mix]
+        cumulative = []
+        total = 0.0
+        for entry in mix:
+            total += entry.get("weight", 1.0)
+            cumulative.append(total)
+
+        rng = random.Random(self.seed * 1_000_003 + plan.wave)
+        types = (rng.choices(names, cum_weights=cumulative)[0] for _ in range(plan.count))
+        return ((i * plan.interval, name) for i, name in enumerate(types))
+
+    def _mix(self, wave: int) -> list:
+        """Mix entries unlocked by this wave whose enemy type exists"""
+        return [entry for entry in self.config["mix"]
+                if entry.get("from_wave", 1) <= wave and entry["type"] in self.enemy_templates]
+
@@ -2,62 +2,74 @@
 Wave management system for spawning enemies in timed waves
 """
 
-import json
+import heapq
 import random
 import pygame
-from typing import List, Dict
+from typing import List, Dict, Optional
 from engine.enemy import Enemy
+from engine.data_registry import DataRegistry, default_registry
+from engine.wave_generator import WaveGenerator
+
+# Default cap on enemies constructed per update; the rest wait for later ticks
+DEFAULT_SPAWN_BUDGET = 8
 
 class WaveManager:
     """Manages enemy waves based on JSON configuration"""
 
-    def __init__(self, screen_width: int, screen_height: int):
+    def __init__(self, screen_width: int, screen_height: int, enemy_store=None, enemy_pool=None,
+                 rng: random.Random = random, data: DataRegistry = None,
+                 spawn_budget: int = DEFAULT_SPAWN_BUDGET, endless: dict = None):
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.current_wave = 1
         self.wave_complete = False
         self.wave_data = None
-        self.enemy_templates = {}
 
-        # Spawn timing
-        self.spawn_queue = []
+        # Waves and enemy templates come from memory; nothing here touches the disk
+        self.data = data if data is not None else default_registry()
+        self.enemy_templates = dict(self.data.enemies)
+
+        # Optional EnemyStore - when set, enemies are spawned as array-backed proxies
+        self.enemy_store = enemy_store
+
+        # Random stream for spawn positions and enemy AI (the scene's seeded RNG)
+        self.rng = rng
+
+        # Optional Pool of Enemy objects, recycled instead of allocating per spawn
+        self.enemy_pool = enemy_pool
+
+        # Spawn timing: a lazy, time-ordered stream of (spawn_time, enemy_type) events,
+        # drained at most spawn_budget per update. next_spawn is the stream's head.
+        self.spawn_events = iter(())
+        self.next_spawn = None
+        self.spawns_left = 0
         self.spawn_timer = 0.0
+        self.spawn_budget = spawn_budget
         self.enemies_spawned = 0
+
+        # Maintained incrementally: +1 per spawn, -n per removed()
+        self.enemies_alive = 0
         self.enemies_remaining = 0
 
-        # Load enemy templates
-        self._load_enemy_templates()
-
-    def _load_enemy_templates(self):
-        """Load enemy configuration from JSON files"""
-        try:
-            with open("data/enemies/slime.json", "r") as f:
-                self.enemy_templates["slime"] = json.load(f)
-        except FileNotFoundError:
-            # Fallback if file doesn't exist
-            self.enemy_templates["slime"] = {
-                "health": 50,
-                "speed": 80,
-                "damage": 20,
-                "size": 24,
-                "color": [100, 255, 100],
-                "coins": 5,
-                "chase_range": 300,
-                "attack_cooldown": 1.5
-            }
+        # Endless mode: every wave comes from the generator instead of data/waves
+        self.generator = None
+        self.wave_plan = None
+        if endless is not None and endless.get("enabled", False):
+            self.generator = WaveGenerator(endless, self.enemy_templates, rng.getrandbits(32))
 
     def load_wave(self, wave_number: int) -> bool:
-        """Load wave data from JSON file"""
-        try:
-            filename = f"data/waves/wave_{wave_number:02d}.json"
-            with open(filename, "r") as f:
-                self.wave_data = json.load(f)
-                self._prepare_spawn_queue()
-                return True
-        except FileNotFoundError:
-            # Generate a procedural wave if file doesn't exist
+        """Start a wave from the registry, or generate one past the hand-authored waves"""
+        if self.generator is not None:
+            self._start_endless_wave(wave_number)
+            return True
+
+        wave_data = self.data.wave(wave_number)
+        if wave_data is None:
             self._generate_procedural_wave(wave_number)
             return True
+        self.wave_data = wave_data
+        self._prepare_spawn_queue()
+        return True
 
     def _generate_procedural_wave(self, wave_number: int):
         """Generate a procedural wave if JSON doesn't exist"""
@@ -74,80 +86,127 @@ class WaveManager:
         self._prepare_spawn_queue()
 
     def _prepare_spawn_queue(self):
-        """Prepare immediate spawn of all enemies at wave start"""
-        self.spawn_queue = []
+        """Schedule every enemy of the wave; each group spawns one enemy per spawn_delay"""
+        streams = []
+        order = 0
+        for enemy_group in self.wave_data["enemies"]:
+            count = enemy_group["count"]
+            streams.append(self._group_events(enemy_group["type"], count, enemy_group.get("spawn_delay", 0.0),
+                                              order))
+            order += count
+
+        # Groups run side by side; ties go to the earlier group, as listed in the file
+        events = ((spawn_time, enemy_type) for spawn_time, _, enemy_type in heapq.merge(*streams))
+        self._start_spawns(events, order)
+
+    @staticmethod
+    def _group_events(enemy_type: str, count: int, spawn_delay: float, order: int):
+        return ((i * spawn_delay, order + i, enemy_type) for i in range(count))
+
+    def _start_endless_wave(self, wave_number: int):
+        """Scale this wave's templates and start streaming its spawns"""
+        plan = self.wave_plan = self.generator.plan(wave_number)
+        scaled = self._apply_endless_templates()
+        self._start_spawns(self.generator.spawns(plan), plan.count if scaled else 0)
+
+    def _apply_endless_templates(self) -> dict:
+        """Install the current wave's scaled templates (the previous wave's enemies are all dead)"""
+        scaled = self.generator.templates(self.wave_plan)
+        for name, template in scaled.items():
+            self.enemy_templates[name] = template
+            if self.enemy_store is not None:
+                self.enemy_store.register_template(name, template)
+        return scaled
+
+    def set_enemy_templates(self, enemy_templates: dict):
+        """Swap in new base templates (data hot reload), rescaling the running endless wave"""
+        self.enemy_templates = dict(enemy_templates)
+        if self.generator is not None:
+            self.generator.enemy_templates = self.enemy_templates
+            if self.wave_plan is not None:
+                self._apply_endless_templates()
+
+    def _start_spawns(self, events, count: int):
+        self.spawn_events = iter(events)
+        self.next_spawn = next(self.spawn_events, None)
+        self.spawns_left = count
         self.spawn_timer = 0.0
         self.enemies_spawned = 0
         self.wave_complete = False
+        self.enemies_remaining = self.enemies_alive + count
 
-        total_enemies = 0
-        for enemy_group in self.wave_data["enemies"]:
-            enemy_type = enemy_group["type"]
-            count = enemy_group["count"]
-
-            # Spawn all enemies immediately (spawn_time = 0)
-            for i in range(count):
-                self.spawn_queue.append({
-                    "type": enemy_type,
-                    "spawn_time": 0.0  # All spawn immediately
-                })
-                total_enemies += 1
-
-        self.enemies_remaining = total_enemies
+    def removed(self, count: int):
+        """The scene retired this many dead enemies"""
+        self.enemies_alive -= count
+        self.enemies_remaining -= count
 
-    def update(self, dt: float, enemies: List[Enemy]) -> List[Enemy]:
-        """Update wave spawning and return new enemies to add"""
+    def update(self, dt: float) -> List[Enemy]:
+        """Advance the wave clock and return the enemies spawned this tick"""
         new_enemies = []
 
-        if not self.wave_data:
+        if not self.wave_data and self.wave_plan is None:
             return new_enemies
 
         self.spawn_timer += dt
 
-        # Spawn enemies from queue
-        while (self.spawn_queue and
-               self.spawn_timer >= self.spawn_queue[0]["spawn_time"]):
-
-            spawn_info = self.spawn_queue.pop(0)
-            enemy = self._spawn_enemy(spawn_info["type"])
+        # Due spawns, oldest first, up to the budget; anything left over is already due next tick
+        budget = self.spawn_budget
+        while self.next_spawn is not None and budget > 0 and self.next_spawn[0] <= self.spawn_timer:
+            enemy = self._spawn_enemy(self.next_spawn[1])
+            self.spawns_left -= 1
+            self.next_spawn = next(self.spawn_events, None)
             if enemy:
                 new_enemies.append(enemy)
                 self.enemies_spawned += 1
+                budget -= 1
 
-        # Update enemies remaining count
-        alive_enemies = len([e for e in enemies if e.alive])
-        self.enemies_remaining = alive_enemies + len(self.spawn_queue)
+        self.enemies_remaining = self.enemies_alive + self.spawns_left
 
         # Check if wave is complete
-        if not self.spawn_queue and alive_enemies == 0 and not self.wave_complete:
+        if self.next_spawn is None and self.enemies_alive == 0 and not self.wave_complete:
             self.wave_complete = True
 
         return new_enemies
 
+    def spawn_now(self, enemy_type: str) -> Optional[Enemy]:
+        """Spawn one enemy at the arena edge right away, outside the wave schedule
+
+        It counts as alive like any other, so the wave is not complete until it dies.
+        Returns None for an unknown type.
+        """
+        return self._spawn_enemy(enemy_type)
+
     def _spawn_enemy(self, enemy_type: str) -> Enemy:
         """Spawn a single enemy at arena edge with slight position variation"""
         if enemy_type not in self.enemy_templates:
             return None
 
         # Choose random edge of screen with variation
-        edge = random.randint(0, 3)
+        rng = self.rng
+        edge = rng.randint(0, 3)
         margin = 30
 
         if edge == 0:  # Top
-            x = random.randint(margin, self.screen_width - margin)
-            y = random.randint(-margin, -10)
+            x = rng.randint(margin, self.screen_width - margin)
+            y = rng.randint(-margin, -10)
         elif edge == 1:  # Right
-            x = random.randint(self.screen_width + 10, self.screen_width + margin)
-            y = random.randint(margin, self.screen_height - margin)
+            x = rng.randint(self.screen_width + 10, self.screen_width + margin)
+            y = rng.randint(margin, self.screen_height - margin)
         elif edge == 2:  # Bottom
-            x = random.randint(margin, self.screen_width - margin)
-            y = random.randint(self.screen_height + 10, self.screen_height + margin)
+            x = rng.randint(margin, self.screen_width - margin)
+            y = rng.randint(self.screen_height + 10, self.screen_height + margin)
         else:  # Left
-            x = random.randint(-margin, -10)
-            y = random.randint(margin, self.screen_height - margin)
-
-        enemy_data = self.enemy_templates[enemy_type].copy()
-        return Enemy(x, y, enemy_data)
+            x = rng.randint(-margin, -10)
+            y = rng.randint(margin, self.screen_height - margin)
+
+        # Enemies only read the template, so it is shared rather than copied per spawn
+        enemy_data = self.enemy_templates[enemy_type]
+        self.enemies_alive += 1
+        if self.enemy_store is not None:
+            return self.enemy_store.spawn(x, y, enemy_data, enemy_type, rng)
+        if self.enemy_pool is not None:
+            return self.enemy_pool.acquire(x, y, enemy_data, rng)
+        return Enemy(x, y, enemy_data, rng)
 
     def next_wave(self):
         """Advance to the next wave"""
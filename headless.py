@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+RetroRumble - Headless runner
+Simulates ArenaScene at a fixed timestep as fast as the CPU allows, with no window and no rendering
+"""
+
+import argparse
+import os
+import time
+import pygame
+from engine.input import InputProvider, BotInputProvider, RandomInputProvider, ScriptedInputProvider
+from engine.replay import Replay, ReplayInputProvider, ReplayRecorder, EXT_RESTART, EXT_RESIZE, tuning_crc
+
+def init_headless_pygame():
+    """Initialize pygame without needing a display or audio device"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+class HeadlessRunner:
+    """Drives an ArenaScene with a pluggable input provider and never calls render()"""
+
+    def __init__(self, input_provider: InputProvider = None, width: int = 1024, height: int = 768,
+                 dt: float = 1.0 / 60.0, restart_on_death: bool = False, seed: int = None,
+                 tuning_data: dict = None):
+        init_headless_pygame()
+
+        # Imported here so SDL sees the dummy drivers before anything touches pygame.font
+        from scenes.arena_scene import ArenaScene
+
+        self.screen = pygame.Surface((width, height))
+        self.scene = ArenaScene(self.screen, input_provider or BotInputProvider(), verbose=False, seed=seed,
+                                tuning_data=tuning_data)
+        self.dt = dt
+        self.restart_on_death = restart_on_death
+
+        # Totals across restarts
+        self.steps = 0
+        self.deaths = 0
+        self.waves_cleared = 0
+        self.best_wave = 1
+
+    def step(self):
+        """Advance the simulation by one fixed tick"""
+        scene = self.scene
+        scene.update(self.dt)
+        self.steps += 1
+
+        if not scene.player.alive:
+            self.deaths += 1
+            wave = scene.wave_manager.current_wave
+            self.waves_cleared += wave - 1
+            self.best_wave = max(self.best_wave, wave)
+            if self.restart_on_death:
+                scene.restart_game()
+
+    def run(self, max_steps: int = None, max_waves: int = None, max_seconds: float = None) -> dict:
+        """Step until a limit is hit (or the player dies without restarts) and report throughput"""
+        scene = self.scene
+        start_steps = self.steps
+        start = time.perf_counter()
+
+        while True:
+            if max_steps is not None and self.steps - start_steps >= max_steps:
+                break
+            if max_waves is not None and self.total_waves_cleared() >= max_waves:
+                break
+            if max_seconds is not None and time.perf_counter() - start >= max_seconds:
+                break
+            if not scene.player.alive and not self.restart_on_death:
+                break
+            self.step()
+
+        wall_seconds = time.perf_counter() - start
+        steps = self.steps - start_steps
+        return {
+            "steps": steps,
+            "sim_seconds": steps * self.dt,
+            "wall_seconds": wall_seconds,
+            "steps_per_sec": steps / wall_seconds if wall_seconds > 0 else 0.0,
+            "waves_cleared": self.total_waves_cleared(),
+            "deaths": self.deaths,
+            "best_wave": max(self.best_wave, scene.wave_manager.current_wave),
+            "coins": scene.coins
+        }
+
+    def total_waves_cleared(self) -> int:
+        """Waves cleared across all runs so far, including the one in progress"""
+        current = self.scene.wave_manager.current_wave - 1 if self.scene.player.alive else 0
+        return self.waves_cleared + current
+
+
+def play_replay(path: str) -> dict:
+    """Re-simulate a recorded run headless and check it against the recorded final state"""
+    replay = Replay.load(path)
+    provider = ReplayInputProvider()
+    runner = HeadlessRunner(provider, replay.width, replay.height, replay.dt, seed=replay.seed)
+    scene = runner.scene
+
+    if tuning_crc(scene.tuning_data) != replay.tuning_crc:
+        print("WARNING: data/tuning.json differs from the recording - replay will likely diverge")
+
+    start = time.perf_counter()
+    for state, ext, size in replay.frames():
+        if ext & EXT_RESIZE:
+            scene.resize(pygame.Surface(size))
+        if ext & EXT_RESTART:
+            scene.restart_game()
+        provider.current = state
+        scene.update(replay.dt)
+        runner.steps += 1
+    wall_seconds = time.perf_counter() - start
+
+    digest = scene.state_digest()
+    return {
+        "steps": runner.steps,
+        "recorded_steps": replay.ticks,
+        "wall_seconds": wall_seconds,
+        "steps_per_sec": runner.steps / wall_seconds if wall_seconds > 0 else 0.0,
+        "digest": digest,
+        "matches": digest == replay.final_digest
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run RetroRumble headless at a fixed timestep")
+    parser.add_argument("--input", choices=["bot", "random", "idle"], default="bot",
+                        help="input provider driving the player")
+    parser.add_argument("--steps", type=int, default=None, help="stop after this many ticks")
+    parser.add_argument("--waves", type=int, default=None, help="stop after this many waves are cleared")
+    parser.add_argument("--seconds", type=float, default=None, help="stop after this much wall-clock time")
+    parser.add_argument("--tick-rate", type=float, default=60.0, help="simulation ticks per simulated second")
+    parser.add_argument("--restart", action="store_true", help="restart on death instead of stopping")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the simulation and the random input provider")
+    parser.add_argument("--record", metavar="PATH", help="record the run to a replay file")
+    parser.add_argument("--replay", metavar="PATH", help="re-simulate a replay file and verify it")
+    args = parser.parse_args()
+
+    if args.replay:
+        report = play_replay(args.replay)
+        status = "OK" if report["matches"] else "MISMATCH"
+        print(f"{status}: replayed {report['steps']}/{report['recorded_steps']} steps "
+              f"in {report['wall_seconds']:.2f}s - {report['steps_per_sec']:.0f} steps/sec")
+        print(f"{status}: final state {report['digest']}")
+        return
+
+    if args.input == "bot":
+        provider = BotInputProvider()
+    elif args.input == "random":
+        provider = RandomInputProvider(args.seed)
+    else:
+        provider = ScriptedInputProvider([])
+
+    if args.steps is None and args.waves is None and args.seconds is None:
+        args.seconds = 10.0
+
+    runner = HeadlessRunner(provider, dt=1.0 / args.tick_rate, restart_on_death=args.restart, seed=args.seed)
+    recorder = ReplayRecorder.for_scene(runner.scene, runner.dt) if args.record else None
+    report = runner.run(args.steps, args.waves, args.seconds)
+    if recorder is not None:
+        recorder.save(args.record, runner.scene)
+        print(f"OK: recorded {recorder.ticks} ticks to {args.record}")
+
+    print(f"OK: {report['steps']} steps ({report['sim_seconds']:.1f}s simulated) "
+          f"in {report['wall_seconds']:.2f}s - {report['steps_per_sec']:.0f} steps/sec")
+    print(f"OK: waves cleared {report['waves_cleared']}, best wave {report['best_wave']}, "
+          f"deaths {report['deaths']}, coins {report['coins']}")
+
+if __name__ == "__main__":
+    main()
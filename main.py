@@ -4,13 +4,33 @@ RetroRumble - Main entry point
 A top-down arena shooter with wave-based enemies
 """
 
+import argparse
 import pygame
 import sys
 from scenes.arena_scene import ArenaScene
-from engine.ui import HUD, ShopModal
+from scenes.remote_arena import RemoteArenaScene
+from engine.replay import ReplayRecorder
+from engine.profiler import Profiler, ProfilerOverlay
+from engine.timestep import FixedTimestep
 
 def main():
     """Main game entry point"""
+    parser = argparse.ArgumentParser(description="RetroRumble")
+    parser.add_argument("--seed", type=int, default=None, help="seed for all gameplay randomness")
+    parser.add_argument("--record", metavar="PATH", help="record input to a replay file")
+    parser.add_argument("--tick-rate", type=float, default=60.0,
+                        help="simulation ticks per second, independent of the frame rate")
+    parser.add_argument("--profile", action="store_true", help="start with the frame profiler recording")
+    parser.add_argument("--dirty-rects", action="store_true",
+                        help="redraw and present only the changed parts of the screen")
+    parser.add_argument("--watch-data", action="store_true",
+                        help="reload files under data/ when they change on disk")
+    parser.add_argument("--split", action="store_true",
+                        help="run the simulation in a worker process; this one only handles input and rendering")
+    args = parser.parse_args()
+    if args.split and (args.record or args.dirty_rects):
+        parser.error("--split cannot be combined with --record or --dirty-rects")
+
     pygame.init()
     pygame.mixer.init()
 
@@ -21,54 +41,91 @@ def main():
     screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
     pygame.display.set_caption("RetroRumble")
 
-    # Game clock for fixed timestep
+    # The display runs at up to FPS; the simulation advances in fixed ticks and rendering
+    # interpolates between the last two
     clock = pygame.time.Clock()
     FPS = 60
+    timestep = FixedTimestep(args.tick_rate)
+
+    # Frame profiler: F3 toggles recording and the overlay, F4 exports a Chrome trace
+    profiler = Profiler(enabled=args.profile)
+    profiler_overlay = ProfilerOverlay()
+    profiler_overlay.visible = args.profile
 
     # Initialize arena scene
-    arena = ArenaScene(screen)
+    if args.split:
+        arena = RemoteArenaScene(screen, seed=args.seed, profiler=profiler, tick_rate=args.tick_rate)
+    else:
+        arena = ArenaScene(screen, seed=args.seed, profiler=profiler, dirty_rects=args.dirty_rects)
+    print(f"OK: Seed {arena.seed}")
+
+    recorder = ReplayRecorder.for_scene(arena, timestep.dt) if args.record else None
 
     print("OK: Game starting - main loop initialized")
 
     # Main game loop
     running = True
-    while running:
-        dt = clock.tick(FPS) / 1000.0  # Delta time in seconds
-
-        # Handle events
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            elif event.type == pygame.KEYDOWN:
-                keys = pygame.key.get_pressed()
-                if event.key == pygame.K_SPACE and (keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]):
-                    # Toggle fullscreen
-                    fullscreen = not fullscreen
-                    if fullscreen:
-                        screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
-                        # Update arena scene with new screen size
-                        arena.screen = screen
-                        arena.screen_rect = screen.get_rect()
-                        arena.hud = HUD(screen.get_width(), screen.get_height())
-                        arena.shop = ShopModal(screen.get_width(), screen.get_height())
-                        arena.wave_manager.screen_width = screen.get_width()
-                        arena.wave_manager.screen_height = screen.get_height()
-                    else:
-                        screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                        # Update arena scene with original screen size
-                        arena.screen = screen
-                        arena.screen_rect = screen.get_rect()
-                        arena.hud = HUD(SCREEN_WIDTH, SCREEN_HEIGHT)
-                        arena.shop = ShopModal(SCREEN_WIDTH, SCREEN_HEIGHT)
-                        arena.wave_manager.screen_width = SCREEN_WIDTH
-                        arena.wave_manager.screen_height = SCREEN_HEIGHT
-            arena.handle_event(event)
-
-        # Update and render
-        arena.update(dt)
-        arena.render()
-
-        pygame.display.flip()
+    try:
+        while running:
+            frame_time = clock.tick(FPS) / 1000.0  # Wall-clock seconds since the last frame
+            profiler.begin_frame()
+
+            # Handle events
+            with profiler.scope("events"):
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        running = False
+                    elif event.type == pygame.KEYDOWN:
+                        keys = pygame.key.get_pressed()
+                        if event.key == pygame.K_SPACE and (keys[pygame.K_LSHIFT] or keys[pygame.K_RSHIFT]):
+                            # Toggle fullscreen
+                            fullscreen = not fullscreen
+                            if fullscreen:
+                                screen = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+                            else:
+                                screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+                            # Update arena scene with new screen size
+                            arena.resize(screen)
+                        elif event.key == pygame.K_F3:
+                            profiler.toggle()
+                            profiler_overlay.visible = profiler.enabled
+                        elif event.key == pygame.K_F4:
+                            profiler.export_chrome_trace("trace.json")
+                            print("OK: Frame trace written to trace.json")
+                    arena.handle_event(event)
+
+            # Development hot reload; the registry throttles its own polling
+            if args.watch_data:
+                changed = arena.data.poll()
+                if changed:
+                    arena.reload_data()
+                    print(f"OK: Reloaded {', '.join(changed)}")
+
+            # Update and render
+            with profiler.scope("update"):
+                if args.split:
+                    arena.update(frame_time)  # The worker keeps its own fixed tick
+                else:
+                    for _ in range(timestep.advance(frame_time)):
+                        arena.update(timestep.dt)
+            with profiler.scope("render"):
+                if args.split:
+                    arena.render(force_full=profiler_overlay.visible)
+                else:
+                    arena.render(force_full=profiler_overlay.visible, alpha=timestep.alpha)
+                profiler_overlay.render(screen, profiler)
+
+            with profiler.scope("flip"):
+                arena.present()
+            profiler.end_frame()
+    finally:
+        if args.split:
+            arena.close()
+
+        # Saved even if the loop crashes, so field recordings can reproduce the failure
+        if recorder is not None:
+            recorder.save(args.record, arena)
+            print(f"OK: Replay saved to {args.record} ({recorder.ticks} ticks)")
 
     pygame.quit()
     sys.exit()
@@ -3,23 +3,66 @@ Main arena scene containing the game loop and entity management
 """
 
 import pygame
-import json
+import random
+import numpy as np
+import hashlib
+import struct
 from typing import List
 from engine.player import Player
 from engine.enemy import Enemy
-from engine.projectile import Projectile
-from engine.wave_manager import WaveManager
+from engine.enemy_store import EnemyStore
+from engine.projectile_engine import ProjectileEngine
+from engine.wave_manager import WaveManager, DEFAULT_SPAWN_BUDGET
+from engine.ai_lod import AIScheduler
+from engine.flow_field import FlowField
+from engine.flocking import Flocking
+from engine.particles import ParticleSystem
+from engine.combat_text import CombatText
+from engine.text_cache import default_text_cache
+from engine.pool import Pool
+from engine.input import InputProvider, PygameInputProvider
+from engine.spatial_hash import SpatialHash, LAYER_PLAYER, LAYER_HOSTILE
 from engine.ui import HUD, ShopModal
+from engine.profiler import Profiler
+from engine.dirty_rects import DirtyRectRenderer
+from engine.sprite_batch import SpriteBatchRenderer
+from engine.assets import AssetManager
+from engine.data_registry import DataRegistry, default_registry
 
 class ArenaScene:
     """Main game scene with player, enemies, and wave management"""
 
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, input_provider: InputProvider = None, verbose: bool = True,
+                 seed: int = None, tuning_data: dict = None, profiler: Profiler = None,
+                 dirty_rects: bool = False, data: DataRegistry = None):
         self.screen = screen
         self.screen_rect = screen.get_rect()
 
-        # Load tuning data
-        self.tuning_data = self._load_tuning_data()
+        # Every random decision in the simulation draws from this one stream, so a seed plus
+        # the per-tick input reproduces a run exactly
+        self.seed = seed if seed is not None else random.randrange(2**32)
+        self.rng = random.Random(self.seed)
+
+        # Optional ReplayRecorder fed with every simulated tick
+        self.replay_recorder = None
+
+        # Scoped phase timers; a disabled profiler costs almost nothing
+        self.profiler = profiler if profiler is not None else Profiler()
+
+        # Where player input comes from - live keyboard/mouse unless a script or bot is plugged in
+        self.input_provider = input_provider if input_provider is not None else PygameInputProvider()
+        self.verbose = verbose
+
+        # Tuning, enemy templates and waves, parsed once per process (callers such as
+        # benchmarks may pass their own tuning)
+        self.data = data if data is not None else default_registry()
+        self.tuning_data = tuning_data if tuning_data is not None else self.data.tuning
+
+        # Tuning passed in stays in force over tuning.json; reload_data compares the registry's
+        # arena and enemies against these to redo only what changed
+        self.fixed_tuning = tuning_data is not None
+        self.arena_data = self.data.arena
+        self.enemy_data = self.data.enemies
 
         # Initialize game entities
         self.player = Player(
@@ -28,14 +71,59 @@ class ArenaScene:
             self.tuning_data
         )
 
-        self.enemies: List[Enemy] = []
-        self.projectiles: List[Projectile] = []
+        pool_sizes = self.tuning_data.get("pools", {})
+        self.projectiles = ProjectileEngine(pool_sizes.get("projectiles", 1024))
+        self.enemy_pool = Pool(Enemy, pool_sizes.get("enemies", 0))
+
+        # Opt-in struct-of-arrays enemy simulation; self.enemies then holds its proxies
+        self.enemy_store = None
+        if self.tuning_data.get("game", {}).get("enemy_store", False):
+            self.enemy_store = EnemyStore()
+            self.enemies: List[Enemy] = self.enemy_store.proxies
+        else:
+            self.enemies: List[Enemy] = []
+
+        # Arena obstacles and the flow field enemies follow around them (None in an open arena)
+        self.flow_field = self._build_flow_field()
+
+        # Decides which enemies re-steer each tick (distance tiers plus a per-tick budget)
+        self.ai = AIScheduler(self.tuning_data.get("ai"))
+
+        # Separation steering so chasing enemies spread out instead of stacking
+        self.flocking = Flocking(self.profiler)
+
+        # Hit sparks and death bursts; visual only, with their own random stream
+        self.particles = ParticleSystem(self.tuning_data.get("particles"), self.seed)
+
+        # Shared fonts and rendered text, and damage numbers composed from its glyph atlases
+        self.text = default_text_cache()
+        self.combat_text = CombatText(self.tuning_data.get("combat_text"), self.text, self.seed)
 
         # Game systems
-        self.wave_manager = WaveManager(self.screen_rect.width, self.screen_rect.height)
+        self.wave_manager = self._build_wave_manager()
         self.hud = HUD(self.screen_rect.width, self.screen_rect.height)
         self.shop = ShopModal(self.screen_rect.width, self.screen_rect.height)
 
+        # Packed sprite atlases, loaded on first use (build with python -m engine.assets)
+        self.assets = AssetManager()
+
+        # Entities are drawn from cached sprites, one blits() call per layer; the player and
+        # enemies come from the atlas when one has been built
+        self.sprite_renderer = SpriteBatchRenderer(self.assets)
+
+        # Interpolation factor of the frame being rendered (see render())
+        self.render_alpha = 1.0
+
+        # Opt-in dirty-rect rendering; render() leaves the rects to present in dirty_regions
+        # (None means the whole screen)
+        self.dirty_renderer = None
+        self.dirty_regions = None
+        self.set_dirty_rects(dirty_rects)
+
+        # Collision broadphase, rebuilt every tick after enemies move
+        cell_size = self.tuning_data.get("game", {}).get("collision_cell_size", 64)
+        self.collision_index = SpatialHash(cell_size)
+
         # Game state
         self.coins = 0
         self.game_paused = False
@@ -48,10 +136,14 @@ class ArenaScene:
         # Input state
         self.mouse_pressed = False
 
-        print(f"OK: ArenaScene initialized - starting wave {self.wave_manager.current_wave}")
+        if self.verbose:
+            print(f"OK: ArenaScene initialized - starting wave {self.wave_manager.current_wave}")
 
     def restart_game(self):
         """Restart the game to initial state"""
+        if self.replay_recorder is not None:
+            self.replay_recorder.mark_restart()
+
         # Reset player
         self.player = Player(
             self.screen_rect.centerx - 16,
@@ -60,8 +152,16 @@ class ArenaScene:
         )
 
         # Clear all entities
-        self.enemies.clear()
+        if self.enemy_store is not None:
+            self.enemy_store.clear()
+        else:
+            for enemy in self.enemies:
+                self.enemy_pool.release(enemy)
+            self.enemies.clear()
         self.projectiles.clear()
+        self.particles.clear()
+        self.combat_text.clear()
+        self.ai.reset()
 
         # Reset game state
         self.coins = 0
@@ -70,29 +170,118 @@ class ArenaScene:
         self.mouse_pressed = False
 
         # Reset wave manager
-        self.wave_manager = WaveManager(self.screen_rect.width, self.screen_rect.height)
+        self.wave_manager = self._build_wave_manager()
         self.wave_manager.load_wave(1)
 
-        print("OK: Game restarted - back to wave 1")
-
-    def _load_tuning_data(self) -> dict:
-        """Load game tuning data from JSON"""
-        try:
-            with open("data/tuning.json", "r") as f:
-                return json.load(f)
-        except FileNotFoundError:
-            # Return default tuning if file doesn't exist
-            return {
-                "player": {
-                    "max_health": 100,
-                    "max_mana": 50,
-                    "move_speed": 300,
-                    "mana_regen": 20,
-                    "projectile_cost": 5,
-                    "projectile_speed": 500,
-                    "projectile_damage": 25
-                }
-            }
+        if self.verbose:
+            print("OK: Game restarted - back to wave 1")
+
+    def spawn_enemies(self, enemy_type: str, count: int):
+        """Spawn enemies immediately at the arena edges, outside any wave schedule"""
+        for _ in range(count):
+            enemy = self.wave_manager.spawn_now(enemy_type)
+            if enemy is not None and self.enemy_store is None:
+                self.enemies.append(enemy)
+
+    def resize(self, screen: pygame.Surface):
+        """Switch to a new display surface (e.g. fullscreen toggle) and rebuild size-dependent UI"""
+        if self.replay_recorder is not None:
+            self.replay_recorder.mark_resize(screen.get_width(), screen.get_height())
+
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.hud = HUD(self.screen_rect.width, self.screen_rect.height)
+        self.shop = ShopModal(self.screen_rect.width, self.screen_rect.height)
+        self.sprite_renderer.clear()  # The display format may have changed; assets notice on their own
+        self.text.clear()
+        self.wave_manager.screen_width = self.screen_rect.width
+        self.wave_manager.screen_height = self.screen_rect.height
+        self.flow_field = self._build_flow_field()
+        if self.dirty_renderer is not None:
+            self.dirty_renderer.set_background(self._build_background())
+
+    def set_dirty_rects(self, enabled: bool):
+        """Switch between dirty-rect and full-screen rendering"""
+        self.dirty_renderer = DirtyRectRenderer(self._build_background()) if enabled else None
+        self.dirty_regions = None
+
+    def state_digest(self) -> str:
+        """Hash of the simulation state, used to check that a replay reproduced a run exactly"""
+        digest = hashlib.sha256()
+        player = self.player
+        digest.update(struct.pack("<4d?", player.x, player.y, player.health, player.mana, player.alive))
+        digest.update(struct.pack("<3i", self.coins, self.wave_manager.current_wave,
+                                  self.wave_manager.enemies_remaining))
+        for enemy in self.enemies:
+            digest.update(struct.pack("<5d?", enemy.x, enemy.y, enemy.base_velocity_x,
+                                      enemy.base_velocity_y, enemy.health, enemy.alive))
+        for batch in (self.projectiles.friendly, self.projectiles.hostile):
+            n = batch.count
+            digest.update(batch.x[:n].tobytes())
+            digest.update(batch.y[:n].tobytes())
+        digest.update(repr(self.rng.getstate()).encode())
+        return digest.hexdigest()
+
+    def pool_stats(self) -> dict:
+        """Pool usage counters, for sizing the "pools" section of tuning.json"""
+        return {
+            "enemies": self.enemy_pool.stats(),
+            "friendly_projectiles": self.projectiles.friendly.stats(),
+            "hostile_projectiles": self.projectiles.hostile.stats()
+        }
+
+    def _build_wave_manager(self) -> WaveManager:
+        spawn_budget = self.tuning_data.get("game", {}).get("max_spawns_per_tick", DEFAULT_SPAWN_BUDGET)
+        return WaveManager(self.screen_rect.width, self.screen_rect.height, self.enemy_store, self.enemy_pool,
+                           self.rng, self.data, spawn_budget, self.tuning_data.get("endless"))
+
+    def _build_flow_field(self) -> FlowField:
+        arena = self.data.arena
+        if not arena.get("obstacles"):
+            return None
+        return FlowField(self.screen_rect.width, self.screen_rect.height, arena)
+
+    def reload_data(self):
+        """Pick up hot-reloaded data in place, redoing only what changed
+
+        The live player takes new tuning, later spawns new templates, and the AI schedule,
+        particles and damage numbers keep running under their new settings. Tuning passed
+        to the constructor is kept rather than replaced by tuning.json.
+        """
+        previous = self.tuning_data
+        if not self.fixed_tuning:
+            self.tuning_data = self.data.tuning
+        tuning = self.tuning_data
+        changed = {section for section in set(previous) | set(tuning) if previous.get(section) != tuning.get(section)}
+
+        if "player" in changed:
+            player = self.player
+            player.apply_tuning(tuning)
+            player.health = min(player.health, player.max_health)
+            player.mana = min(player.mana, player.max_mana)
+        if "game" in changed:
+            self.wave_delay_duration = tuning.get("game", {}).get("wave_delay_duration", 1.5)
+            self.wave_manager.spawn_budget = tuning.get("game", {}).get("max_spawns_per_tick", DEFAULT_SPAWN_BUDGET)
+        if "ai" in changed:
+            self.ai.apply_config(tuning.get("ai"))
+        if "particles" in changed:
+            self.particles.apply_config(tuning.get("particles"))
+        if "combat_text" in changed:
+            self.combat_text.apply_config(tuning.get("combat_text"))
+
+        if self.data.enemies != self.enemy_data:
+            self.enemy_data = self.data.enemies
+            self.wave_manager.set_enemy_templates(self.data.enemies)
+            if self.enemy_store is not None:
+                for name in self.enemy_store.template_ids:
+                    if name in self.data.enemies:
+                        self.enemy_store.register_template(name, self.data.enemies[name])
+
+        if self.data.arena != self.arena_data:
+            self.arena_data = self.data.arena
+            self.flow_field = self._build_flow_field()
+            if self.dirty_renderer is not None:
+                self.dirty_renderer.set_background(self._build_background())
 
     def handle_event(self, event):
         """Handle input events"""
@@ -133,102 +322,253 @@ class ArenaScene:
         if self.game_paused or self.shop.visible:
             return
 
+        # Input for this tick; a dead player takes none, but the tick is still recorded
+        input_state = self.input_provider.poll(self) if self.player.alive else None
+        if self.replay_recorder is not None:
+            self.replay_recorder.record(input_state)
+
         # Handle wave completion and delays
         if self.wave_manager.is_wave_complete():
             self.wave_start_delay += dt
             if self.wave_start_delay >= self.wave_delay_duration:
                 self.wave_manager.next_wave()
                 self.wave_start_delay = 0.0
-                print(f"OK: Starting wave {self.wave_manager.current_wave}")
+                if self.verbose:
+                    print(f"OK: Starting wave {self.wave_manager.current_wave}")
+
+        profiler = self.profiler
 
         # Update player
         if self.player.alive:
-            keys = pygame.key.get_pressed()
-            mouse_pos = pygame.mouse.get_pos()
-            self.player.handle_input(keys, mouse_pos, self.mouse_pressed,
-                                   self.projectiles, self.screen_rect)
-            self.player.update(dt, self.screen_rect)
-
-        # Update wave manager and spawn enemies
-        new_enemies = self.wave_manager.update(dt, self.enemies)
-        self.enemies.extend(new_enemies)
+            with profiler.scope("player_update"):
+                self.player.handle_input(input_state, self.projectiles, self.screen_rect)
+                self.player.update(dt, self.screen_rect)
+                if self.flow_field is not None:
+                    self.flow_field.resolve(self.player)
+
+            # Re-aim the flow field; this only rebuilds it when the player enters a new cell
+            if self.flow_field is not None:
+                with profiler.scope("pathing"):
+                    self.flow_field.update(self.player.center_x, self.player.center_y)
+
+        # Retire enemies killed last tick, then run the spawn schedule
+        with profiler.scope("wave_update"):
+            self.wave_manager.removed(self._retire_dead_enemies())
+            new_enemies = self.wave_manager.update(dt)
 
         # Update enemies
-        for enemy in self.enemies[:]:
-            if enemy.alive:
-                enemy.update(dt, self.player, self.screen_rect)
-                # Check enemy attacks on player
-                if enemy.attack(self.player):
-                    pass  # Attack handled in enemy.attack()
-            else:
-                self.enemies.remove(enemy)
-                self.coins += enemy.coins_value
-
-        # Update projectiles
-        for projectile in self.projectiles[:]:
-            if projectile.alive:
-                projectile.update(dt, self.screen_rect)
-            else:
-                self.projectiles.remove(projectile)
-
-        # Handle projectile collisions
-        self._handle_projectile_collisions()
+        with profiler.scope("enemy_update"):
+            self._update_enemies(dt, new_enemies)
 
-    def _handle_projectile_collisions(self):
-        """Handle collisions between projectiles and targets"""
-        for projectile in self.projectiles[:]:
-            if not projectile.alive:
-                continue
-
-            if projectile.friendly:
-                # Player projectiles hit enemies
-                for enemy in self.enemies:
-                    if enemy.alive and projectile.collides_with(enemy):
-                        enemy.take_damage(projectile.damage)
-                        projectile.alive = False
-                        break
-            else:
-                # Enemy projectiles hit player
-                if self.player.alive and projectile.collides_with(self.player):
-                    self.player.take_damage(projectile.damage)
-                    projectile.alive = False
+        with profiler.scope("collisions"):
+            # Index everything projectiles and contact attacks can hit
+            self._rebuild_collision_index()
 
-    def render(self):
-        """Render all game entities and UI"""
-        # Clear screen
-        self.screen.fill((32, 32, 64))  # Dark blue background
+            # Check enemy attacks on player
+            self._handle_contact_attacks()
 
-        # Draw arena border
-        border_color = (100, 100, 100)
-        pygame.draw.rect(self.screen, border_color, self.screen_rect, 3)
+        # Update projectiles
+        with profiler.scope("projectile_update"):
+            self.projectiles.update(dt, self.screen_rect, self.flow_field)
 
-        # Render entities
+        # Handle projectile collisions
+        with profiler.scope("collisions"):
+            self._handle_projectile_collisions()
+
+        # Move and fade particles and damage numbers, including the ones this tick's hits just emitted
+        with profiler.scope("particles"):
+            self.particles.update(dt)
+            self.combat_text.update(dt)
+
+    def _retire_dead_enemies(self) -> int:
+        """Drop dead enemies, paying out their coins; returns how many were removed"""
+        if self.enemy_store is not None:
+            dead = self.enemy_store.remove_dead()
+        else:
+            dead = [enemy for enemy in self.enemies if not enemy.alive]
+            if dead:
+                self.enemies[:] = [enemy for enemy in self.enemies if enemy.alive]
+                for enemy in dead:
+                    self.enemy_pool.release(enemy)
+        for enemy in dead:
+            self.coins += enemy.coins_value
+        return len(dead)
+
+    def _update_enemies(self, dt: float, new_enemies: List[Enemy]):
+        """Add freshly spawned enemies and step every enemy, steering only those the AI scheduler picks"""
+        if self.enemy_store is not None:
+            # Proxies were already placed in self.enemies by the store
+            self.ai.update_store(self.enemy_store, dt, self.player, self.screen_rect, self.rng, self.flow_field,
+                                 self.flocking)
+        else:
+            self.enemies.extend(new_enemies)
+            self.ai.update_enemies(self.enemies, dt, self.player, self.screen_rect, self.rng, self.flow_field,
+                                   self.flocking)
+
+    def _rebuild_collision_index(self):
+        """Re-bucket live enemies and the player into the broadphase grid"""
+        # Enemies and the player go in by their whole move this tick, since shots are swept against that
+        store = self.enemy_store
+        if store is not None:
+            # Straight from the arrays; proxies are only read by the narrowphase
+            live = np.flatnonzero(store.alive[:store.count])
+            size = store.template_size[store.template_id[live]]
+            x, prev_x = store.x[live], store.prev_x[live]
+            y, prev_y = store.y[live], store.prev_y[live]
+            self.collision_index.rebuild_boxes(store.proxies, live, np.minimum(x, prev_x), np.minimum(y, prev_y),
+                                               size + np.abs(x - prev_x), size + np.abs(y - prev_y),
+                                               LAYER_HOSTILE)
+        else:
+            self.collision_index.rebuild(self.enemies, LAYER_HOSTILE, swept=True)
+        self.collision_index.clear(LAYER_PLAYER)
         if self.player.alive:
-            self.player.render(self.screen)
+            self.collision_index.insert_entity(self.player, LAYER_PLAYER, swept=True)
 
-        for enemy in self.enemies:
-            if enemy.alive:
-                enemy.render(self.screen)
+    def _handle_contact_attacks(self):
+        """Let enemies touching the player deal contact damage"""
+        if not self.player.alive:
+            return
 
-        for projectile in self.projectiles:
-            if projectile.alive:
-                projectile.render(self.screen)
+        player = self.player
+        for enemy in self.collision_index.query_entity(player, LAYER_HOSTILE):
+            # Cooldown and exact overlap handled in enemy.attack()
+            if enemy.alive and enemy.attack(player):
+                self.combat_text.emit(player.center_x, player.y, enemy.damage, "hurt")
+
+    def _handle_projectile_collisions(self):
+        """Handle collisions between projectiles and targets
+
+        Each projectile's whole move this tick is tested against each target's move (swept
+        boxes), so fast shots cannot tunnel through enemies at low tick rates or after a hitch.
+        """
+        index = self.collision_index
+
+        # Player projectiles hit the first live enemy along their path
+        batch = self.projectiles.friendly
+        owners = []
+        targets = []
+        candidates = batch.candidates(index.occupied_cells(LAYER_HOSTILE), index.cell_size, swept=True)
+        if len(candidates):
+            min_x, min_y, max_x, max_y = (bound[candidates].tolist() for bound in batch.swept_bounds())
+            for i, left, top, right, bottom in zip(candidates.tolist(), min_x, min_y, max_x, max_y):
+                for enemy in index.query_rect(left, top, right - left, bottom - top, LAYER_HOSTILE):
+                    owners.append(i)
+                    targets.append(enemy)
+        for i, enemy in batch.sweep(owners, targets):
+            if batch.alive[i] and enemy.alive:
+                enemy.take_damage(batch.damage[i], self.particles)
+                self.combat_text.emit(enemy.center_x, enemy.y, batch.damage[i])
+                batch.alive[i] = False
+
+        # Enemy projectiles hit player
+        if not self.player.alive:
+            return
+        batch = self.projectiles.hostile
+        candidates = batch.candidates(index.occupied_cells(LAYER_PLAYER), index.cell_size, swept=True).tolist()
+        for i, _ in batch.sweep(candidates, [self.player] * len(candidates)):
+            self.player.take_damage(batch.damage[i])
+            self.combat_text.emit(self.player.center_x, self.player.y, batch.damage[i], "hurt")
+            batch.alive[i] = False
+            if not self.player.alive:
+                break
+
+    def render(self, force_full: bool = False, alpha: float = 1.0):
+        """Render all game entities and UI
+
+        alpha is how far the frame sits between the previous simulation tick and the
+        current one; entities are drawn interpolated by that much. In dirty-rect mode only
+        the changed parts of the screen are redrawn, unless force_full is set (e.g.
+        something else is drawn over the scene this frame).
+        """
+        profiler = self.profiler
+        renderer = self.dirty_renderer
+        overlay = self.shop.visible or not self.player.alive or self.game_paused or force_full
+
+        # A frozen simulation has no motion to interpolate
+        if self.shop.visible or self.game_paused or not self.player.alive:
+            alpha = 1.0
+        self.render_alpha = alpha
+
+        dirty = None
+        with profiler.scope("world_render"):
+            if renderer is not None:
+                bounds = self._render_bounds()
+                hud_state = self.hud.state(self.player, self.wave_manager, self.coins)
+                if not overlay:
+                    dirty = renderer.collect(bounds, self.hud.regions(), hud_state)
+
+            if dirty is None:
+                self._render_world()
+            else:
+                renderer.erase(self.screen, dirty)
+                self._render_entities()
 
         # Render UI
-        self.hud.render(self.screen, self.player, self.wave_manager, self.coins)
-        self.shop.render(self.screen, self.coins)
+        with profiler.scope("hud_render"):
+            if dirty is None or renderer.hud_dirty:
+                self.hud.render(self.screen, self.player, self.wave_manager, self.coins)
+        with profiler.scope("shop_render"):
+            self.shop.render(self.screen, self.coins)
 
         # Game over screen
         if not self.player.alive:
-            self._render_game_over()
+            with profiler.scope("game_over_render"):
+                self._render_game_over()
 
         # Pause indicator
         if self.game_paused:
-            font = pygame.font.Font(None, 48)
-            pause_text = font.render("PAUSED - Press P to continue", True, (255, 255, 255))
+            pause_text = self.text.render("PAUSED - Press P to continue", 48, (255, 255, 255))
             pause_rect = pause_text.get_rect(center=self.screen_rect.center)
             self.screen.blit(pause_text, pause_rect)
 
+        if renderer is not None:
+            renderer.finish(bounds, hud_state, overlay)
+        self.dirty_regions = dirty
+
+    def present(self):
+        """Show the last rendered frame: just its dirty rects when it had any"""
+        if self.dirty_regions is None:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.dirty_regions)
+
+    def _build_background(self) -> pygame.Surface:
+        """The empty arena (background and border) that dirty rects are erased from"""
+        background = pygame.Surface(self.screen_rect.size)
+        background.fill((32, 32, 64))
+        pygame.draw.rect(background, (100, 100, 100), background.get_rect(), 3)
+        if self.flow_field is not None:
+            self.flow_field.render(background)
+        return background
+
+    def _render_world(self):
+        """Render the arena background and every entity"""
+        # Clear screen
+        self.screen.fill((32, 32, 64))  # Dark blue background
+
+        # Draw arena border
+        border_color = (100, 100, 100)
+        pygame.draw.rect(self.screen, border_color, self.screen_rect, 3)
+        if self.flow_field is not None:
+            self.flow_field.render(self.screen)
+
+        self._render_entities()
+
+    def _render_entities(self):
+        """Draw the player, enemies, projectiles, particles and damage numbers"""
+        self.sprite_renderer.render(self.screen, self.player, self.enemies, self.projectiles, self.enemy_store,
+                                    self.render_alpha, self.particles)
+        self.combat_text.render(self.screen, self.render_alpha)
+
+    def _render_bounds(self) -> list:
+        """Screen rects _render_entities() will draw into"""
+        alpha = self.render_alpha
+        bounds = [enemy.render_bounds(alpha) for enemy in self.enemies if enemy.alive]
+        if self.player.alive:
+            bounds.append(self.player.render_bounds(alpha))
+        return (bounds + self.projectiles.render_bounds(alpha) + self.particles.render_bounds(alpha) +
+                self.combat_text.render_bounds(alpha))
+
     def _render_game_over(self):
         """Render game over screen"""
         # Semi-transparent overlay
@@ -238,15 +578,14 @@ class ArenaScene:
         self.screen.blit(overlay, (0, 0))
 
         # Game over text
-        font = pygame.font.Font(None, 72)
-        game_over_text = font.render("GAME OVER", True, (255, 100, 100))
+        text = self.text
+        game_over_text = text.render("GAME OVER", 72, (255, 100, 100))
         game_over_rect = game_over_text.get_rect(center=(self.screen_rect.centerx, self.screen_rect.centery - 50))
         self.screen.blit(game_over_text, game_over_rect)
 
         # Stats
-        stats_font = pygame.font.Font(None, 32)
-        wave_text = stats_font.render(f"Reached Wave: {self.wave_manager.current_wave}", True, (255, 255, 255))
-        coins_text = stats_font.render(f"Coins Collected: {self.coins}", True, (255, 215, 0))
+        wave_text = text.render(f"Reached Wave: {self.wave_manager.current_wave}", 32, (255, 255, 255))
+        coins_text = text.render(f"Coins Collected: {self.coins}", 32, (255, 215, 0))
 
         wave_rect = wave_text.get_rect(center=(self.screen_rect.centerx, self.screen_rect.centery + 20))
         coins_rect = coins_text.get_rect(center=(self.screen_rect.centerx, self.screen_rect.centery + 60))
@@ -255,8 +594,7 @@ class ArenaScene:
         self.screen.blit(coins_text, coins_rect)
 
         # Restart button
-        button_font = pygame.font.Font(None, 48)
-        restart_text = button_font.render("RESTART", True, (255, 255, 255))
+        restart_text = text.render("RESTART", 48, (255, 255, 255))
         restart_bg_color = (60, 120, 180)
         restart_hover_color = (80, 140, 200)
 
@@ -275,7 +613,6 @@ class ArenaScene:
         self.screen.blit(restart_text, restart_rect)
 
         # Instructions
-        instruction_font = pygame.font.Font(None, 24)
-        instruction_text = instruction_font.render("Press ENTER or click RESTART to play again", True, (200, 200, 200))
+        instruction_text = text.render("Press ENTER or click RESTART to play again", 24, (200, 200, 200))
         instruction_rect = instruction_text.get_rect(center=(self.screen_rect.centerx, self.screen_rect.centery + 200))
         self.screen.blit(instruction_text, instruction_rect)
\ No newline at end of file
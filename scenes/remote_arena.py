@@ -0,0 +1,359 @@
+"""
+Split mode: the simulation runs in a worker process and this one only handles input and rendering
+
+The worker steps a headless ArenaScene at the fixed tick rate and publishes every tick
+as a shared-memory snapshot (engine.snapshot). Input, pause/shop state, restarts and
+resizes (and data hot reloads) travel the other way over a pipe.
+"""
+
+import multiprocessing
+import os
+import time
+import numpy as np
+import pygame
+from collections import deque
+from typing import Callable, Optional
+from engine.enemy_store import EnemyStore
+from engine.input import InputProvider, InputState
+from engine.profiler import Profiler
+from engine.snapshot import SharedSnapshots, Snapshot
+from scenes.arena_scene import ArenaScene
+
+# Shared-memory capacity; entities past these counts are simulated but not drawn
+MAX_ENEMIES = 16384
+MAX_PROJECTILES = 8192
+MAX_TEMPLATES = 16
+
+# A worker more than this many ticks behind real time skips ahead instead of catching up
+MAX_BACKLOG_TICKS = 5
+
+def _disable_effects(scene: ArenaScene):
+    """Turn off particles and damage numbers: snapshots carry no hit or death events, so the
+    rendering process could never show them and the worker need not make them"""
+    scene.particles.enabled = False
+    scene.particles.clear()
+    scene.combat_text.enabled = False
+    scene.combat_text.clear()
+
+class _LatestInputProvider(InputProvider):
+    """Replays the last input state the main process sent, every tick until the next one"""
+
+    def __init__(self):
+        self.current = InputState()
+
+    def poll(self, scene) -> InputState:
+        return self.current
+
+
+class _SnapshotWriter:
+    """Copies an ArenaScene's drawable state into a snapshot buffer"""
+
+    def __init__(self):
+        # Object-mode enemies have no template table; (color, size, max_health) -> template id
+        self.template_ids = {}
+
+    def write(self, scene: ArenaScene, snapshot: Snapshot):
+        player = scene.player
+        wave_manager = scene.wave_manager
+        snapshot["player_x"] = player.x
+        snapshot["player_y"] = player.y
+        snapshot["player_prev_x"] = player.prev_x
+        snapshot["player_prev_y"] = player.prev_y
+        snapshot["player_health"] = player.health
+        snapshot["player_max_health"] = player.max_health
+        snapshot["player_mana"] = player.mana
+        snapshot["player_max_mana"] = player.max_mana
+        snapshot["player_alive"] = player.alive
+        snapshot["coins"] = scene.coins
+        snapshot["wave"] = wave_manager.current_wave
+        snapshot["enemies_remaining"] = wave_manager.enemies_remaining
+        snapshot["wave_complete"] = wave_manager.wave_complete
+
+        if scene.enemy_store is not None:
+            self._write_store(scene.enemy_store, snapshot)
+        else:
+            self._write_enemies(scene.enemies, snapshot)
+
+        for batch, columns, count_name in ((scene.projectiles.friendly, snapshot.friendly, "friendly_count"),
+                                           (scene.projectiles.hostile, snapshot.hostile, "hostile_count")):
+            live = np.flatnonzero(batch.alive[:batch.count])[:snapshot.max_projectiles]
+            n = len(live)
+            columns[0, :n] = batch.x[live]
+            columns[1, :n] = batch.y[live]
+            columns[2, :n] = batch.prev_x[live]
+            columns[3, :n] = batch.prev_y[live]
+            snapshot[count_name] = n
+
+    def _write_store(self, store: EnemyStore, snapshot: Snapshot):
+        live = np.flatnonzero(store.alive[:store.count])[:snapshot.max_enemies]
+        n = len(live)
+        enemies = snapshot.enemies
+        enemies[0, :n] = store.x[live]
+        enemies[1, :n] = store.y[live]
+        enemies[2, :n] = store.prev_x[live]
+        enemies[3, :n] = store.prev_y[live]
+        enemies[4, :n] = store.health[live]
+        enemies[5, :n] = store.template_id[live]
+        snapshot["enemy_count"] = n
+
+        templates = min(len(store.template_color), snapshot.max_templates)
+        for t in range(templates):
+            snapshot.templates[t] = (store.template_size[t], store.template_max_health[t],
+                                     *store.template_color[t])
+        snapshot["template_count"] = templates
+
+    def _write_enemies(self, enemies: list, snapshot: Snapshot):
+        template_ids = self.template_ids
+        columns = snapshot.enemies
+        n = 0
+        for enemy in enemies:
+            if not enemy.alive:
+                continue
+            key = (enemy.color, enemy.width, enemy.max_health)
+            template_id = template_ids.get(key)
+            if template_id is None:
+                if len(template_ids) == snapshot.max_templates:
+                    continue
+                template_id = template_ids[key] = len(template_ids)
+            columns[:, n] = (enemy.x, enemy.y, enemy.prev_x, enemy.prev_y, enemy.health, template_id)
+            n += 1
+            if n == snapshot.max_enemies:
+                break
+        snapshot["enemy_count"] = n
+
+        for (color, size, max_health), t in template_ids.items():
+            snapshot.templates[t] = (size, max_health, *color)
+        snapshot["template_count"] = len(template_ids)
+
+
+def _simulation_worker(shm_name: str, shape: tuple, conn, seed: int, width: int, height: int,
+                       tick_rate: float, tuning_data: Optional[dict], setup: Optional[Callable]):
+    """Worker process entry point: simulate in real time until told to quit"""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    pygame.init()
+
+    snapshots = SharedSnapshots.attach(shm_name, *shape)
+    provider = _LatestInputProvider()
+    scene = ArenaScene(pygame.Surface((width, height)), provider, verbose=False, seed=seed,
+                       tuning_data=tuning_data)
+    _disable_effects(scene)
+    if setup is not None:
+        setup(scene)
+    writer = _SnapshotWriter()
+
+    dt = 1.0 / tick_rate
+    input_ack = 0
+    tick = 0
+    next_tick = time.perf_counter()
+    try:
+        while True:
+            # Apply everything the main process sent since the last tick
+            while conn.poll():
+                message = conn.recv()
+                kind = message[0]
+                if kind == "input":
+                    input_ack = message[1]
+                    provider.current = InputState(*message[2])
+                elif kind == "pause":
+                    scene.game_paused = message[1]
+                elif kind == "shop":
+                    scene.shop.visible = message[1]
+                elif kind == "restart":
+                    scene.restart_game()
+                elif kind == "reload":
+                    if scene.data.poll(force=True):
+                        scene.reload_data()
+                        _disable_effects(scene)
+                elif kind == "resize":
+                    scene.resize(pygame.Surface((message[1], message[2])))
+                elif kind == "quit":
+                    return
+
+            scene.update(dt)
+            tick += 1
+
+            snapshot = snapshots.begin_write()
+            writer.write(scene, snapshot)
+            snapshot["tick"] = tick
+            snapshot["time"] = next_tick
+            snapshot["dt"] = dt
+            snapshot["input_ack"] = input_ack
+            snapshots.end_write()
+
+            next_tick += dt
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            elif delay < -MAX_BACKLOG_TICKS * dt:
+                next_tick = time.perf_counter()
+    except (EOFError, BrokenPipeError):
+        pass  # The main process went away
+    finally:
+        snapshots.close()
+
+
+class RemoteArenaScene(ArenaScene):
+    """ArenaScene whose simulation lives in a worker process
+
+    The local player, enemy store, projectiles and wave counters are mirrors refreshed
+    from the newest snapshot on every update(), so the inherited render() draws them
+    unchanged. Call update() once per frame with the frame time (the worker keeps its
+    own fixed tick) and close() when done.
+    """
+
+    def __init__(self, screen: pygame.Surface, input_provider: InputProvider = None, seed: int = None,
+                 tuning_data: dict = None, profiler: Profiler = None, tick_rate: float = 60.0,
+                 setup: Callable = None):
+        super().__init__(screen, input_provider, verbose=False, seed=seed, tuning_data=tuning_data,
+                         profiler=profiler)
+        _disable_effects(self)
+
+        # Mirrors the snapshot is copied into; the store only ever holds drawable state
+        self.enemy_store = EnemyStore()
+        self.enemies = []
+
+        self.snapshots = SharedSnapshots.create(MAX_ENEMIES, MAX_PROJECTILES, MAX_TEMPLATES)
+        self.snapshot = self.snapshots.local_snapshot()
+        self.has_snapshot = False
+
+        # Input sent but not yet reflected in a snapshot: (seq, perf_counter at send)
+        self.input_seq = 0
+        self.last_input = None
+        self.pending_inputs = deque()
+        self.acknowledged = []  # Send times of inputs the latest update() made visible
+
+        context = multiprocessing.get_context("spawn")
+        self.conn, worker_conn = context.Pipe()
+        self.process = context.Process(
+            target=_simulation_worker, name="RetroRumble simulation", daemon=True,
+            args=(self.snapshots.name, self.snapshots.shape, worker_conn, self.seed, self.screen_rect.width,
+                  self.screen_rect.height, tick_rate, self.tuning_data, setup))
+        self.process.start()
+        worker_conn.close()
+
+    def handle_event(self, event):
+        """Handle input locally and forward pause/shop changes to the worker"""
+        paused = self.game_paused
+        shop_visible = self.shop.visible
+        super().handle_event(event)
+        if self.game_paused != paused:
+            self.conn.send(("pause", self.game_paused))
+        if self.shop.visible != shop_visible:
+            self.conn.send(("shop", self.shop.visible))
+
+    def restart_game(self):
+        """Ask the worker to restart; the mirrors catch up with the next snapshot"""
+        self.game_paused = False
+        self.mouse_pressed = False
+        self.conn.send(("restart",))
+
+    def spawn_enemies(self, enemy_type: str, count: int):
+        raise RuntimeError("Split mode simulates in the worker; pass a setup callable instead")
+
+    def resize(self, screen: pygame.Surface):
+        super().resize(screen)
+        self.conn.send(("resize", self.screen_rect.width, self.screen_rect.height))
+
+    def reload_data(self):
+        """Hot-reload here and in the worker, which keeps its own copy of the data"""
+        super().reload_data()
+        _disable_effects(self)
+        self.conn.send(("reload",))
+
+    def set_dirty_rects(self, enabled: bool):
+        """Split mode always redraws the whole screen"""
+        self.dirty_renderer = None
+        self.dirty_regions = None
+
+    def update(self, frame_time: float):
+        """Send this frame's input and pull in the newest snapshot"""
+        if not self.process.is_alive():
+            raise RuntimeError(f"Simulation worker exited with code {self.process.exitcode}")
+
+        if self.player.alive and not self.game_paused and not self.shop.visible:
+            state = self.input_provider.poll(self)
+            values = (state.up, state.down, state.left, state.right, state.mouse_x, state.mouse_y, state.fire)
+            if values != self.last_input:
+                self.input_seq += 1
+                self.last_input = values
+                self.pending_inputs.append((self.input_seq, time.perf_counter()))
+                self.conn.send(("input", self.input_seq, values))
+
+        self.acknowledged = []
+        snapshot = self.snapshots.read(self.snapshot)
+        if snapshot is None:
+            return
+        self.has_snapshot = True
+        self._apply_snapshot(snapshot)
+
+        input_ack = snapshot["input_ack"]
+        while self.pending_inputs and self.pending_inputs[0][0] <= input_ack:
+            self.acknowledged.append(self.pending_inputs.popleft()[1])
+
+    def render(self, force_full: bool = False, alpha: Optional[float] = None):
+        """Render the mirrors, interpolated by how far real time has moved past the snapshot"""
+        if alpha is None:
+            alpha = 1.0
+            if self.has_snapshot:
+                snapshot = self.snapshot
+                alpha = min(max((time.perf_counter() - snapshot["time"]) / snapshot["dt"], 0.0), 1.0)
+        super().render(force_full, alpha)
+
+    def close(self):
+        """Stop the worker and free the shared memory"""
+        try:
+            self.conn.send(("quit",))
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(2.0)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.conn.close()
+        self.snapshots.close()
+
+    def _apply_snapshot(self, snapshot: Snapshot):
+        """Refresh the local mirrors from a snapshot"""
+        player = self.player
+        player.x = snapshot["player_x"]
+        player.y = snapshot["player_y"]
+        player.prev_x = snapshot["player_prev_x"]
+        player.prev_y = snapshot["player_prev_y"]
+        player.health = snapshot["player_health"]
+        player.max_health = snapshot["player_max_health"]
+        player.mana = snapshot["player_mana"]
+        player.max_mana = snapshot["player_max_mana"]
+        player.alive = bool(snapshot["player_alive"])
+
+        self.coins = int(snapshot["coins"])
+        wave_manager = self.wave_manager
+        wave_manager.current_wave = int(snapshot["wave"])
+        wave_manager.enemies_remaining = int(snapshot["enemies_remaining"])
+        wave_manager.wave_complete = bool(snapshot["wave_complete"])
+
+        store = self.enemy_store
+        n = int(snapshot["enemy_count"])
+        while store.capacity < n:
+            store._grow()
+        store.x[:n], store.y[:n], store.prev_x[:n], store.prev_y[:n], store.health[:n] = snapshot.enemies[:5, :n]
+        store.template_id[:n] = snapshot.enemies[5, :n]
+        store.alive[:n] = True
+        store.alive[n:store.count] = False
+        store.count = n
+
+        templates = snapshot.templates[:int(snapshot["template_count"])]
+        store.template_size = templates[:, 0].copy()
+        store.template_max_health = templates[:, 1].copy()
+        store.template_color = [tuple(color) for color in templates[:, 2:].astype(np.int64).tolist()]
+        store.template_sprite = [None] * len(templates)  # Sprite names are not in the snapshot; boxes it is
+
+        for batch, columns, count_name in ((self.projectiles.friendly, snapshot.friendly, "friendly_count"),
+                                           (self.projectiles.hostile, snapshot.hostile, "hostile_count")):
+            n = int(snapshot[count_name])
+            while batch.capacity < n:
+                batch._grow()
+            batch.x[:n], batch.y[:n], batch.prev_x[:n], batch.prev_y[:n] = columns[:, :n]
+            batch.alive[:n] = True
+            batch.alive[n:batch.count] = False
+            batch.count = n
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+RetroRumble - Balance sweeps
+Plays many headless bot games over a grid or random sample of tuning values, across all cores
+
+    python sweep.py --param player.move_speed=250,300,350 --param slime.speed=60,80,100 --seeds 4
+    python sweep.py --search random --samples 2000 --param player.mana_regen=10:30 --param slime.health=30:80
+
+A parameter is section.field: a tuning.json section (player, game, ...) or an enemy template
+name (slime) from data/enemies. Results stream into a directory holding one raw float64 file
+per column plus columns.json; read them back with load_results().
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, List, Tuple
+import numpy as np
+from engine.data_registry import DataRegistry
+
+# Per-run result columns, after the run index, seed and one column per swept parameter
+RESULT_COLUMNS = ("wave", "waves_cleared", "coins", "time_alive", "damage_taken", "survived", "steps")
+
+# Set once per worker process by _init_worker and reused for every run it plays
+_worker = {}
+
+def parse_param(spec: str) -> Tuple[str, object]:
+    """Parse section.field=a,b,c into (key, [values]) and section.field=lo:hi into (key, (lo, hi))"""
+    key, _, values = spec.partition("=")
+    if "." not in key or not values:
+        raise ValueError(f"Expected section.field=values, got {spec!r}")
+
+    def number(text: str):
+        try:
+            return int(text)
+        except ValueError:
+            return float(text)
+
+    if ":" in values:
+        low, high = values.split(":", 1)
+        return key, (number(low), number(high))
+    return key, [number(value) for value in values.split(",")]
+
+def build_configs(params: List[Tuple[str, object]], search: str, samples: int,
+                  rng: random.Random) -> List[Dict[str, float]]:
+    """Every grid combination, or `samples` uniform draws from the ranges"""
+    if search == "random":
+        configs = []
+        for _ in range(samples):
+            config = {}
+            for key, values in params:
+                if isinstance(values, tuple):
+                    low, high = values
+                    both_ints = isinstance(low, int) and isinstance(high, int)
+                    config[key] = rng.randint(low, high) if both_ints else rng.uniform(low, high)
+                else:
+                    config[key] = rng.choice(values)
+            configs.append(config)
+        return configs
+
+    configs = [{}]
+    for key, values in params:
+        if isinstance(values, tuple):
+            raise ValueError(f"{key}: ranges need --search random; list grid values as a,b,c")
+        configs = [dict(config, **{key: value}) for config in configs for value in values]
+    return configs
+
+def _init_worker(tuning: dict, dt: float, max_steps: int):
+    """Pool initializer: import and initialize pygame once per worker, not once per run"""
+    from headless import init_headless_pygame
+    init_headless_pygame()
+    _worker.update(tuning=tuning, templates=DataRegistry().enemies, dt=dt, max_steps=max_steps)
+
+def _play(run: int, seed: int, config: Dict[str, float]) -> tuple:
+    """One bot game with config applied; returns a row of result columns"""
+    from headless import HeadlessRunner
+
+    tuning = {section: dict(values) for section, values in _worker["tuning"].items()}
+    enemy_overrides = {}
+    for key, value in config.items():
+        section, field = key.split(".", 1)
+        if section in _worker["templates"]:
+            enemy_overrides.setdefault(section, {})[field] = value
+        else:
+            tuning.setdefault(section, {})[field] = value
+
+    runner = HeadlessRunner(dt=_worker["dt"], seed=seed, tuning_data=tuning)
+    scene = runner.scene
+    if enemy_overrides:
+        # The scene has already queued wave 1 from the stock templates; start it again with the
+        # overrides in place so endless mode scales them from the first wave
+        templates = {name: dict(template, **enemy_overrides.get(name, {}))
+                     for name, template in _worker["templates"].items()}
+        scene.wave_manager.set_enemy_templates(templates)
+        scene.wave_manager.load_wave(1)
+
+    report = runner.run(max_steps=_worker["max_steps"])
+    player = scene.player
+    return (run, seed, *config.values(), report["best_wave"], report["waves_cleared"], report["coins"],
+            report["sim_seconds"], player.max_health - player.health, player.alive, report["steps"])
+
+def _play_chunk(jobs: List[tuple]) -> List[tuple]:
+    return [_play(*job) for job in jobs]
+
+
+class ColumnWriter:
+    """Appends rows to one raw little-endian float64 file per column
+
+    columns.json (names and row count) is rewritten after every append, so a sweep that
+    is interrupted still leaves readable results.
+    """
+
+    def __init__(self, out_dir: str, columns: List[str]):
+        os.makedirs(out_dir, exist_ok=True)
+        self.out_dir = out_dir
+        self.columns = columns
+        self.rows = 0
+        self.files = [open(os.path.join(out_dir, f"{column}.f64"), "wb") for column in columns]
+        self._write_manifest()
+
+    def append(self, rows: List[tuple]):
+        table = np.asarray(rows, dtype="<f8").reshape(len(rows), len(self.columns))
+        for column, f in enumerate(self.files):
+            f.write(table[:, column].tobytes())
+            f.flush()
+        self.rows += len(rows)
+        self._write_manifest()
+
+    def close(self):
+        for f in self.files:
+            f.close()
+
+    def _write_manifest(self):
+        with open(os.path.join(self.out_dir, "columns.json"), "w") as f:
+            json.dump({"columns": self.columns, "dtype": "<f8", "rows": self.rows}, f, indent=2)
+
+def load_results(out_dir: str) -> Dict[str, np.ndarray]:
+    """Column name -> array, for a directory written by ColumnWriter"""
+    with open(os.path.join(out_dir, "columns.json"), "r") as f:
+        manifest = json.load(f)
+    rows = manifest["rows"]
+    return {column: np.fromfile(os.path.join(out_dir, f"{column}.f64"), dtype=manifest["dtype"], count=rows)
+            for column in manifest["columns"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep tuning values over many parallel headless bot games")
+    parser.add_argument("--param", action="append", default=[], metavar="SECTION.FIELD=VALUES",
+                        help="a,b,c for grid values or lo:hi for a random range (repeatable)")
+    parser.add_argument("--search", choices=["grid", "random"], default="grid", help="how to pick configurations")
+    parser.add_argument("--samples", type=int, default=100, help="configurations to draw with --search random")
+    parser.add_argument("--seeds", type=int, default=1, help="games per configuration, each with its own seed")
+    parser.add_argument("--seed", type=int, default=0, help="base seed for run seeds and random search")
+    parser.add_argument("--max-seconds", type=float, default=120.0, help="simulated seconds before a game is cut off")
+    parser.add_argument("--tick-rate", type=float, default=60.0, help="simulation ticks per simulated second")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: one per core)")
+    parser.add_argument("--output", default="sweep_results", help="directory for the columnar results")
+    args = parser.parse_args()
+
+    try:
+        params = [parse_param(spec) for spec in args.param]
+        configs = build_configs(params, args.search, args.samples, random.Random(args.seed))
+    except ValueError as error:
+        parser.error(str(error))
+
+    # Run seeds depend only on the run index, so results do not depend on scheduling
+    jobs = [(run, args.seed * 1_000_003 + run, config)
+            for run, config in enumerate(config for config in configs for _ in range(args.seeds))]
+
+    workers = args.workers or os.cpu_count() or 1
+    chunk_size = max(1, min(32, len(jobs) // (workers * 8)))
+    chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+
+    dt = 1.0 / args.tick_rate
+    tuning = DataRegistry().tuning
+    writer = ColumnWriter(args.output, ["run", "seed"] + [key for key, _ in params] + list(RESULT_COLUMNS))
+    print(f"OK: {len(jobs)} runs ({len(configs)} configurations x {args.seeds} seeds) on {workers} workers")
+
+    start = time.perf_counter()
+    report_every = max(1, len(jobs) // 20)
+    next_report = report_every
+    try:
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(tuning, dt, int(args.max_seconds / dt))) as pool:
+            futures = [pool.submit(_play_chunk, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                writer.append(future.result())
+                if writer.rows >= next_report or writer.rows == len(jobs):
+                    elapsed = time.perf_counter() - start
+                    print(f"OK: {writer.rows}/{len(jobs)} runs in {elapsed:.1f}s "
+                          f"({writer.rows / elapsed:.1f} runs/sec)")
+                    next_report += report_every
+    finally:
+        writer.close()
+
+    results = load_results(args.output)
+    print(f"OK: results in {args.output}/ - mean wave {results['wave'].mean():.2f}, "
+          f"mean coins {results['coins'].mean():.0f}, survived {int(results['survived'].sum())}/{writer.rows}")
+
+if __name__ == "__main__":
+    main()